@@ -11,24 +11,36 @@ Key Features:
 - Calculates price premiums against official exchange rates
 - Standardized output format for time-series storage
 
+Usage (from the crypto_data_collectors directory):
+    python -m scrapers.binance_p2p
+
 Author: Clement MUGISHA
 License: MIT
 """
 
-import json
-import os
-import sys
-import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
+import orjson
 import requests
 
-# Add project root to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.country_profiles import get_profile_by_country_code, list_supported_countries
 from utils.csv_data_manager import CSVDataManager
+from utils.http_session import create_session, retry_after
+from utils.rate_limiter import TokenBucket
+
+# Binance answers throttling with 429, or 418 for a temporary IP ban
+THROTTLE_STATUSES = (418, 429)
+# Extra attempts at a page after the session's own retries still end throttled
+THROTTLE_RETRIES = 2
+# Back-off (seconds) when a throttling response carries no usable Retry-After header
+THROTTLE_DEFAULT_WAIT = 5.0
+
+
+class BinanceThrottledError(requests.HTTPError):
+    """A page stayed rate limited after every retry."""
 
 
 class BinanceP2PScraper:
@@ -36,16 +48,48 @@ class BinanceP2PScraper:
     Scraper for Binance P2P market data using their public API.
     """
 
-    def __init__(self):
+    def __init__(self, session: requests.Session = None, rate_limiter: TokenBucket = None):
+        """
+        Initialize the scraper.
+
+        Parameters:
+        -----------
+        session : requests.Session, optional
+            Shared pooled session (see utils.http_session); a new one is
+            created when omitted
+        rate_limiter : TokenBucket, optional
+            Request budget for p2p.binance.com; defaults to 10 req/s with
+            bursts of 20
+        """
         self.base_url = "https://p2p.binance.com/bapi/c2c/v2/friendly/c2c/adv/search"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-        )
+        # Keep-alive pool shared with the other collectors; transient errors and
+        # throttling are retried with backoff there. The final throttled response
+        # is handed back so get_ads can pause the bucket.
+        self.session = session or create_session()
+        # Sent per request so a shared session carries no Binance-specific headers
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+        # Page size and the most pages fetched per trade type, and how many page
+        # requests run at once across a batch of countries (keep page_workers
+        # within pool_maxsize)
+        self.rows_per_page = 20
+        self.max_pages = 5
+        self.page_workers = 10
+        # Raw ads file format for the streaming writer: 'csv' or 'ndjson'
+        self.raw_format = "csv"
+
+        # Paces every request across page/country workers; bursts are allowed
+        # up to capacity and throttling responses pause the whole bucket
+        self._bucket = rate_limiter or TokenBucket(rate=10, capacity=20)
+
+        # Search filters that never change between requests, serialized once as
+        # the opening of the JSON object: b'{"payTypes":[],...,"publisherType":null,'
+        payload_static = {"payTypes": [], "countries": [], "publisherType": None}
+        self._payload_prefix = orjson.dumps(payload_static)[:-1] + b","
         self.csv_manager = CSVDataManager()
 
     def get_ads(
@@ -78,15 +122,17 @@ class BinanceP2PScraper:
         Returns:
         --------
         dict
-            JSON response from Binance API
+            JSON response from Binance API ({} on a non-throttling error)
+
+        Raises:
+        -------
+        BinanceThrottledError
+            If the page is still rate limited after THROTTLE_RETRIES back-offs
         """
 
         payload = {
             "page": page,
             "rows": rows,
-            "payTypes": [],
-            "countries": [],
-            "publisherType": None,
             "asset": asset,
             "fiat": fiat,
             "tradeType": trade_type,
@@ -96,15 +142,48 @@ class BinanceP2PScraper:
         if timestamp:
             payload["timestamp"] = timestamp
 
+        # Splice the per-request fields onto the pre-encoded static prefix
+        # (dropping their leading "{"); self.headers sets the JSON Content-Type
+        body = self._payload_prefix + orjson.dumps(payload)[1:]
+
         try:
-            response = self.session.post(self.base_url, json=payload, timeout=10)
+            for attempt in range(THROTTLE_RETRIES + 1):
+                self._bucket.acquire()
+                response = self.session.post(
+                    self.base_url, data=body, headers=self.headers, timeout=10
+                )
+                if response.status_code not in THROTTLE_STATUSES:
+                    break
+
+                # Rate limited (418 = temporary IP ban): back off every worker,
+                # then retry the page instead of dropping it
+                backoff = retry_after(response, THROTTLE_DEFAULT_WAIT)
+                self._bucket.pause(backoff)
+                if attempt == THROTTLE_RETRIES:
+                    raise BinanceThrottledError(
+                        f"Binance P2P still throttled (HTTP {response.status_code}) "
+                        f"after {THROTTLE_RETRIES} retries: {fiat} {trade_type} page {page}",
+                        response=response,
+                    )
+                print(
+                    f"⚠️  Binance P2P rate limited (HTTP {response.status_code}), backing off {backoff:.0f}s"
+                )
+
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
+        except BinanceThrottledError:
+            # A page we could not fetch must fail the country, not truncate it
+            raise
         except requests.exceptions.RequestException as e:
             print(f"Error fetching Binance P2P data: {e}")
             return {}
+        except orjson.JSONDecodeError as e:
+            print(f"Error decoding Binance P2P response: {e}")
+            return {}
 
-    def standardize_ad(self, ad_data: Dict, country_code: str, trade_type: str) -> Dict[str, Any]:
+    def standardize_ad(
+        self, ad_data: Dict, country_code: str, trade_type: str, timestamp: str = None
+    ) -> Dict[str, Any]:
         """
         Convert Binance API response to standardized format.
 
@@ -116,6 +195,8 @@ class BinanceP2PScraper:
             ISO country code for location tagging
         trade_type : str
             BUY or SELL
+        timestamp : str, optional
+            Collection timestamp shared by the whole batch. Defaults to now (UTC).
 
         Returns:
         --------
@@ -123,30 +204,117 @@ class BinanceP2PScraper:
             Standardized advertisement data
         """
 
-        adv = ad_data.get("adv", {})
-        advertiser = ad_data.get("advertiser", {})
+        adv = ad_data.get("adv") or {}
+        advertiser = ad_data.get("advertiser") or {}
+        # Bound lookups: this runs once per ad across every page and country
+        adv_get = adv.get
+        advertiser_get = advertiser.get
+
+        if timestamp is None:
+            timestamp = datetime.utcnow().isoformat() + "Z"
 
+        # `or 0` also covers fields Binance sends as null or ""
         return {
             "platform": "binance",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "asset": adv.get("asset", ""),
-            "fiat": adv.get("fiatUnit", ""),
-            "price": float(adv.get("price", 0)),
-            "min_amount": float(adv.get("minSingleTransAmount", 0)),
-            "max_amount": float(adv.get("dynamicMaxSingleTransAmount", 0)),
-            "available_amount": float(adv.get("surplusAmount", 0)),
+            "timestamp": timestamp,
+            "asset": adv_get("asset", ""),
+            "fiat": adv_get("fiatUnit", ""),
+            "price": float(adv_get("price") or 0),
+            "min_amount": float(adv_get("minSingleTransAmount") or 0),
+            "max_amount": float(adv_get("dynamicMaxSingleTransAmount") or 0),
+            "available_amount": float(adv_get("surplusAmount") or 0),
             "trade_type": trade_type,
             "country_code": country_code,
-            "payment_methods": [
-                method.get("tradeMethodName", "") for method in adv.get("tradeMethods", [])
-            ],
-            "advertiser_name": advertiser.get("nickName", ""),
-            "completion_rate": float(advertiser.get("monthFinishRate", 0)),
-            "order_count": int(advertiser.get("monthOrderCount", 0)),
-            "ad_id": adv.get("advNo", ""),
+            # Stored pre-encoded as the JSON list string the CSV schema uses
+            "payment_methods": orjson.dumps(
+                [method.get("tradeMethodName", "") for method in adv_get("tradeMethods") or ()]
+            ).decode(),
+            "advertiser_name": advertiser_get("nickName", ""),
+            "completion_rate": float(advertiser_get("monthFinishRate") or 0),
+            "order_count": int(advertiser_get("monthOrderCount") or 0),
+            "ad_id": adv_get("advNo", ""),
             "premium_pct": None,  # Will be calculated later with exchange rates
         }
 
+    def iter_country_data(self, country_code: str, asset: str = "USDT") -> Iterator[Dict[str, Any]]:
+        """
+        Yield standardized P2P advertisements for a country, page by page.
+
+        BUY and SELL listings are paged in parallel. Each page is standardized
+        and yielded as soon as it arrives, so callers can write ads out
+        without holding the whole listing in memory. The next page of a trade
+        type is only requested once the previous one came back full.
+
+        Parameters:
+        -----------
+        country_code : str
+            ISO country code (e.g., 'SD', 'VE')
+        asset : str
+            Cryptocurrency asset to collect
+
+        Yields:
+        -------
+        dict
+            Standardized advertisement dictionaries, in page arrival order
+        """
+        profile = get_profile_by_country_code(country_code)
+
+        print(f"Collecting BUY/SELL ads for {profile['name']} ({profile['fiat']})...")
+        with ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            pending = self._submit_first_pages(executor, profile["fiat"], asset)
+            yield from self._iter_pages(executor, pending, profile["fiat"], asset, country_code)
+
+    def _submit_page(
+        self, executor: ThreadPoolExecutor, fiat: str, asset: str, trade_type: str, page: int
+    ) -> Future:
+        """Dispatch one page request for a fiat currency."""
+        return executor.submit(
+            self.get_ads,
+            asset=asset,
+            fiat=fiat,
+            trade_type=trade_type,
+            page=page,
+            rows=self.rows_per_page,
+        )
+
+    def _submit_first_pages(
+        self, executor: ThreadPoolExecutor, fiat: str, asset: str
+    ) -> Dict[Future, Tuple[str, int]]:
+        """Dispatch page 1 of both trade types; later pages follow as pages come back full."""
+        return {
+            self._submit_page(executor, fiat, asset, trade_type, 1): (trade_type, 1)
+            for trade_type in ["BUY", "SELL"]
+        }
+
+    def _iter_pages(
+        self,
+        executor: ThreadPoolExecutor,
+        pending: Dict[Future, Tuple[str, int]],
+        fiat: str,
+        asset: str,
+        country_code: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Standardize pages as they complete, requesting each trade type's next
+        page only while the previous one was full.
+        """
+        # One collection timestamp for every ad in this batch
+        batch_ts = datetime.utcnow().isoformat() + "Z"
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                trade_type, page = pending.pop(future)
+                ads = future.result().get("data") or []
+
+                # A short page is the last one; stop before asking for more
+                if len(ads) >= self.rows_per_page and page < self.max_pages:
+                    next_future = self._submit_page(executor, fiat, asset, trade_type, page + 1)
+                    pending[next_future] = (trade_type, page + 1)
+
+                for ad in ads:
+                    yield self.standardize_ad(ad, country_code, trade_type, batch_ts)
+
     def collect_country_data(
         self, country_code: str, asset: str = "USDT", save_to_csv: bool = True
     ) -> List[Dict[str, Any]]:
@@ -170,75 +338,215 @@ class BinanceP2PScraper:
 
         try:
             profile = get_profile_by_country_code(country_code)
-            fiat = profile["fiat"]
-
-            all_ads = []
-            buy_count = 0
-            sell_count = 0
-
-            # Generate collection ID for this run
-            collection_id = self.csv_manager.generate_collection_id()
-
-            # Collect both BUY and SELL advertisements
-            for trade_type in ["BUY", "SELL"]:
-                print(f"Collecting {trade_type} ads for {profile['name']} ({fiat})...")
-
-                page = 1
-                while page <= 5:  # Limit to first 5 pages (100 ads max per type)
-                    response = self.get_ads(
-                        asset=asset, fiat=fiat, trade_type=trade_type, page=page
-                    )
-
-                    if not response or not response.get("data"):
-                        break
-
-                    ads = response["data"]
-                    if not ads:
-                        break
 
-                    # Standardize each advertisement
-                    for ad in ads:
-                        standardized = self.standardize_ad(ad, country_code, trade_type)
-                        all_ads.append(standardized)
-
-                        if trade_type == "BUY":
-                            buy_count += 1
-                        else:
-                            sell_count += 1
-
-                    page += 1
-                    time.sleep(0.5)  # Be respectful to the API
+            all_ads = list(self.iter_country_data(country_code, asset))
+            buy_count = sum(1 for ad in all_ads if ad["trade_type"] == "BUY")
+            sell_count = len(all_ads) - buy_count
 
             # Save to CSV if requested
             if save_to_csv and all_ads:
-                self.csv_manager.save_raw_ads(all_ads, "binance", country_code, collection_id)
-
-                # Log the collection run
-                self.csv_manager.log_collection_run(
-                    platform="binance",
-                    country_code=country_code,
-                    country_name=profile["name"],
-                    fiat_currency=fiat,
-                    ads_collected=len(all_ads),
-                    buy_ads=buy_count,
-                    sell_ads=sell_count,
-                    status="success",
-                    collection_id=collection_id,
+                collection_id = self.csv_manager.generate_collection_id()
+                self.csv_manager.save_raw_ads(
+                    all_ads, "binance", country_code, collection_id, fmt=self.raw_format
                 )
+                self._log_country_run(profile, buy_count, sell_count, collection_id)
 
             print(
                 f"✅ Collected {len(all_ads)} ads for {profile['name']} (Buy: {buy_count}, Sell: {sell_count})"
             )
             return all_ads
 
-        except ValueError as e:
+        except (ValueError, BinanceThrottledError) as e:
             print(f"❌ Error: {e}")
             return []
 
-    def collect_all_countries(self) -> List[Dict[str, Any]]:
+    def stream_country_data(
+        self, country_code: str, asset: str = "USDT", date_str: str = None
+    ) -> int:
+        """
+        Collect a country's advertisements straight to CSV without keeping them.
+
+        Ads are written as pages arrive (see `CSVDataManager.save_raw_ads_stream`),
+        so memory use does not grow with the number of ads collected.
+
+        Parameters:
+        -----------
+        country_code : str
+            ISO country code (e.g., 'SD', 'VE')
+        asset : str
+            Cryptocurrency asset to collect
+        date_str : str, optional
+            Collection date (YYYY-MM-DD) naming the output folder. Defaults to today.
+
+        Returns:
+        --------
+        int
+            Number of advertisements written
+
+        Raises:
+        -------
+        ValueError
+            If the country code has no profile
+        requests.RequestException
+            If the country's pages cannot be fetched; the failed run is logged
+            and no partial CSV is kept
+        """
+        profile = get_profile_by_country_code(country_code)
+        with ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            first_pages = self._submit_first_pages(executor, profile["fiat"], asset)
+            return self._save_pages(executor, country_code, profile, first_pages, asset, date_str)
+
+    def stream_countries_batch(
+        self,
+        country_codes: List[str],
+        asset: str = "USDT",
+        date_str: str = None,
+        on_saved: Callable[[str, int], None] = None,
+    ) -> Dict[str, int]:
+        """
+        Collect several countries in one batch, streaming each to CSV.
+
+        Every country's first pages are dispatched up front on a single pool,
+        so requests for later countries are in flight while earlier countries
+        are being written; further pages follow while pages come back full.
+        Countries are written in the order given. A country whose requests
+        fail (e.g. persistent throttling) is logged with an error status and
+        counted as 0 without stopping the countries after it.
+
+        Parameters:
+        -----------
+        country_codes : list
+            ISO country codes to collect
+        asset : str
+            Cryptocurrency asset to collect
+        date_str : str, optional
+            Collection date (YYYY-MM-DD) naming the output folder, so a batch
+            running past midnight stays in one folder. Defaults to today.
+        on_saved : callable, optional
+            Called as on_saved(country_code, n_ads) as soon as each country is
+            written, so callers can record progress before the batch finishes
+            (or fails part-way)
+
+        Returns:
+        --------
+        dict
+            Country code -> number of advertisements written
+        """
+        counts = {}
+
+        def record(country_code: str, n_ads: int):
+            counts[country_code] = n_ads
+            if on_saved:
+                on_saved(country_code, n_ads)
+
+        with ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            pending = []
+            for country_code in country_codes:
+                try:
+                    profile = get_profile_by_country_code(country_code)
+                except ValueError as e:
+                    print(f"❌ Error: {e}")
+                    record(country_code, 0)
+                    continue
+
+                print(f"Collecting BUY/SELL ads for {profile['name']} ({profile['fiat']})...")
+                first_pages = self._submit_first_pages(executor, profile["fiat"], asset)
+                pending.append((country_code, profile, first_pages))
+
+            for country_code, profile, first_pages in pending:
+                try:
+                    n_ads = self._save_pages(
+                        executor, country_code, profile, first_pages, asset, date_str
+                    )
+                except requests.RequestException:
+                    # Already reported and logged; the rest of the batch carries on
+                    n_ads = 0
+                record(country_code, n_ads)
+
+        return counts
+
+    def _save_pages(
+        self,
+        executor: ThreadPoolExecutor,
+        country_code: str,
+        profile: Dict[str, Any],
+        first_pages: Dict[Future, Tuple[str, int]],
+        asset: str,
+        date_str: str = None,
+    ) -> int:
+        """Stream a country's pages to CSV as they arrive and log the run, failed or not."""
+        trade_counts = {"BUY": 0, "SELL": 0}
+
+        def counted(ads):
+            for ad in ads:
+                trade_counts[ad["trade_type"]] += 1
+                yield ad
+
+        collection_id = self.csv_manager.generate_collection_id()
+        try:
+            total = self.csv_manager.save_raw_ads_stream(
+                counted(
+                    self._iter_pages(executor, first_pages, profile["fiat"], asset, country_code)
+                ),
+                "binance",
+                country_code,
+                collection_id,
+                date_str=date_str,
+                fmt=self.raw_format,
+            )
+        except requests.RequestException as e:
+            # The partial CSV is discarded by the writer; record the failed run
+            print(f"❌ Error collecting {profile['name']}: {e}")
+            self.csv_manager.log_collection_run(
+                platform="binance",
+                country_code=country_code,
+                country_name=profile["name"],
+                fiat_currency=profile["fiat"],
+                ads_collected=0,
+                buy_ads=0,
+                sell_ads=0,
+                status="error",
+                error_message=str(e),
+                collection_id=collection_id,
+            )
+            raise
+
+        if total:
+            self._log_country_run(profile, trade_counts["BUY"], trade_counts["SELL"], collection_id)
+
+        print(
+            f"✅ Collected {total} ads for {profile['name']} (Buy: {trade_counts['BUY']}, Sell: {trade_counts['SELL']})"
+        )
+        return total
+
+    def _log_country_run(
+        self, profile: Dict[str, Any], buy_count: int, sell_count: int, collection_id: str
+    ):
+        """Record a successful country collection in the collection log."""
+        self.csv_manager.log_collection_run(
+            platform="binance",
+            country_code=profile["country_code"],
+            country_name=profile["name"],
+            fiat_currency=profile["fiat"],
+            ads_collected=buy_count + sell_count,
+            buy_ads=buy_count,
+            sell_ads=sell_count,
+            status="success",
+            collection_id=collection_id,
+        )
+
+    def collect_all_countries(self, max_workers: int = 3) -> List[Dict[str, Any]]:
         """
         Collect P2P data for all supported countries.
 
+        Countries are fetched concurrently on a bounded thread pool since the
+        work is dominated by waiting on HTTP round-trips.
+
+        Parameters:
+        -----------
+        max_workers : int
+            Maximum number of countries collected at the same time
+
         Returns:
         --------
         list
@@ -246,20 +554,30 @@ class BinanceP2PScraper:
         """
 
         countries = list_supported_countries()
-        all_data = []
+        country_codes = [country["country_code"] for country in countries]
+        collect = partial(self.collect_country_data, save_to_csv=False)
+        ads_by_country = {}
 
         print(f"🚀 Starting data collection for {len(countries)} countries...")
 
-        for country in countries:
-            country_code = country["country_code"]
-            country_name = country["name"]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() keeps results in config order regardless of completion order
+            for country_code, ads in zip(country_codes, executor.map(collect, country_codes)):
+                ads_by_country[country_code] = ads
 
-            print(f"\n📊 Processing {country_name} ({country_code})...")
-            ads = self.collect_country_data(country_code)
-            all_data.extend(ads)
+        all_data = [ad for ads in ads_by_country.values() for ad in ads]
 
-            # Brief pause between countries
-            time.sleep(1)
+        # Write every country's ads in one batch once collection is done
+        if all_data:
+            collection_id = self.csv_manager.generate_collection_id()
+            self.csv_manager.save_raw_ads_batch(all_data, "binance", collection_id)
+
+            for country in countries:
+                ads = ads_by_country[country["country_code"]]
+                if not ads:
+                    continue
+                buy_count = sum(1 for ad in ads if ad["trade_type"] == "BUY")
+                self._log_country_run(country, buy_count, len(ads) - buy_count, collection_id)
 
         print(f"\n🎉 Collection complete! Total ads collected: {len(all_data)}")
         return all_data
@@ -312,8 +630,6 @@ class BinanceP2PScraper:
                 else:
                     print("    ❌ No data returned")
 
-                time.sleep(1)  # Rate limiting
-
             print("⚠️  Binance P2P API appears to only provide current data")
             print("🔄 For historical analysis, we'll need web scraping or archived data")
             return False
@@ -335,7 +651,7 @@ def main():
 
     if sudan_ads:
         print("\n📋 Sample advertisement:")
-        print(json.dumps(sudan_ads[0], indent=2))
+        print(orjson.dumps(sudan_ads[0], option=orjson.OPT_INDENT_2).decode())
 
     # Test historical data capabilities
     print("\n🕐 Testing historical data capabilities...")
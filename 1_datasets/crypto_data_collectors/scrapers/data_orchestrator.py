@@ -18,25 +18,43 @@ Features:
 - Data quality validation
 - Progress tracking and resumption
 
+Usage (from the crypto_data_collectors directory):
+    python -m scrapers.data_orchestrator
+
 Author: Clement MUGISHA
 License: MIT
 """
 
+import logging
 import os
-import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
-# Add project root to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import orjson
+import requests
 
 from scrapers.binance_p2p import BinanceP2PScraper
 from scrapers.platforms.coingecko_free import CoinGeckoScraper
 from scrapers.platforms.cryptocompare_free import CryptoCompareScraper
 from utils.country_profiles import get_profile_by_country_code, list_supported_countries
 from utils.csv_data_manager import CSVDataManager
-from utils.exchange_rates import ExchangeRateCollector
+from utils.exchange_rates import CachedExchangeRateCollector
+from utils.http_session import create_session, warm_up
+from utils.logging_utils import queued_logging
+from utils.progress_tracker import CollectionProgress
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Failures a single source/country may hit (network errors after retries, bad
+# responses, unknown country codes); anything else is a bug and should surface
+COLLECTION_ERRORS = (requests.RequestException, ValueError)
+
+# Market context (reference prices, exchange lists) changes slowly; a result
+# from the same day younger than this is reused instead of re-querying the API
+CONTEXT_CACHE_TTL = 6 * 3600
 
 # Removed non-working scrapers:
 # from scrapers.platforms.okx_p2p import OKXPPScraper
@@ -58,11 +76,24 @@ class DataCollectionOrchestrator:
             API key for exchange rate services
         """
         self.csv_manager = CSVDataManager()
-        self.exchange_collector = ExchangeRateCollector(exchange_api_key)
+
+        # One pooled keep-alive session shared by every scraper and collector
+        self.http = create_session()
+        # Rates are cached on disk, so repeated runs and crisis periods skip the network
+        self.exchange_collector = CachedExchangeRateCollector(exchange_api_key, session=self.http)
+
+        # Per-platform request budgets (token buckets) sized to each API's limits.
+        # Scrapers take a token per HTTP request, so there are no fixed sleeps
+        # between countries or platforms.
+        self._limiters = {
+            "binance": TokenBucket(rate=10, capacity=20),
+            "coingecko": TokenBucket(rate=50 / 60, capacity=10),
+            "cryptocompare": TokenBucket(rate=30, capacity=30),
+        }
 
         # Initialize working platform scrapers only
         self.scrapers = {
-            "binance": BinanceP2PScraper(),
+            "binance": BinanceP2PScraper(session=self.http, rate_limiter=self._limiters["binance"]),
             # Removed non-working scrapers after testing:
             # "okx": OKXPPScraper(),  # Target currencies not supported
             # "paxful": PaxfulHistoricalScraper(),  # No accessible archived data
@@ -70,15 +101,43 @@ class DataCollectionOrchestrator:
 
         # Initialize free API scrapers for market context
         self.context_scrapers = {
-            "coingecko": CoinGeckoScraper(),
-            "cryptocompare": CryptoCompareScraper(),
+            "coingecko": CoinGeckoScraper(
+                session=self.http, rate_limiter=self._limiters["coingecko"]
+            ),
+            "cryptocompare": CryptoCompareScraper(
+                session=self.http, rate_limiter=self._limiters["cryptocompare"]
+            ),
         }
 
-        print("🚀 Data Collection Orchestrator initialized")
-        print(f"📊 Available P2P platforms: {list(self.scrapers.keys())}")
-        print(f"📈 Available context APIs: {list(self.context_scrapers.keys())}")
-
-    def collect_comprehensive_snapshot(self, countries: List[str] = None) -> Dict[str, Any]:
+        # Countries fetched concurrently for scrapers without a batch method, and
+        # priority crises collected at once; pacing comes from the limiters above
+        self.country_workers = 3
+        self.crisis_workers = 4
+
+        # Every configured country, resolved once for all top-level collection calls
+        self._all_country_codes = tuple(c["country_code"] for c in list_supported_countries())
+
+        # Completed (platform, country, date) collections, so a restarted run resumes
+        self.progress = CollectionProgress(self.csv_manager.base_dir / "state" / "progress.sqlite")
+        self.cache_dir = self.csv_manager.base_dir / "cache"
+
+        # Pre-connect to every API host in parallel so the first country of each
+        # platform doesn't pay DNS + TLS set-up
+        api_urls = [
+            scraper.base_url
+            for scraper in (*self.scrapers.values(), *self.context_scrapers.values())
+        ]
+        api_urls.append(self.exchange_collector.endpoints["exchangerate_api"]["current"])
+        warmed = warm_up(self.http, api_urls)
+
+        logger.info("🚀 Data Collection Orchestrator initialized")
+        logger.info("📊 Available P2P platforms: %s", list(self.scrapers.keys()))
+        logger.info("📈 Available context APIs: %s", list(self.context_scrapers.keys()))
+        logger.info("🔌 Pre-connected to %d API hosts", warmed)
+
+    def collect_comprehensive_snapshot(
+        self, countries: List[str] = None, collection_ts: datetime = None
+    ) -> Dict[str, Any]:
         """
         Collect comprehensive data including P2P data and market context.
 
@@ -86,6 +145,9 @@ class DataCollectionOrchestrator:
         -----------
         countries : list, optional
             List of country codes to collect. If None, collects all.
+        collection_ts : datetime, optional
+            Timestamp shared by the whole run; its date names the output folders.
+            Defaults to now.
 
         Returns:
         --------
@@ -93,11 +155,13 @@ class DataCollectionOrchestrator:
             Complete data collection results
         """
 
-        print("\n🌍 COMPREHENSIVE DATA COLLECTION")
-        print("=" * 50)
+        logger.info("🌍 COMPREHENSIVE DATA COLLECTION")
+        logger.info("=" * 50)
+
+        collection_ts = collection_ts or datetime.now()
 
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": collection_ts.isoformat(),
             "p2p_data": {},
             "market_context": {},
             "exchange_rates": {},
@@ -106,35 +170,96 @@ class DataCollectionOrchestrator:
         }
 
         # 1. Collect P2P data (our core data)
-        print("🔥 Collecting P2P data...")
-        p2p_results = self.collect_current_snapshot(countries)
+        logger.info("🔥 Collecting P2P data...")
+        p2p_results = self.collect_current_snapshot(countries, collection_ts=collection_ts)
         results["p2p_data"] = p2p_results
         results["total_ads_collected"] = p2p_results.get("total_ads", 0)
 
         # 2. Collect market context from free APIs
-        print("\n📊 Collecting market context data...")
-        for api_name, scraper in self.context_scrapers.items():
-            try:
-                print(f"📈 Collecting from {api_name.upper()}...")
-                context_data = scraper.collect_crisis_context_data()
-                results["market_context"][api_name] = context_data
-                print(f"✅ {api_name.upper()} context data collected")
-            except Exception as e:
-                error_msg = f"Error collecting {api_name} context: {e}"
-                print(f"❌ {error_msg}")
-                results["errors"].append(error_msg)
+        logger.info("📊 Collecting market context data...")
+        # Context APIs live on independent hosts, so query them all at once
+        today = collection_ts.strftime("%Y-%m-%d")
+        with ThreadPoolExecutor(max_workers=len(self.context_scrapers)) as executor:
+            futures = {}
+            for api_name, scraper in self.context_scrapers.items():
+                logger.info("📈 Collecting from %s...", api_name.upper())
+                future = executor.submit(
+                    self._load_or_fetch, api_name, scraper.collect_crisis_context_data, today
+                )
+                futures[future] = api_name
+
+            for future in as_completed(futures):
+                api_name = futures[future]
+                try:
+                    results["market_context"][api_name] = future.result()
+                    logger.info("✅ %s context data collected", api_name.upper())
+                except COLLECTION_ERRORS as e:
+                    error_msg = f"Error collecting {api_name} context: {e}"
+                    logger.error("❌ %s", error_msg)
+                    results["errors"].append(error_msg)
 
         # 3. Exchange rates are already included in collect_current_snapshot
         results["exchange_rates"] = p2p_results.get("exchange_rates", {})
 
-        print("\n🎉 COMPREHENSIVE COLLECTION COMPLETE!")
-        print(f"📊 P2P ads collected: {results['total_ads_collected']}")
-        print(f"📈 Context APIs: {len(results['market_context'])} sources")
-        print(f"💱 Exchange rates: {len(results.get('exchange_rates', {}))} currencies")
+        logger.info("🎉 COMPREHENSIVE COLLECTION COMPLETE!")
+        logger.info("📊 P2P ads collected: %s", results["total_ads_collected"])
+        logger.info("📈 Context APIs: %s sources", len(results["market_context"]))
+        logger.info("💱 Exchange rates: %s currencies", len(results.get("exchange_rates", {})))
 
         return results
 
-    def collect_current_snapshot(self, countries: List[str] = None) -> Dict[str, Any]:
+    def _load_or_fetch(
+        self,
+        api_name: str,
+        fetcher: Callable[[], Dict[str, Any]],
+        date_str: str,
+        ttl_seconds: int = CONTEXT_CACHE_TTL,
+    ) -> Dict[str, Any]:
+        """
+        Return a context API's result for the day, reusing a recent cached copy.
+
+        Parameters:
+        -----------
+        api_name : str
+            Context API name (e.g., 'coingecko')
+        fetcher : callable
+            Collects fresh data when there is no usable cached copy
+        date_str : str
+            Collection date (YYYY-MM-DD); the cache is kept per day
+        ttl_seconds : int
+            Maximum age of a cached result
+
+        Returns:
+        --------
+        dict
+            Context data, cached or freshly collected
+        """
+        path = self.cache_dir / f"context_{api_name}_{date_str.replace('-', '')}.json"
+
+        try:
+            if time.time() - path.stat().st_mtime < ttl_seconds:
+                logger.info("💾 Using cached %s context from %s", api_name.upper(), path.name)
+                return orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except orjson.JSONDecodeError as e:
+            logger.warning("⚠️  Ignoring unreadable context cache %s: %s", path.name, e)
+
+        data = fetcher()
+
+        # Only cache complete results, so a failed run is retried next time
+        if data and not data.get("errors"):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(orjson.dumps(data))
+            # Atomic swap: concurrent runs never read a half-written file
+            os.replace(tmp_path, path)
+
+        return data
+
+    def collect_current_snapshot(
+        self, countries: List[str] = None, resume: bool = True, collection_ts: datetime = None
+    ) -> Dict[str, Any]:
         """
         Collect current market snapshot across all platforms.
 
@@ -142,6 +267,11 @@ class DataCollectionOrchestrator:
         -----------
         countries : list, optional
             List of country codes to collect. If None, collects all.
+        resume : bool
+            Skip countries already collected successfully today for a platform
+        collection_ts : datetime, optional
+            Timestamp shared by the whole run; its date names the output folders.
+            Defaults to now.
 
         Returns:
         --------
@@ -149,14 +279,15 @@ class DataCollectionOrchestrator:
             Collection summary and statistics
         """
 
-        if not countries:
-            countries = [c["country_code"] for c in list_supported_countries()]
+        countries = countries or self._all_country_codes
+        collection_ts = collection_ts or datetime.now()
+        today = collection_ts.strftime("%Y-%m-%d")
 
-        print(f"📊 Starting current market snapshot for {len(countries)} countries")
-        print(f"🎯 Target countries: {', '.join(countries)}")
+        logger.info("📊 Starting current market snapshot for %s countries", len(countries))
+        logger.info("🎯 Target countries: %s", ", ".join(countries))
 
         collection_summary = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": collection_ts.isoformat(),
             "countries_processed": 0,
             "total_ads_collected": 0,
             "platform_stats": {},
@@ -164,41 +295,56 @@ class DataCollectionOrchestrator:
         }
 
         # First, collect current exchange rates
-        print("\n💱 Collecting current exchange rates...")
+        logger.info("💱 Collecting current exchange rates...")
         try:
             self.exchange_collector.collect_all_current_rates()
-            print("✅ Exchange rates collected")
-        except Exception as e:
+            logger.info("✅ Exchange rates collected")
+        except COLLECTION_ERRORS as e:
             error_msg = f"Exchange rate collection failed: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             collection_summary["errors"].append(error_msg)
 
         # Collect from each platform
         for platform_name, scraper in self.scrapers.items():
-            print(f"\n🔍 Collecting from {platform_name.upper()}...")
-            platform_ads = 0
-            platform_countries = 0
-
-            for country_code in countries:
-                try:
-                    country_profile = get_profile_by_country_code(country_code)
-                    print(f"\n📍 {platform_name}: {country_profile['name']} ({country_code})")
+            logger.info("🔍 Collecting from %s...", platform_name.upper())
+
+            pending = list(countries)
+            if resume:
+                done = self.progress.completed(platform_name, pending, today)
+                if done:
+                    logger.info(
+                        "⏭️  %s: skipping %s countries already collected today: %s",
+                        platform_name,
+                        len(done),
+                        ", ".join(done),
+                    )
+                    pending = [country_code for country_code in pending if country_code not in done]
 
-                    # Collect data from this platform for this country
-                    if hasattr(scraper, "collect_country_data"):
-                        ads = scraper.collect_country_data(country_code)
-                        platform_ads += len(ads)
-                        if ads:
-                            platform_countries += 1
+            if hasattr(scraper, "stream_countries_batch"):
+                # The scraper dispatches every country's requests itself in one batch.
+                # Each country is marked as soon as it is written, so a batch that
+                # fails part-way still resumes after the countries it saved.
+                country_counts = {}
 
-                    # Rate limiting between countries
-                    time.sleep(1)
+                def on_saved(country_code: str, ads_collected: int):
+                    country_counts[country_code] = ads_collected
+                    self._mark_progress(platform_name, country_code, today, ads_collected)
 
-                except Exception as e:
-                    error_msg = f"{platform_name} failed for {country_code}: {e}"
-                    print(f"❌ {error_msg}")
+                try:
+                    scraper.stream_countries_batch(pending, date_str=today, on_saved=on_saved)
+                except COLLECTION_ERRORS as e:
+                    error_msg = f"{platform_name} batch collection failed: {e}"
+                    logger.error("❌ %s", error_msg)
                     collection_summary["errors"].append(error_msg)
-                    continue
+            else:
+                country_counts = self._collect_countries_concurrently(
+                    platform_name, scraper, pending, today, collection_summary["errors"]
+                )
+                for country_code, ads_collected in country_counts.items():
+                    self._mark_progress(platform_name, country_code, today, ads_collected)
+
+            platform_ads = sum(country_counts.values())
+            platform_countries = sum(1 for count in country_counts.values() if count)
 
             collection_summary["platform_stats"][platform_name] = {
                 "ads_collected": platform_ads,
@@ -206,25 +352,121 @@ class DataCollectionOrchestrator:
             }
             collection_summary["total_ads_collected"] += platform_ads
 
-            print(f"✅ {platform_name}: {platform_ads} ads from {platform_countries} countries")
-
-            # Rate limiting between platforms
-            time.sleep(2)
+            logger.info(
+                "✅ %s: %s ads from %s countries", platform_name, platform_ads, platform_countries
+            )
 
         collection_summary["countries_processed"] = len(countries)
 
-        print("\n🎉 Current snapshot complete!")
-        print(f"📊 Total ads collected: {collection_summary['total_ads_collected']}")
-        print(f"🌍 Countries processed: {collection_summary['countries_processed']}")
+        logger.info("🎉 Current snapshot complete!")
+        logger.info("📊 Total ads collected: %s", collection_summary["total_ads_collected"])
+        logger.info("🌍 Countries processed: %s", collection_summary["countries_processed"])
 
         return collection_summary
 
+    def _mark_progress(self, platform_name: str, country_code: str, date_str: str, n_ads: int):
+        """Record a finished country so a resumed run skips it."""
+        status = "success" if n_ads else "no_data"
+        self.progress.mark(platform_name, country_code, date_str, n_ads, status)
+
+    def _collect_countries_concurrently(
+        self,
+        platform_name: str,
+        scraper: Any,
+        countries: List[str],
+        date_str: str,
+        errors: List[str],
+    ) -> Dict[str, int]:
+        """
+        Collect countries one per worker for scrapers without a batch method.
+
+        Parameters:
+        -----------
+        platform_name : str
+            Platform key in `self.scrapers`
+        scraper : object
+            Platform scraper instance
+        countries : list
+            Country codes to collect
+        date_str : str
+            Collection date (YYYY-MM-DD) used for output folders
+        errors : list
+            Error messages are appended here for failed countries
+
+        Returns:
+        --------
+        dict
+            Country code -> number of ads collected (failed countries omitted)
+        """
+        country_counts = {}
+
+        # Countries are I/O-bound, so fetch them concurrently and read results in order
+        with ThreadPoolExecutor(max_workers=self.country_workers) as executor:
+            futures = {
+                country_code: executor.submit(
+                    self._collect_country, platform_name, scraper, country_code, date_str
+                )
+                for country_code in countries
+            }
+
+            for country_code, future in futures.items():
+                try:
+                    country_counts[country_code] = future.result()
+                except COLLECTION_ERRORS as e:
+                    error_msg = f"{platform_name} failed for {country_code}: {e}"
+                    logger.error("❌ %s", error_msg)
+                    errors.append(error_msg)
+
+        return country_counts
+
+    def _collect_country(
+        self, platform_name: str, scraper: Any, country_code: str, date_str: str
+    ) -> int:
+        """
+        Collect current ads for one country from one platform.
+
+        Runs inside the snapshot thread pool; rate limiting is left to the
+        platform's token bucket, which the scraper takes from per request.
+
+        Parameters:
+        -----------
+        platform_name : str
+            Platform key in `self.scrapers`
+        scraper : object
+            Platform scraper instance
+        country_code : str
+            ISO country code
+        date_str : str
+            Collection date (YYYY-MM-DD) used for output folders
+
+        Returns:
+        --------
+        int
+            Number of ads collected for the country (0 if unsupported)
+        """
+        country_profile = get_profile_by_country_code(country_code)
+        logger.info("📍 %s: %s (%s)", platform_name, country_profile["name"], country_code)
+
+        return self._collect_current_ads(scraper, country_code, date_str)
+
+    def _collect_current_ads(self, scraper: Any, country_code: str, date_str: str) -> int:
+        """Collect and save a country's current ads, returning how many were collected."""
+        if hasattr(scraper, "stream_country_data"):
+            # Ads are written to CSV as they arrive; only the count comes back
+            return scraper.stream_country_data(country_code, date_str=date_str)
+
+        if hasattr(scraper, "collect_country_data"):
+            return len(scraper.collect_country_data(country_code))
+
+        return 0
+
     def collect_crisis_period_data(
         self,
         country_code: str,
         crisis_start: str,
         crisis_end: str,
         platforms: List[str] = None,
+        collection_ts: datetime = None,
     ) -> Dict[str, Any]:
         """
         Collect historical data for a specific crisis period.
@@ -239,6 +481,9 @@ class DataCollectionOrchestrator:
             Crisis end date (YYYY-MM-DD)
         platforms : list, optional
             Platforms to collect from. Defaults to all available.
+        collection_ts : datetime, optional
+            Timestamp shared by the whole run; its date names the output folders.
+            Defaults to now.
 
         Returns:
         --------
@@ -249,12 +494,13 @@ class DataCollectionOrchestrator:
         if not platforms:
             platforms = list(self.scrapers.keys())
 
+        collection_date = (collection_ts or datetime.now()).strftime("%Y-%m-%d")
         country_profile = get_profile_by_country_code(country_code)
 
-        print("\n🚨 CRISIS PERIOD DATA COLLECTION")
-        print(f"🌍 Country: {country_profile['name']} ({country_code})")
-        print(f"📅 Period: {crisis_start} to {crisis_end}")
-        print(f"🔍 Platforms: {', '.join(platforms)}")
+        logger.info("🚨 CRISIS PERIOD DATA COLLECTION")
+        logger.info("🌍 Country: %s (%s)", country_profile["name"], country_code)
+        logger.info("📅 Period: %s to %s", crisis_start, crisis_end)
+        logger.info("🔍 Platforms: %s", ", ".join(platforms))
 
         crisis_summary = {
             "country_code": country_code,
@@ -269,49 +515,52 @@ class DataCollectionOrchestrator:
         }
 
         # Collect exchange rates for crisis period
-        print("\n💱 Collecting exchange rates for crisis period...")
+        logger.info("💱 Collecting exchange rates for crisis period...")
         try:
             rates = self.exchange_collector.collect_crisis_period_rates(
                 country_code, crisis_start, crisis_end
             )
             crisis_summary["exchange_rates_collected"] = len(rates)
-            print(f"✅ Collected {len(rates)} exchange rate records")
-        except Exception as e:
+            logger.info("✅ Collected %s exchange rate records", len(rates))
+        except COLLECTION_ERRORS as e:
             error_msg = f"Crisis exchange rates failed: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             crisis_summary["errors"].append(error_msg)
 
         # Attempt historical collection from each platform
         for platform in platforms:
-            print(f"\n🕐 Collecting historical {platform} data...")
+            logger.info("🕐 Collecting historical %s data...", platform)
 
             try:
                 scraper = self.scrapers[platform]
-                historical_ads = []
+                ads_collected = 0
 
                 # Different collection methods for different platforms
                 if platform == "paxful" and hasattr(scraper, "collect_historical_data"):
-                    historical_ads = scraper.collect_historical_data(
-                        country_code, crisis_start, crisis_end
+                    ads_collected = len(
+                        scraper.collect_historical_data(country_code, crisis_start, crisis_end)
                     )
-                elif hasattr(scraper, "collect_country_data"):
+                else:
                     # For platforms without historical API, collect current as baseline
-                    print(
-                        f"⚠️  {platform} doesn't support historical API, collecting current baseline"
+                    logger.warning(
+                        "⚠️  %s doesn't support historical API, collecting current baseline",
+                        platform,
+                    )
+                    ads_collected = self._collect_current_ads(
+                        scraper, country_code, collection_date
                     )
-                    historical_ads = scraper.collect_country_data(country_code)
 
                 crisis_summary["platform_results"][platform] = {
-                    "ads_collected": len(historical_ads),
-                    "status": "success" if historical_ads else "no_data",
+                    "ads_collected": ads_collected,
+                    "status": "success" if ads_collected else "no_data",
                 }
-                crisis_summary["total_historical_ads"] += len(historical_ads)
+                crisis_summary["total_historical_ads"] += ads_collected
 
-                print(f"✅ {platform}: {len(historical_ads)} historical records")
+                logger.info("✅ %s: %s historical records", platform, ads_collected)
 
-            except Exception as e:
+            except COLLECTION_ERRORS as e:
                 error_msg = f"Historical {platform} collection failed: {e}"
-                print(f"❌ {error_msg}")
+                logger.error("❌ %s", error_msg)
                 crisis_summary["errors"].append(error_msg)
                 crisis_summary["platform_results"][platform] = {
                     "ads_collected": 0,
@@ -319,9 +568,9 @@ class DataCollectionOrchestrator:
                     "error": str(e),
                 }
 
-        print("\n🎯 Crisis period collection complete!")
-        print(f"📊 Total historical ads: {crisis_summary['total_historical_ads']}")
-        print(f"💱 Exchange rates: {crisis_summary['exchange_rates_collected']}")
+        logger.info("🎯 Crisis period collection complete!")
+        logger.info("📊 Total historical ads: %s", crisis_summary["total_historical_ads"])
+        logger.info("💱 Exchange rates: %s", crisis_summary["exchange_rates_collected"])
 
         return crisis_summary
 
@@ -340,8 +589,8 @@ class DataCollectionOrchestrator:
             Complete collection summary
         """
 
-        print("🚀 COMPREHENSIVE DATA COLLECTION STARTING")
-        print("=" * 60)
+        logger.info("🚀 COMPREHENSIVE DATA COLLECTION STARTING")
+        logger.info("=" * 60)
 
         start_time = datetime.now()
 
@@ -357,21 +606,21 @@ class DataCollectionOrchestrator:
         }
 
         # Step 1: Current market snapshot
-        print("\n📊 STEP 1: Current Market Snapshot")
-        print("-" * 40)
+        logger.info("📊 STEP 1: Current Market Snapshot")
+        logger.info("-" * 40)
         try:
-            snapshot_results = self.collect_current_snapshot()
+            snapshot_results = self.collect_current_snapshot(collection_ts=start_time)
             comprehensive_summary["current_snapshot"] = snapshot_results
             comprehensive_summary["total_ads_collected"] += snapshot_results["total_ads_collected"]
-        except Exception as e:
+        except COLLECTION_ERRORS as e:
             error_msg = f"Current snapshot failed: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             comprehensive_summary["errors"].append(error_msg)
 
         # Step 2: Historical crisis data (if requested)
         if include_historical:
-            print("\n🕐 STEP 2: Historical Crisis Data")
-            print("-" * 40)
+            logger.info("🕐 STEP 2: Historical Crisis Data")
+            logger.info("-" * 40)
 
             # Define key crisis periods for priority collection
             priority_crises = [
@@ -381,21 +630,35 @@ class DataCollectionOrchestrator:
                 ("NG", "2021-02-01", "2021-08-01"),  # Nigeria crypto ban
             ]
 
-            for country_code, start_date, end_date in priority_crises:
-                try:
-                    print(f"\n🎯 Priority crisis: {country_code} ({start_date} to {end_date})")
-                    crisis_results = self.collect_crisis_period_data(
-                        country_code, start_date, end_date
+            # Crises cover distinct countries, so collect them concurrently and
+            # merge results back in priority order
+            with ThreadPoolExecutor(max_workers=self.crisis_workers) as executor:
+                futures = []
+                for country_code, start_date, end_date in priority_crises:
+                    logger.info(
+                        "🎯 Priority crisis: %s (%s to %s)", country_code, start_date, end_date
+                    )
+                    future = executor.submit(
+                        self.collect_crisis_period_data,
+                        country_code,
+                        start_date,
+                        end_date,
+                        collection_ts=start_time,
                     )
-                    comprehensive_summary["historical_collections"].append(crisis_results)
-                    comprehensive_summary["total_ads_collected"] += crisis_results[
-                        "total_historical_ads"
-                    ]
+                    futures.append((country_code, future))
 
-                except Exception as e:
-                    error_msg = f"Crisis collection {country_code} failed: {e}"
-                    print(f"❌ {error_msg}")
-                    comprehensive_summary["errors"].append(error_msg)
+                for country_code, future in futures:
+                    try:
+                        crisis_results = future.result()
+                        comprehensive_summary["historical_collections"].append(crisis_results)
+                        comprehensive_summary["total_ads_collected"] += crisis_results[
+                            "total_historical_ads"
+                        ]
+
+                    except COLLECTION_ERRORS as e:
+                        error_msg = f"Crisis collection {country_code} failed: {e}"
+                        logger.error("❌ %s", error_msg)
+                        comprehensive_summary["errors"].append(error_msg)
 
         # Calculate final summary
         end_time = datetime.now()
@@ -403,14 +666,14 @@ class DataCollectionOrchestrator:
         comprehensive_summary["duration_minutes"] = round(
             (end_time - start_time).total_seconds() / 60, 2
         )
-        comprehensive_summary["countries_processed"] = len(list_supported_countries())
+        comprehensive_summary["countries_processed"] = len(self._all_country_codes)
 
-        print("\n" + "=" * 60)
-        print("🎉 COMPREHENSIVE COLLECTION COMPLETE!")
-        print(f"⏱️  Duration: {comprehensive_summary['duration_minutes']} minutes")
-        print(f"📊 Total ads collected: {comprehensive_summary['total_ads_collected']}")
-        print(f"🌍 Countries processed: {comprehensive_summary['countries_processed']}")
-        print(f"❌ Errors encountered: {len(comprehensive_summary['errors'])}")
+        logger.info("=" * 60)
+        logger.info("🎉 COMPREHENSIVE COLLECTION COMPLETE!")
+        logger.info("⏱️  Duration: %s minutes", comprehensive_summary["duration_minutes"])
+        logger.info("📊 Total ads collected: %s", comprehensive_summary["total_ads_collected"])
+        logger.info("🌍 Countries processed: %s", comprehensive_summary["countries_processed"])
+        logger.info("❌ Errors encountered: %s", len(comprehensive_summary["errors"]))
 
         return comprehensive_summary
 
@@ -420,62 +683,64 @@ def main():
     Main function for collecting comprehensive data from all supported countries.
     Uses comprehensive collection to avoid duplication.
     """
-    print("🚀 SYSTEMATIC DATA COLLECTION FOR ALL COUNTRIES")
-    print("=" * 60)
+    logger.info("🚀 SYSTEMATIC DATA COLLECTION FOR ALL COUNTRIES")
+    logger.info("=" * 60)
 
     orchestrator = DataCollectionOrchestrator()
 
-    # Use country_profiles utility to get all supported countries
-    from utils.country_profiles import list_supported_countries
-
     try:
-        # Get all countries from our config
-        all_countries = list_supported_countries()
-        country_codes = [country["country_code"] for country in all_countries]
+        # All countries from our config, resolved once by the orchestrator
+        country_codes = list(orchestrator._all_country_codes)
 
-        print(f"📊 Target countries from config: {', '.join(country_codes)}")
-        print(f"🎯 Total countries to collect: {len(country_codes)}")
-        print("=" * 60)
+        logger.info("📊 Target countries from config: %s", ", ".join(country_codes))
+        logger.info("🎯 Total countries to collect: %s", len(country_codes))
+        logger.info("=" * 60)
 
         # Use comprehensive collection (includes P2P + market context - NO DUPLICATION)
-        print(f"\n🔍 Running comprehensive collection for all {len(country_codes)} countries...")
+        logger.info(
+            "🔍 Running comprehensive collection for all %s countries...", len(country_codes)
+        )
         results = orchestrator.collect_comprehensive_snapshot(country_codes)
 
-        print("\n📊 COMPREHENSIVE COLLECTION RESULTS:")
-        print(f"📈 P2P ads collected: {results['total_ads_collected']}")
-        print(f"📊 Market context sources: {len(results.get('market_context', {}))}")
-        print(f"🌍 Countries processed: {len(country_codes)}")
+        logger.info("📊 COMPREHENSIVE COLLECTION RESULTS:")
+        logger.info("📈 P2P ads collected: %s", results["total_ads_collected"])
+        logger.info("📊 Market context sources: %s", len(results.get("market_context", {})))
+        logger.info("🌍 Countries processed: %s", len(country_codes))
 
         # Show P2P platform breakdown
         if "p2p_data" in results and "platform_stats" in results["p2p_data"]:
-            print(f"📊 P2P Platform stats: {results['p2p_data']['platform_stats']}")
+            logger.info("📊 P2P Platform stats: %s", results["p2p_data"]["platform_stats"])
 
         if results.get("errors"):
-            print(f"\n⚠️  Errors encountered: {len(results['errors'])}")
+            logger.warning("⚠️  Errors encountered: %s", len(results["errors"]))
             for error in results["errors"][:3]:  # Show first 3 errors
-                print(f"   ❌ {error}")
+                logger.error("   ❌ %s", error)
 
         # Show success summary
         if results["total_ads_collected"] > 0:
-            print(f"\n✅ SUCCESS: Collected {results['total_ads_collected']} total P2P ads")
-            print(f"� Plus market context from {len(results.get('market_context', {}))} APIs")
-            print(f"�💾 Data saved to: data/raw/{orchestrator.today}/ and data/analysis/")
+            logger.info("✅ SUCCESS: Collected %s total P2P ads", results["total_ads_collected"])
+            logger.info(
+                "📈 Plus market context from %s APIs", len(results.get("market_context", {}))
+            )
+            logger.info("💾 Data saved to: %s", orchestrator.csv_manager.raw_dir)
         else:
-            print("\n⚠️  No P2P ads collected - check country currency support")
+            logger.warning("⚠️  No P2P ads collected - check country currency support")
 
     except Exception as e:
-        print(f"❌ Error loading countries from config: {e}")
-        print("📝 Falling back to manual country list...")
+        logger.error("❌ Error loading countries from config: %s", e)
+        logger.info("📝 Falling back to manual country list...")
 
         # Fallback to manual list if config fails
         fallback_countries = ["SD", "VE", "AR", "AF", "NG", "ZW"]
-        print(f"🔄 Using fallback countries: {', '.join(fallback_countries)}")
+        logger.info("🔄 Using fallback countries: %s", ", ".join(fallback_countries))
         results = orchestrator.collect_comprehensive_snapshot(fallback_countries)
 
-        print("\n📊 Fallback Results:")
-        print(f"P2P ads: {results['total_ads_collected']}")
-        print(f"Context APIs: {len(results.get('market_context', {}))}")
+        logger.info("📊 Fallback Results:")
+        logger.info("P2P ads: %s", results["total_ads_collected"])
+        logger.info("Context APIs: %s", len(results.get("market_context", {})))
 
 
 if __name__ == "__main__":
-    main()
+    # Console and file output go through a background listener thread
+    with queued_logging():
+        main()
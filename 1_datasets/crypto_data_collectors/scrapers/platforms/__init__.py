@@ -0,0 +1,3 @@
+"""
+Scrapers for individual cryptocurrency data platforms.
+"""
@@ -0,0 +1,121 @@
+"""
+Base HTTP Scraper
+=================
+
+Shared plumbing for the free market-context API scrapers (CoinGecko,
+CryptoCompare): the pooled session, token-bucket pacing, the on-disk response
+cache and CSV output. Subclasses supply their base URL, endpoints and default
+request budget, and implement the API-specific requests and parsing.
+
+License: MIT
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional
+
+import orjson
+import pandas as pd
+import requests
+
+from utils.csv_data_manager import CSVDataManager
+from utils.http_session import create_session, retry_after
+from utils.rate_limiter import TokenBucket
+from utils.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Extra attempts after the session's own retries still end in HTTP 429
+THROTTLE_RETRIES = 2
+# Back-off (seconds) when a 429 carries no usable Retry-After header
+THROTTLE_DEFAULT_WAIT = 5.0
+
+
+class BaseHTTPScraper:
+    """
+    Session, rate limiting, response caching and CSV output for JSON API scrapers.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        name: str,
+        rate_limiter: TokenBucket,
+        session: requests.Session = None,
+    ):
+        """
+        Initialize the shared scraper state.
+
+        Parameters:
+        -----------
+        base_url : str
+            API root URL
+        name : str
+            Short API name; namespaces the response cache (e.g., 'coingecko')
+        rate_limiter : TokenBucket
+            Request budget for the API host
+        session : requests.Session, optional
+            Shared pooled session (see utils.http_session); a new one is
+            created when omitted
+        """
+        self.base_url = base_url
+        self.session = session or create_session()
+        # Sent per request so a shared session carries no API-specific headers
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        }
+        self.csv_manager = CSVDataManager()
+
+        # Each request takes a token instead of sleeping after every call
+        self._bucket = rate_limiter
+        # Requests in flight at once within a collection (keep within pool_maxsize)
+        self.max_workers = 8
+
+        # Responses persisted across runs so repeated lookups skip the network
+        self.cache = ResponseCache(self.csv_manager.base_dir / "cache" / "http", name)
+
+        # Output folder created once here rather than on every save
+        self.analysis_dir = "data/analysis"
+        os.makedirs(self.analysis_dir, exist_ok=True)
+
+    def _get_json(self, url: str, params: Dict[str, Any], ttl: Optional[float]) -> Any:
+        """GET a JSON endpoint, reusing a cached response younger than `ttl` seconds."""
+        key = ResponseCache.make_key(url, params)
+        data = self.cache.get(key, ttl)
+        if data is not None:
+            return data
+
+        data = self._fetch_json(url, params)
+        if self._is_cacheable(data):
+            self.cache.put(key, data)
+        return data
+
+    def _fetch_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """
+        GET and decode a JSON endpoint, bypassing the cache (paced by the bucket).
+
+        The session already retries 429s with exponential backoff. If the last
+        of those is still throttled, the whole bucket is paused for the
+        server's Retry-After, so every worker backs off, and the request is
+        tried again rather than failing the collection.
+        """
+        for attempt in range(THROTTLE_RETRIES + 1):
+            self._bucket.acquire()
+            response = self.session.get(url, params=params, headers=self.headers, timeout=15)
+            if response.status_code != 429 or attempt == THROTTLE_RETRIES:
+                break
+            wait = retry_after(response, THROTTLE_DEFAULT_WAIT)
+            logger.warning("⚠️  Rate limited by %s, backing off %.0fs", self.base_url, wait)
+            self._bucket.pause(wait)
+
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _is_cacheable(self, data: Any) -> bool:
+        """Whether a decoded response may be cached; override to reject error payloads."""
+        return True
+
+    def _save_csv(self, df: pd.DataFrame, filename: str, description: str):
+        """Write a frame to the analysis folder and report how many records it held."""
+        df.to_csv(os.path.join(self.analysis_dir, filename), index=False)
+        logger.info("💾 Saved %s %s to %s", len(df), description, filename)
@@ -12,41 +12,83 @@ Relevant endpoints:
 - /exchanges - List of exchanges (some are P2P)
 - /simple/price - Current prices with volume data
 
+Usage (from the crypto_data_collectors directory):
+    python -m scrapers.platforms.coingecko_free
+
 Author: Clement MUGISHA
 """
 
-import json
-import os
-import sys
-import time
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any, Dict, List
 
+import numpy as np
+import orjson
+import pandas as pd
 import requests
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from scrapers.platforms.base import BaseHTTPScraper
+from utils.logging_utils import queued_logging
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# How long cached responses are reused (seconds): prices move by the minute,
+# the exchange list rarely changes, and 30-day charts only gain recent points
+PRICE_TTL = 60
+EXCHANGES_TTL = 6 * 3600
+HISTORY_TTL = 3600
 
-from utils.csv_data_manager import CSVDataManager
+# Exchanges whose name or description mentions any of these may offer P2P trading
+# (substring match, so e.g. "LocalBitcoins" and "peer-to-peer" both count)
+P2P_KEYWORDS = ("p2p", "peer", "local", "otc", "decentralized")
+P2P_PATTERN = re.compile("|".join(map(re.escape, P2P_KEYWORDS)), re.IGNORECASE)
 
+# Exchange fields kept for each potential P2P exchange
+EXCHANGE_FIELDS = (
+    "id",
+    "name",
+    "country",
+    "description",
+    "trade_volume_24h_btc",
+    "trust_score",
+    "url",
+)
 
-class CoinGeckoScraper:
+
+class CoinGeckoScraper(BaseHTTPScraper):
     """
     Scraper for CoinGecko cryptocurrency market data (free tier, no auth required).
     """
 
-    def __init__(self):
-        self.base_url = "https://api.coingecko.com/api/v3"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-        )
-        self.csv_manager = CSVDataManager()
+    def __init__(self, session: requests.Session = None, rate_limiter: TokenBucket = None):
+        """
+        Initialize the scraper.
 
-        # Rate limiting for free tier (50 calls/minute = ~1 call per 1.2 seconds)
-        self.rate_limit_delay = 1.5
+        Parameters:
+        -----------
+        session : requests.Session, optional
+            Shared pooled session (see utils.http_session); a new one is
+            created when omitted
+        rate_limiter : TokenBucket, optional
+            Request budget for api.coingecko.com; defaults to 50 req/min
+            with bursts of 10
+        """
+        super().__init__(
+            "https://api.coingecko.com/api/v3",
+            name="coingecko",
+            # Refills at the free tier's 50 calls/minute with small bursts
+            rate_limiter=rate_limiter or TokenBucket(rate=50 / 60, capacity=10),
+            session=session,
+        )
+        # API endpoints, built once
+        self.endpoints = {
+            "price": f"{self.base_url}/simple/price",
+            "exchanges": f"{self.base_url}/exchanges",
+            "market_chart": f"{self.base_url}/coins/{{crypto_id}}/market_chart",
+        }
 
     def get_current_prices(
         self, cryptocurrencies: List[str], vs_currencies: List[str]
@@ -70,7 +112,8 @@ class CoinGeckoScraper:
         crypto_ids = ",".join(cryptocurrencies)
         vs_curr = ",".join(vs_currencies)
 
-        url = f"{self.base_url}/simple/price"
+        # Every pair in one batched request, never one call per crypto
+        url = self.endpoints["price"]
         params = {
             "ids": crypto_ids,
             "vs_currencies": vs_curr,
@@ -80,33 +123,31 @@ class CoinGeckoScraper:
         }
 
         try:
-            print(f"🔍 Fetching prices from CoinGecko: {crypto_ids} vs {vs_curr}")
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-
-            data = response.json()
+            logger.info("🔍 Fetching prices from CoinGecko: %s vs %s", crypto_ids, vs_curr)
+            data = self._get_json(url, params, ttl=PRICE_TTL)
 
             # Add metadata
+            now = datetime.now()
             result = {
-                "timestamp": datetime.now().isoformat(),
-                "collection_date": datetime.now().strftime("%Y-%m-%d"),
+                "timestamp": now.isoformat(),
+                "collection_date": now.strftime("%Y-%m-%d"),
                 "source": "coingecko",
                 "cryptocurrencies": cryptocurrencies,
                 "vs_currencies": vs_currencies,
                 "prices": data,
             }
 
-            print(f"✅ Retrieved prices for {len(data)} cryptocurrencies")
+            logger.info("✅ Retrieved prices for %s cryptocurrencies", len(data))
             return result
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Network error fetching CoinGecko prices: {e}")
+            logger.error("❌ Network error fetching CoinGecko prices: %s", e)
             return {}
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON decode error: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error("❌ JSON decode error: %s", e)
             return {}
         except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
             return {}
 
     def get_exchanges(self, per_page: int = 50) -> List[Dict[str, Any]]:
@@ -124,45 +165,36 @@ class CoinGeckoScraper:
             List of exchange information
         """
 
-        url = f"{self.base_url}/exchanges"
+        url = self.endpoints["exchanges"]
         params = {"per_page": min(per_page, 250)}
 
         try:
-            print("🔍 Fetching exchanges from CoinGecko...")
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-
-            exchanges = response.json()
+            logger.info("🔍 Fetching exchanges from CoinGecko...")
+            exchanges = self._get_json(url, params, ttl=EXCHANGES_TTL)
 
             # Filter for potentially P2P exchanges
-            p2p_keywords = ["p2p", "peer", "local", "otc", "decentralized"]
             p2p_exchanges = []
+            # One collection time for the whole batch, not a clock read per match
+            timestamp = datetime.now().isoformat()
 
             for exchange in exchanges:
-                name = exchange.get("name", "").lower()
-                description = exchange.get("description", "").lower()
-
-                if any(keyword in name or keyword in description for keyword in p2p_keywords):
-                    p2p_exchanges.append(
-                        {
-                            "id": exchange.get("id"),
-                            "name": exchange.get("name"),
-                            "country": exchange.get("country"),
-                            "description": exchange.get("description"),
-                            "trade_volume_24h_btc": exchange.get("trade_volume_24h_btc"),
-                            "trust_score": exchange.get("trust_score"),
-                            "url": exchange.get("url"),
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    )
-
-            print(
-                f"✅ Found {len(p2p_exchanges)} potential P2P exchanges out of {len(exchanges)} total"
+                # One scan over both fields instead of one per field
+                text = f"{exchange.get('name') or ''}\n{exchange.get('description') or ''}"
+
+                if P2P_PATTERN.search(text):
+                    record = {field: exchange.get(field) for field in EXCHANGE_FIELDS}
+                    record["timestamp"] = timestamp
+                    p2p_exchanges.append(record)
+
+            logger.info(
+                "✅ Found %s potential P2P exchanges out of %s total",
+                len(p2p_exchanges),
+                len(exchanges),
             )
             return p2p_exchanges
 
         except Exception as e:
-            print(f"❌ Error fetching exchanges: {e}")
+            logger.error("❌ Error fetching exchanges: %s", e)
             return []
 
     def get_historical_prices(
@@ -183,18 +215,16 @@ class CoinGeckoScraper:
         Returns:
         --------
         dict
-            Historical price data
+            Historical price data; each series is a list of [timestamp_ms, value]
+            pairs (see history_to_frame for a columnar view)
         """
 
-        url = f"{self.base_url}/coins/{crypto_id}/market_chart"
+        url = self.endpoints["market_chart"].format(crypto_id=crypto_id)
         params = {"vs_currency": vs_currency, "days": days}
 
         try:
-            print(f"🔍 Fetching {days} days of {crypto_id} history vs {vs_currency}")
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-
-            data = response.json()
+            logger.info("🔍 Fetching %s days of %s history vs %s", days, crypto_id, vs_currency)
+            data = self._get_json(url, params, ttl=HISTORY_TTL)
 
             result = {
                 "crypto_id": crypto_id,
@@ -206,11 +236,11 @@ class CoinGeckoScraper:
                 "total_volumes": data.get("total_volumes", []),
             }
 
-            print(f"✅ Retrieved {len(result['prices'])} price points")
+            logger.info("✅ Retrieved %s price points", len(result["prices"]))
             return result
 
         except Exception as e:
-            print(f"❌ Error fetching historical data: {e}")
+            logger.error("❌ Error fetching historical data: %s", e)
             return {}
 
     def collect_crisis_context_data(self) -> Dict[str, Any]:
@@ -223,8 +253,8 @@ class CoinGeckoScraper:
             Collection results with market data
         """
 
-        print("\n🌍 COINGECKO: Collecting crisis context data")
-        print("-" * 50)
+        logger.info("🌍 COINGECKO: Collecting crisis context data")
+        logger.info("-" * 50)
 
         # Target cryptocurrencies for our analysis
         cryptocurrencies = ["bitcoin", "tether", "ethereum", "binancecoin"]
@@ -235,8 +265,12 @@ class CoinGeckoScraper:
             "eur",
         ]  # CoinGecko may not support all our target fiats
 
+        # One clock read names every file and stamps the results of this collection
+        now = datetime.now()
+        date_str = now.strftime("%Y-%m-%d")
+
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "source": "coingecko",
             "current_prices": {},
             "p2p_exchanges": [],
@@ -245,96 +279,139 @@ class CoinGeckoScraper:
         }
 
         try:
-            # 1. Get current prices
-            print("💰 Fetching current cryptocurrency prices...")
-            prices = self.get_current_prices(cryptocurrencies, fiat_currencies)
-            if prices:
-                results["current_prices"] = prices
-
-                # Save current prices
-                filename = f"coingecko_prices_{datetime.now().strftime('%Y-%m-%d')}.csv"
-                self._save_prices_to_csv(prices, filename)
-
-            time.sleep(self.rate_limit_delay)
-
-            # 2. Get P2P exchanges
-            print("🏪 Fetching potential P2P exchanges...")
-            exchanges = self.get_exchanges()
-            if exchanges:
-                results["p2p_exchanges"] = exchanges
-
-                # Save exchange data
-                filename = f"coingecko_p2p_exchanges_{datetime.now().strftime('%Y-%m-%d')}.csv"
-                self._save_exchanges_to_csv(exchanges, filename)
-
-            time.sleep(self.rate_limit_delay)
-
-            # 3. Get some historical context (last 30 days for Bitcoin and Tether)
-            for crypto in ["bitcoin", "tether"]:
-                print(f"📊 Fetching 30-day history for {crypto}...")
-                historical = self.get_historical_prices(crypto, "usd", 30)
-                if historical:
-                    results["historical_data"][crypto] = historical
-
-                time.sleep(self.rate_limit_delay)
-
-            print("✅ CoinGecko data collection complete!")
-            print(f"   💰 Current prices: {len(results['current_prices'])} datasets")
-            print(f"   🏪 P2P exchanges: {len(results['p2p_exchanges'])} found")
-            print(f"   📊 Historical data: {len(results['historical_data'])} cryptocurrencies")
+            # All requests are independent, so dispatch them together (the bucket
+            # keeps the pace) and process each result on this thread
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                logger.info("💰 Fetching current cryptocurrency prices...")
+                prices_future = executor.submit(
+                    self.get_current_prices, cryptocurrencies, fiat_currencies
+                )
+                logger.info("🏪 Fetching potential P2P exchanges...")
+                exchanges_future = executor.submit(self.get_exchanges)
+                # Some historical context (last 30 days for Bitcoin and Tether)
+                history_futures = {}
+                for crypto in ["bitcoin", "tether"]:
+                    logger.info("📊 Fetching 30-day history for %s...", crypto)
+                    future = executor.submit(self.get_historical_prices, crypto, "usd", 30)
+                    history_futures[future] = crypto
+
+                # 1. Current prices
+                prices = prices_future.result()
+                if prices:
+                    results["current_prices"] = prices
+
+                    # Save current prices
+                    filename = f"coingecko_prices_{date_str}.csv"
+                    self._save_prices_to_csv(prices, filename)
+
+                # 2. P2P exchanges
+                exchanges = exchanges_future.result()
+                if exchanges:
+                    results["p2p_exchanges"] = exchanges
+
+                    # Save exchange data
+                    filename = f"coingecko_p2p_exchanges_{date_str}.csv"
+                    self._save_exchanges_to_csv(exchanges, filename)
+
+                # 3. Historical context
+                for future in as_completed(history_futures):
+                    historical = future.result()
+                    if historical:
+                        crypto = history_futures[future]
+                        results["historical_data"][crypto] = historical
+
+                        # Save the series as one row per price point
+                        filename = f"coingecko_history_{crypto}_{date_str}.csv"
+                        self._save_history_to_csv(historical, filename)
+
+            logger.info("✅ CoinGecko data collection complete!")
+            logger.info("   💰 Current prices: %s datasets", len(results["current_prices"]))
+            logger.info("   🏪 P2P exchanges: %s found", len(results["p2p_exchanges"]))
+            logger.info(
+                "   📊 Historical data: %s cryptocurrencies", len(results["historical_data"])
+            )
 
             return results
 
         except Exception as e:
             error_msg = f"Error in CoinGecko collection: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             results["errors"].append(error_msg)
             return results
 
     def _save_prices_to_csv(self, price_data: Dict[str, Any], filename: str):
         """Save price data to CSV format."""
         try:
-            import pandas as pd
-
-            # Flatten price data for CSV
-            rows = []
-            for crypto, currencies in price_data.get("prices", {}).items():
-                for currency, value in currencies.items():
-                    if currency != "last_updated_at":
-                        rows.append(
-                            {
-                                "timestamp": price_data["timestamp"],
-                                "cryptocurrency": crypto,
-                                "fiat_currency": currency.upper(),
-                                "price": value,
-                                "source": "coingecko",
-                            }
-                        )
+            # Flatten price data for CSV: plain tuples, columns built once by pandas
+            rows = [
+                (crypto, currency, value)
+                for crypto, currencies in price_data.get("prices", {}).items()
+                for currency, value in currencies.items()
+                if currency != "last_updated_at"
+            ]
 
             if rows:
-                df = pd.DataFrame(rows)
-                filepath = f"data/analysis/{filename}"
-                os.makedirs(os.path.dirname(filepath), exist_ok=True)
-                df.to_csv(filepath, index=False)
-                print(f"💾 Saved {len(rows)} price records to {filename}")
+                df = pd.DataFrame(rows, columns=["cryptocurrency", "fiat_currency", "price"])
+                df = df.assign(
+                    timestamp=price_data["timestamp"],
+                    fiat_currency=df["fiat_currency"].str.upper(),
+                    source="coingecko",
+                )[["timestamp", "cryptocurrency", "fiat_currency", "price", "source"]]
+                self._save_csv(df, filename, "price records")
 
         except Exception as e:
-            print(f"❌ Error saving prices to CSV: {e}")
+            logger.error("❌ Error saving prices to CSV: %s", e)
 
     def _save_exchanges_to_csv(self, exchanges: List[Dict[str, Any]], filename: str):
         """Save exchange data to CSV format."""
         try:
-            import pandas as pd
-
             if exchanges:
-                df = pd.DataFrame(exchanges)
-                filepath = f"data/analysis/{filename}"
-                os.makedirs(os.path.dirname(filepath), exist_ok=True)
-                df.to_csv(filepath, index=False)
-                print(f"💾 Saved {len(exchanges)} P2P exchanges to {filename}")
+                self._save_csv(pd.DataFrame(exchanges), filename, "P2P exchanges")
+
+        except Exception as e:
+            logger.error("❌ Error saving exchanges to CSV: %s", e)
+
+    def _save_history_to_csv(self, history: Dict[str, Any], filename: str):
+        """Save historical price data to CSV format."""
+        try:
+            df = history_to_frame(history)
+            if not df.empty:
+                self._save_csv(df, filename, "price points")
 
         except Exception as e:
-            print(f"❌ Error saving exchanges to CSV: {e}")
+            logger.error("❌ Error saving history to CSV: %s", e)
+
+
+def history_to_frame(history: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Convert a get_historical_prices result into a columnar DataFrame.
+
+    Each series is cast to a float64 array in one step instead of unpacking the
+    [timestamp_ms, value] pairs row by row; missing values become NaN.
+
+    Parameters:
+    -----------
+    history : dict
+        Result of CoinGeckoScraper.get_historical_prices
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per price point with timestamp, price, market_cap and
+        total_volume columns
+    """
+    prices = np.asarray(history.get("prices", []), dtype=np.float64).reshape(-1, 2)
+    columns = {
+        "timestamp": prices[:, 0].astype("datetime64[ms]"),
+        "price": prices[:, 1],
+    }
+
+    # CoinGecko samples all three series at the same timestamps
+    for column, key in (("market_cap", "market_caps"), ("total_volume", "total_volumes")):
+        series = np.asarray(history.get(key, []), dtype=np.float64).reshape(-1, 2)
+        columns[column] = series[:, 1] if len(series) == len(prices) else np.nan
+
+    return pd.DataFrame(columns)
 
 
 def test_coingecko_scraper():
@@ -362,4 +439,5 @@ def test_coingecko_scraper():
 
 
 if __name__ == "__main__":
-    test_coingecko_scraper()
+    with queued_logging():
+        test_coingecko_scraper()
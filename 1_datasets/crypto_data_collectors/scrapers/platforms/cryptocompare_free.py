@@ -11,41 +11,71 @@ Useful for:
 - Exchange-specific price data
 - Market context for crisis analysis
 
+Usage (from the crypto_data_collectors directory):
+    python -m scrapers.platforms.cryptocompare_free
+
 Author: Clement MUGISHA
 """
 
+import logging
 import os
-import sys
-import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 import pandas as pd
 import requests
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from scrapers.platforms.base import BaseHTTPScraper
+from utils.logging_utils import queued_logging
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
 
-from utils.csv_data_manager import CSVDataManager
+# How long cached current prices are reused (seconds); closed daily bars never
+# change and are cached per day without expiry
+PRICE_TTL = 60
+DAY_SECONDS = 24 * 3600
 
 
-class CryptoCompareScraper:
+class CryptoCompareScraper(BaseHTTPScraper):
     """
     Scraper for CryptoCompare cryptocurrency price data (free tier, no auth required).
     """
 
-    def __init__(self):
-        self.base_url = "https://min-api.cryptocompare.com/data"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
+    def __init__(self, session: requests.Session = None, rate_limiter: TokenBucket = None):
+        """
+        Initialize the scraper.
+
+        Parameters:
+        -----------
+        session : requests.Session, optional
+            Shared pooled session (see utils.http_session); a new one is
+            created when omitted
+        rate_limiter : TokenBucket, optional
+            Request budget for min-api.cryptocompare.com; defaults to
+            30 req/s with bursts of 30
+        """
+        super().__init__(
+            "https://min-api.cryptocompare.com/data",
+            name="cryptocompare",
+            # The free tier allows short per-second bursts well under its monthly cap
+            rate_limiter=rate_limiter or TokenBucket(rate=30, capacity=30),
+            session=session,
         )
-        self.csv_manager = CSVDataManager()
+        # API endpoints, built once
+        self.endpoints = {
+            "pricemulti": f"{self.base_url}/pricemulti",
+            "histoday": f"{self.base_url}/histoday",
+        }
+
+        # Per-pair history files live outside the analysis folder
+        self.history_dir = "data/historical/cryptocompare"
+        os.makedirs(self.history_dir, exist_ok=True)
 
-        # Rate limiting for free tier (conservative approach)
-        self.rate_limit_delay = 1.0
+    def _is_cacheable(self, data: Any) -> bool:
+        """Error payloads come back with HTTP 200; never cache them."""
+        return data.get("Response") != "Error"
 
     def get_current_prices(
         self, cryptocurrencies: List[str], fiat_currencies: List[str]
@@ -66,45 +96,35 @@ class CryptoCompareScraper:
             Price data for each crypto/fiat pair
         """
 
-        results = {}
+        # Every pair in one round-trip: {crypto: {fiat: price}}
+        url = self.endpoints["pricemulti"]
+        params = {"fsyms": ",".join(cryptocurrencies), "tsyms": ",".join(fiat_currencies)}
 
-        for crypto in cryptocurrencies:
-            fiat_list = ",".join(fiat_currencies)
-
-            url = f"{self.base_url}/price"
-            params = {"fsym": crypto, "tsyms": fiat_list}
-
-            try:
-                print(f"🔍 Fetching {crypto} prices vs {fiat_list}")
-                response = self.session.get(url, params=params, timeout=15)
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Check for error response
-                if "Response" in data and data["Response"] == "Error":
-                    print(
-                        f"❌ CryptoCompare error for {crypto}: {data.get('Message', 'Unknown error')}"
-                    )
-                    continue
-
-                results[crypto] = {
-                    "prices": data,
-                    "timestamp": datetime.now().isoformat(),
-                    "source": "cryptocompare",
-                }
+        try:
+            logger.info("🔍 Fetching %s prices vs %s", params["fsyms"], params["tsyms"])
+            data = self._get_json(url, params, ttl=PRICE_TTL)
 
-                print(f"✅ Got {crypto} prices in {len(data)} currencies")
+            # Check for error response
+            if data.get("Response") == "Error":
+                logger.error("❌ CryptoCompare error: %s", data.get("Message", "Unknown error"))
+                return {}
 
-                # Rate limiting
-                time.sleep(self.rate_limit_delay)
+            # Reshape into one entry per crypto, as callers expect
+            timestamp = datetime.now().isoformat()
+            results = {
+                crypto: {"prices": prices, "timestamp": timestamp, "source": "cryptocompare"}
+                for crypto, prices in data.items()
+                if prices
+            }
 
-            except requests.exceptions.RequestException as e:
-                print(f"❌ Network error fetching {crypto} prices: {e}")
-            except Exception as e:
-                print(f"❌ Error fetching {crypto} prices: {e}")
+            logger.info("✅ Got prices for %s cryptocurrencies", len(results))
+            return results
 
-        return results
+        except requests.exceptions.RequestException as e:
+            logger.error("❌ Network error fetching CryptoCompare prices: %s", e)
+        except Exception as e:
+            logger.error("❌ Error fetching CryptoCompare prices: %s", e)
+        return {}
 
     def get_historical_daily(self, crypto: str, fiat: str, days: int = 30) -> Dict[str, Any]:
         """
@@ -125,39 +145,59 @@ class CryptoCompareScraper:
             Historical price data
         """
 
-        url = f"{self.base_url}/histoday"
+        url = self.endpoints["histoday"]
+
+        # Daily bars are keyed by their UTC midnight; every bar before today's is closed
+        today = int(datetime.now(timezone.utc).timestamp()) // DAY_SECONDS * DAY_SECONDS
+        wanted = [today - i * DAY_SECONDS for i in range(min(days, 2001) - 1, -1, -1)]
+
+        # Closed bars cached by earlier runs: {"<bar time>": bar}
+        bars_key = f"histoday_{crypto}_{fiat}"
+        bars = self.cache.get(bars_key) or {}
+        # Today's bar is still open, so it is always refetched when it is wanted
+        oldest_missing = next((t for t in wanted if t == today or str(t) not in bars), None)
+        if oldest_missing is None:
+            logger.warning("⚠️  No days of %s/%s history requested (days=%s)", crypto, fiat, days)
+            return {}
+
         params = {
             "fsym": crypto,
             "tsym": fiat,
-            "limit": min(days - 1, 2000),  # API uses limit as days-1
+            # API uses limit as days-1; only reach back to the oldest uncached bar
+            "limit": max((today - oldest_missing) // DAY_SECONDS, 1),
         }
 
         try:
-            print(f"🔍 Fetching {days} days of {crypto}/{fiat} history")
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-
-            data = response.json()
+            logger.info("🔍 Fetching %s days of %s/%s history", days, crypto, fiat)
+            # Closed bars are cached individually below, so skip the response cache
+            data = self._fetch_json(url, params)
 
             if data.get("Response") == "Error":
-                print(f"❌ CryptoCompare error: {data.get('Message', 'Unknown error')}")
+                logger.error("❌ CryptoCompare error: %s", data.get("Message", "Unknown error"))
                 return {}
 
+            fresh = {str(bar["time"]): bar for bar in data.get("Data", [])}
+            closed = {t: bar for t, bar in fresh.items() if int(t) < today and t not in bars}
+            if closed:
+                self.cache.put(bars_key, {**bars, **closed})
+            bars = {**bars, **fresh}
+            history = [bars[str(t)] for t in wanted if str(t) in bars]
+
             result = {
                 "crypto": crypto,
                 "fiat": fiat,
                 "days_requested": days,
-                "data_points": len(data.get("Data", [])),
-                "historical_data": data.get("Data", []),
+                "data_points": len(history),
+                "historical_data": history,
                 "timestamp": datetime.now().isoformat(),
                 "source": "cryptocompare",
             }
 
-            print(f"✅ Retrieved {result['data_points']} daily price points")
+            logger.info("✅ Retrieved %s daily price points", result["data_points"])
             return result
 
         except Exception as e:
-            print(f"❌ Error fetching historical data: {e}")
+            logger.error("❌ Error fetching historical data: %s", e)
             return {}
 
     def get_exchange_prices(self, crypto: str, fiat: str, exchange: str = None) -> Dict[str, Any]:
@@ -180,7 +220,9 @@ class CryptoCompareScraper:
         """
 
         # Skip exchange-specific data - requires premium API
-        print(f"🔍 Skipping exchange-specific data for {crypto}/{fiat} (requires premium API)")
+        logger.info(
+            "🔍 Skipping exchange-specific data for %s/%s (requires premium API)", crypto, fiat
+        )
         return {}
 
     def collect_crisis_context_data(self) -> Dict[str, Any]:
@@ -193,8 +235,8 @@ class CryptoCompareScraper:
             Collection results with price data
         """
 
-        print("\n🌍 CRYPTOCOMPARE: Collecting crisis context data")
-        print("-" * 50)
+        logger.info("🌍 CRYPTOCOMPARE: Collecting crisis context data")
+        logger.info("-" * 50)
 
         # Target cryptocurrencies
         cryptocurrencies = ["BTC", "ETH", "USDT", "USDC"]
@@ -202,8 +244,11 @@ class CryptoCompareScraper:
         # Target fiat currencies (crisis countries + major currencies)
         fiat_currencies = ["USD", "EUR", "ARS", "VES"]  # Start with supported ones
 
+        # One clock read names the price file and stamps the results of this collection
+        now = datetime.now()
+
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "source": "cryptocompare",
             "current_prices": {},
             "historical_data": {},
@@ -211,117 +256,117 @@ class CryptoCompareScraper:
             "errors": [],
         }
 
-        try:
-            # 1. Get current prices for all crypto/fiat pairs
-            print("💰 Fetching current cryptocurrency prices...")
-            current_prices = self.get_current_prices(cryptocurrencies, fiat_currencies)
-            results["current_prices"] = current_prices
-
-            if current_prices:
-                # Save current prices
-                self._save_current_prices_to_csv(current_prices)
-
-            # 2. Get historical data for supported pairs only (last 30 days)
-            print("📊 Fetching historical price data...")
-            # Only use pairs that CryptoCompare definitely supports
-            key_pairs = [
-                ("BTC", "USD"),
-                ("USDT", "USD"),
-                ("BTC", "EUR"),  # More likely to be supported than ARS
-                ("ETH", "USD"),  # Alternative to problematic pairs
-            ]
-
-            for crypto, fiat in key_pairs:
-                print(f"📈 Getting 30-day history for {crypto}/{fiat}...")
-                historical = self.get_historical_daily(crypto, fiat, 30)
-                if historical:
-                    results["historical_data"][f"{crypto}_{fiat}"] = historical
-                    # Save historical data to proper folder
-                    self._save_historical_data_to_csv(historical, crypto, fiat)
-                else:
-                    print(f"⚠️  {crypto}/{fiat} historical data not available")
+        # Historical data for supported pairs only (last 30 days); only use pairs
+        # that CryptoCompare definitely supports
+        key_pairs = [
+            ("BTC", "USD"),
+            ("USDT", "USD"),
+            ("BTC", "EUR"),  # More likely to be supported than ARS
+            ("ETH", "USD"),  # Alternative to problematic pairs
+        ]
 
-                time.sleep(self.rate_limit_delay)
+        try:
+            # Current prices and every history are independent, so dispatch them
+            # together (the bucket keeps the pace); results are saved as they arrive
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                logger.info("💰 Fetching current cryptocurrency prices...")
+                prices_future = executor.submit(
+                    self.get_current_prices, cryptocurrencies, fiat_currencies
+                )
+
+                logger.info("📊 Fetching historical price data...")
+                futures = {}
+                for crypto, fiat in key_pairs:
+                    logger.info("📈 Getting 30-day history for %s/%s...", crypto, fiat)
+                    future = executor.submit(self.get_historical_daily, crypto, fiat, 30)
+                    futures[future] = (crypto, fiat)
+
+                # 1. Current prices for all crypto/fiat pairs
+                current_prices = prices_future.result()
+                results["current_prices"] = current_prices
+
+                if current_prices:
+                    # Save current prices
+                    self._save_current_prices_to_csv(current_prices, now.strftime("%Y-%m-%d"))
+
+                # 2. Historical data
+                for future in as_completed(futures):
+                    crypto, fiat = futures[future]
+                    historical = future.result()
+                    if historical:
+                        results["historical_data"][f"{crypto}_{fiat}"] = historical
+                        # Save historical data to proper folder
+                        self._save_historical_data_to_csv(historical, crypto, fiat)
+                    else:
+                        logger.warning("⚠️  %s/%s historical data not available", crypto, fiat)
 
             # 3. Skip exchange-specific data (requires premium API)
-            print("🏪 Skipping exchange-specific data (premium API required)")
+            logger.info("🏪 Skipping exchange-specific data (premium API required)")
             results["exchange_data"] = {}
 
-            print("✅ CryptoCompare data collection complete!")
-            print(f"   💰 Current prices: {len(results['current_prices'])} cryptocurrencies")
-            print(f"   📊 Historical datasets: {len(results['historical_data'])} pairs")
-            print(f"   🏪 Exchange data: {len(results['exchange_data'])} pairs")
+            logger.info("✅ CryptoCompare data collection complete!")
+            logger.info("   💰 Current prices: %s cryptocurrencies", len(results["current_prices"]))
+            logger.info("   📊 Historical datasets: %s pairs", len(results["historical_data"]))
+            logger.info("   🏪 Exchange data: %s pairs", len(results["exchange_data"]))
 
             return results
 
         except Exception as e:
             error_msg = f"Error in CryptoCompare collection: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             results["errors"].append(error_msg)
             return results
 
-    def _save_current_prices_to_csv(self, price_data: Dict[str, Any]):
+    def _save_current_prices_to_csv(self, price_data: Dict[str, Any], date_str: str):
         """Save current price data to CSV."""
         try:
-            import pandas as pd
-
-            rows = []
-            for crypto, crypto_data in price_data.items():
-                timestamp = crypto_data["timestamp"]
-                for fiat, price in crypto_data["prices"].items():
-                    rows.append(
-                        {
-                            "timestamp": timestamp,
-                            "cryptocurrency": crypto,
-                            "fiat_currency": fiat,
-                            "price": price,
-                            "source": "cryptocompare",
-                        }
-                    )
+            # Plain tuples in one pass; pandas builds the columns and broadcasts the source
+            rows = [
+                (crypto_data["timestamp"], crypto, fiat, price)
+                for crypto, crypto_data in price_data.items()
+                for fiat, price in crypto_data["prices"].items()
+            ]
 
             if rows:
-                df = pd.DataFrame(rows)
-                filename = f"cryptocompare_prices_{datetime.now().strftime('%Y-%m-%d')}.csv"
-                filepath = f"data/analysis/{filename}"
-                os.makedirs(os.path.dirname(filepath), exist_ok=True)
-                df.to_csv(filepath, index=False)
-                print(f"💾 Saved {len(rows)} price records to {filename}")
+                df = pd.DataFrame(
+                    rows, columns=["timestamp", "cryptocurrency", "fiat_currency", "price"]
+                ).assign(source="cryptocompare")
+                self._save_csv(df, f"cryptocompare_prices_{date_str}.csv", "price records")
 
         except Exception as e:
-            print(f"❌ Error saving prices to CSV: {e}")
+            logger.error("❌ Error saving prices to CSV: %s", e)
 
     def _save_historical_data_to_csv(self, historical_data: Dict[str, Any], crypto: str, fiat: str):
         """Save historical data to proper historical folder."""
         try:
             if "historical_data" in historical_data and historical_data["historical_data"]:
-                rows = []
-                for daily_data in historical_data["historical_data"]:
-                    rows.append(
-                        {
-                            "date": datetime.fromtimestamp(daily_data["time"]).strftime("%Y-%m-%d"),
-                            "crypto": crypto,
-                            "fiat": fiat,
-                            "open": daily_data["open"],
-                            "high": daily_data["high"],
-                            "low": daily_data["low"],
-                            "close": daily_data["close"],
-                            "volume": daily_data["volumeto"],
-                            "source": "cryptocompare",
-                        }
-                    )
-
-                if rows:
-                    df = pd.DataFrame(rows)
-                    # Save to historical/cryptocompare folder
-                    date_str = datetime.now().strftime("%Y-%m-%d")
-                    filename = f"{crypto}_{fiat}_historical_{date_str}.csv"
-                    filepath = f"data/historical/cryptocompare/{filename}"
-                    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-                    df.to_csv(filepath, index=False)
-                    print(f"💾 Saved {len(rows)} historical records to {filepath}")
+                bars = pd.DataFrame(historical_data["historical_data"])
+                # Bars are stamped at UTC midnight, so convert the whole column in UTC
+                df = pd.DataFrame(
+                    {
+                        "date": pd.to_datetime(bars["time"], unit="s").dt.strftime("%Y-%m-%d"),
+                        "crypto": crypto,
+                        "fiat": fiat,
+                        "open": bars["open"],
+                        "high": bars["high"],
+                        "low": bars["low"],
+                        "close": bars["close"],
+                        "volume": bars["volumeto"],
+                        "source": "cryptocompare",
+                    }
+                )
+
+                # One growing file per pair in historical/cryptocompare: merge with what
+                # earlier runs saved, keeping the latest values for overlapping days
+                filepath = os.path.join(self.history_dir, f"{crypto}_{fiat}_historical.csv")
+                if os.path.exists(filepath):
+                    df = pd.concat([pd.read_csv(filepath, dtype={"date": str}), df])
+                    df = df.drop_duplicates(subset="date", keep="last").sort_values("date")
+                df.to_csv(filepath, index=False)
+                logger.info("💾 Saved %s historical records to %s", len(df), filepath)
 
         except Exception as e:
-            print(f"❌ Error saving historical data to CSV: {e}")
+            logger.error("❌ Error saving historical data to CSV: %s", e)
 
 
 def test_cryptocompare_scraper():
@@ -349,4 +394,5 @@ def test_cryptocompare_scraper():
 
 
 if __name__ == "__main__":
-    test_cryptocompare_scraper()
+    with queued_logging():
+        test_cryptocompare_scraper()
@@ -11,23 +11,69 @@ Public endpoints available:
 - /sell-bitcoins-online/{country}/.json - Sell offers by country
 - /bitcoins/trades/{currency}/.json - Recent trades (limited)
 
+Usage (from the crypto_data_collectors directory):
+    python -m scrapers.platforms.localbitcoins_public
+
 Author: Clement MUGISHA
 """
 
-import json
+import logging
 import os
-import sys
-import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List
+from itertools import chain
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
+import orjson
 import requests
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from utils.country_profiles import load_profiles
 from utils.csv_data_manager import CSVDataManager
+from utils.http_session import create_session
+from utils.logging_utils import queued_logging
+from utils.rate_limiter import TokenBucket
+from utils.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# How long cached ad lists are reused before refetching (seconds)
+RESPONSE_TTL = 300
+
+# Oldest cached ad list still served when a request fails (seconds); older
+# copies would be saved under this run's timestamp as if they were current
+STALE_MAX_AGE = 6 * RESPONSE_TTL
+
+# Display names for the target countries, built once rather than per lookup
+COUNTRY_NAMES = {
+    "SD": "Sudan",
+    "AF": "Afghanistan",
+    "VE": "Venezuela",
+    "NG": "Nigeria",
+    "ZW": "Zimbabwe",
+    "AR": "Argentina",
+}
+
+
+def _safe_float(value) -> float:
+    """Safely convert value to float."""
+    if value is None:
+        return 0.0
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _safe_int(value) -> int:
+    """Safely convert value to int."""
+    if value is None:
+        return 0
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
 
 
 class LocalBitcoinsPublicScraper:
@@ -35,9 +81,20 @@ class LocalBitcoinsPublicScraper:
     Scraper for LocalBitcoins public P2P Bitcoin data (no authentication required).
     """
 
-    def __init__(self):
+    def __init__(self, rate_limiter: TokenBucket = None):
+        """
+        Initialize the scraper.
+
+        Parameters:
+        -----------
+        rate_limiter : TokenBucket, optional
+            Request budget for localbitcoins.com; defaults to one request
+            per second with bursts of 2
+        """
         self.base_url = "https://localbitcoins.com"
-        self.session = requests.Session()
+        # Pooled keep-alive session with compression and retries; it is private
+        # to this scraper, so the headers below are set on it directly
+        self.session = create_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -45,6 +102,15 @@ class LocalBitcoinsPublicScraper:
         )
         self.csv_manager = CSVDataManager()
 
+        # Paces every request across country workers instead of sleeping
+        # between countries, so politeness no longer serializes the run
+        self._bucket = rate_limiter or TokenBucket(rate=1, capacity=2)
+        self.max_workers = 4
+
+        # Responses persisted across runs, so re-runs within RESPONSE_TTL skip
+        # the network and an outage falls back to the last good copy
+        self.cache = ResponseCache(self.csv_manager.base_dir / "cache" / "http", "localbitcoins")
+
     def get_country_ads(self, country_code: str, trade_type: str = "both") -> List[Dict[str, Any]]:
         """
         Get P2P Bitcoin ads for a specific country.
@@ -62,17 +128,16 @@ class LocalBitcoinsPublicScraper:
             List of P2P advertisement dictionaries
         """
 
-        all_ads = []
-
-        if trade_type in ["buy", "both"]:
-            buy_ads = self._get_ads_by_type(country_code, "buy")
-            all_ads.extend(buy_ads)
+        trade_types = [t for t in ["buy", "sell"] if trade_type in [t, "both"]]
 
-        if trade_type in ["sell", "both"]:
-            sell_ads = self._get_ads_by_type(country_code, "sell")
-            all_ads.extend(sell_ads)
+        # Buy and sell lists are independent requests; fetch them together
+        with ThreadPoolExecutor(max_workers=len(trade_types) or 1) as executor:
+            ads_by_type = list(
+                executor.map(lambda t: self._get_ads_by_type(country_code, t), trade_types)
+            )
 
-        return all_ads
+        # Concatenate at C level rather than re-appending ad by ad
+        return list(chain.from_iterable(ads_by_type))
 
     def _get_ads_by_type(self, country_code: str, trade_type: str) -> List[Dict[str, Any]]:
         """Get ads for specific trade type."""
@@ -83,46 +148,52 @@ class LocalBitcoinsPublicScraper:
             url = f"{self.base_url}/sell-bitcoins-online/{country_code}/.json"
 
         try:
-            print(f"🔍 Fetching {trade_type.upper()} ads from LocalBitcoins for {country_code}...")
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-
-            data = response.json()
+            logger.info(
+                "🔍 Fetching %s ads from LocalBitcoins for %s...", trade_type.upper(), country_code
+            )
+            data = self._fetch_json(url)
 
             # Extract ads from response
             ads = []
             if "data" in data and "ad_list" in data["data"]:
                 raw_ads = data["data"]["ad_list"]
-                print(f"📊 Found {len(raw_ads)} {trade_type} ads")
+                logger.info("📊 Found %s %s ads", len(raw_ads), trade_type)
+
+                # One collection time for the whole response, not a clock read per ad
+                now = datetime.now()
+                timestamp = now.isoformat()
+                collection_date = now.strftime("%Y-%m-%d")
+                side = trade_type.upper()
 
                 for raw_ad in raw_ads:
                     ad_data = raw_ad.get("data", {})
+                    profile = ad_data.get("profile", {})
+                    location = ad_data.get("location_string", "")
+                    online_provider = ad_data.get("online_provider", "")
 
-                    # Extract key information
+                    # Extract key information under the shared ad schema names
                     processed_ad = {
                         "platform": "localbitcoins",
                         "country_code": country_code,
                         "asset": "BTC",
                         "fiat": ad_data.get("currency", "USD"),
-                        "trade_type": trade_type.upper(),
-                        "price": self._safe_float(ad_data.get("temp_price")),
-                        "min_amount": self._safe_float(ad_data.get("min_amount")),
-                        "max_amount": self._safe_float(ad_data.get("max_amount")),
-                        "payment_method": ad_data.get("online_provider", ""),
+                        "trade_type": side,
+                        "price": _safe_float(ad_data.get("temp_price")),
+                        "min_amount": _safe_float(ad_data.get("min_amount")),
+                        "max_amount": _safe_float(ad_data.get("max_amount")),
+                        "payment_methods": [online_provider] if online_provider else [],
                         "payment_method_detail": ad_data.get("msg", ""),
-                        "advertiser": ad_data.get("profile", {}).get("username", ""),
-                        "advertiser_trades": self._safe_int(
-                            ad_data.get("profile", {}).get("trade_count")
-                        ),
-                        "advertiser_feedback": self._safe_float(
-                            ad_data.get("profile", {}).get("feedback_score")
-                        ),
+                        "advertiser_name": profile.get("username", ""),
+                        "order_count": _safe_int(profile.get("trade_count")),
+                        # Feedback score (0-100) is the closest match to the
+                        # other platforms' completion rate (0-1)
+                        "completion_rate": _safe_float(profile.get("feedback_score")) / 100,
                         "ad_id": ad_data.get("ad_id", ""),
                         "created_at": ad_data.get("created_at", ""),
-                        "is_local_office": ad_data.get("location_string", "") != "",
-                        "location": ad_data.get("location_string", ""),
-                        "timestamp": datetime.now().isoformat(),
-                        "collection_date": datetime.now().strftime("%Y-%m-%d"),
+                        "is_local_office": location != "",
+                        "location": location,
+                        "timestamp": timestamp,
+                        "collection_date": collection_date,
                     }
 
                     ads.append(processed_ad)
@@ -130,28 +201,42 @@ class LocalBitcoinsPublicScraper:
             return ads
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Network error fetching {trade_type} ads for {country_code}: {e}")
+            logger.error("❌ Network error fetching %s ads for %s: %s", trade_type, country_code, e)
             return []
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON decode error for {country_code}: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error("❌ JSON decode error for %s: %s", country_code, e)
             return []
         except Exception as e:
-            print(f"❌ Unexpected error for {country_code}: {e}")
+            logger.error("❌ Unexpected error for %s: %s", country_code, e)
             return []
 
-    def _safe_float(self, value):
-        """Safely convert value to float."""
-        try:
-            return float(value) if value is not None else 0.0
-        except (ValueError, TypeError):
-            return 0.0
+    def _fetch_json(self, url: str) -> Any:
+        """
+        GET a JSON endpoint through the response cache.
+
+        Responses younger than RESPONSE_TTL are reused without a request. If
+        the request fails, a cached copy up to STALE_MAX_AGE old is returned
+        instead (stale-if-error); the error is re-raised when there is none.
+        """
+        key = ResponseCache.make_key(url)
+        data = self.cache.get(key, ttl=RESPONSE_TTL)
+        if data is not None:
+            return data
 
-    def _safe_int(self, value):
-        """Safely convert value to int."""
         try:
-            return int(value) if value is not None else 0
-        except (ValueError, TypeError):
-            return 0
+            self._bucket.acquire()
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            stale = self.cache.get(key, ttl=STALE_MAX_AGE)
+            if stale is None:
+                raise
+            logger.warning("⚠️  %s - using cached response for %s", e, url)
+            return stale
+
+        self.cache.put(key, data)
+        return data
 
     def collect_country_data(self, country_code: str) -> Dict[str, Any]:
         """
@@ -163,72 +248,84 @@ class LocalBitcoinsPublicScraper:
             Collection results with ads and metadata
         """
 
-        print(f"\n🌍 LOCALBITCOINS: Collecting data for {country_code}")
-        print("-" * 50)
-
-        # Get all ads for country
-        ads = self.get_country_ads(country_code, "both")
+        ads, result = self._collect_country(country_code)
 
         if ads:
             # Save to CSV
-            filename = f"localbitcoins_p2p_{country_code}_{datetime.now().strftime('%Y-%m-%d')}.csv"
-            self.csv_manager.save_raw_ads(ads, filename)
-
-            # Log collection
-            self.csv_manager.log_collection_run(
-                platform="localbitcoins",
-                country_name=self._get_country_name(country_code),
-                ads_collected=len(ads),
+            collection_id = self.csv_manager.generate_collection_id()
+            filepath = self.csv_manager.save_raw_ads(
+                ads, "localbitcoins", country_code, collection_id
             )
+            result["filename"] = os.path.basename(filepath)
+            self._log_run(country_code, ads, result, collection_id)
 
-            # Calculate summary stats
-            buy_ads = [ad for ad in ads if ad["trade_type"] == "BUY"]
-            sell_ads = [ad for ad in ads if ad["trade_type"] == "SELL"]
-
-            print(f"✅ Collected {len(ads)} ads for {country_code}")
-            print(f"   📈 Buy ads: {len(buy_ads)}")
-            print(f"   📉 Sell ads: {len(sell_ads)}")
-
-            if ads:
-                avg_price = sum(ad["price"] for ad in ads if ad["price"] > 0) / len(
-                    [ad for ad in ads if ad["price"] > 0]
-                )
-                print(f"   💰 Average price: {avg_price:.2f} {ads[0]['fiat']}")
-
-                # Payment method analysis
-                payment_methods = [ad["payment_method"] for ad in ads if ad["payment_method"]]
-                unique_methods = set(payment_methods)
-                print(f"   🏦 Payment methods: {len(unique_methods)} unique")
-                if unique_methods:
-                    print(f"      Top methods: {list(unique_methods)[:3]}")
-
-            return {
-                "success": True,
-                "ads_collected": len(ads),
-                "buy_ads": len(buy_ads),
-                "sell_ads": len(sell_ads),
-                "filename": filename,
-                "payment_methods": len(
-                    set(ad["payment_method"] for ad in ads if ad["payment_method"])
-                ),
-            }
-        else:
-            print(f"❌ No ads found for {country_code}")
+        return result
+
+    def _collect_country(self, country_code: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Fetch a country's ads and summarize them, without saving anything."""
+
+        logger.info("🌍 LOCALBITCOINS: Collecting data for %s", country_code)
+        logger.info("-" * 50)
+
+        # Get all ads for country
+        ads = self.get_country_ads(country_code, "both")
+
+        if not ads:
+            logger.error("❌ No ads found for %s", country_code)
             # Note: LocalBitcoins may not support all countries or API might be deprecated
 
-            return {"success": False, "ads_collected": 0, "error": "No ads found"}
+            return ads, {"success": False, "ads_collected": 0, "error": "No ads found"}
+
+        # Summary stats from one pass over the ads plus a vectorized mean
+        buy_count = sum(1 for ad in ads if ad["trade_type"] == "BUY")
+        sell_count = len(ads) - buy_count
+        prices = np.fromiter((ad["price"] for ad in ads), dtype=np.float64, count=len(ads))
+        payment_methods = Counter(chain.from_iterable(ad["payment_methods"] for ad in ads))
+
+        logger.info("✅ Collected %s ads for %s", len(ads), country_code)
+        logger.info("   📈 Buy ads: %s", buy_count)
+        logger.info("   📉 Sell ads: %s", sell_count)
+
+        priced = prices[prices > 0]
+        if priced.size:
+            logger.info("   💰 Average price: %.2f %s", priced.mean(), ads[0]["fiat"])
+
+        # Payment method analysis
+        logger.info("   🏦 Payment methods: %s unique", len(payment_methods))
+        if payment_methods:
+            top_methods = [method for method, _ in payment_methods.most_common(3)]
+            logger.info("      Top methods: %s", top_methods)
+
+        return ads, {
+            "success": True,
+            "ads_collected": len(ads),
+            "buy_ads": buy_count,
+            "sell_ads": sell_count,
+            "payment_methods": len(payment_methods),
+        }
+
+    def _log_run(
+        self,
+        country_code: str,
+        ads: List[Dict[str, Any]],
+        result: Dict[str, Any],
+        collection_id: str,
+    ):
+        """Record a successful country collection in the collection log."""
+        self.csv_manager.log_collection_run(
+            platform="localbitcoins",
+            country_code=country_code,
+            country_name=self._get_country_name(country_code),
+            fiat_currency=ads[0]["fiat"],
+            ads_collected=result["ads_collected"],
+            buy_ads=result["buy_ads"],
+            sell_ads=result["sell_ads"],
+            collection_id=collection_id,
+        )
 
     def _get_country_name(self, country_code: str) -> str:
         """Get country name from code."""
-        country_map = {
-            "SD": "Sudan",
-            "AF": "Afghanistan",
-            "VE": "Venezuela",
-            "NG": "Nigeria",
-            "ZW": "Zimbabwe",
-            "AR": "Argentina",
-        }
-        return country_map.get(country_code, country_code)
+        return COUNTRY_NAMES.get(country_code, country_code)
 
     def collect_all_countries(self) -> Dict[str, Any]:
         """
@@ -243,8 +340,8 @@ class LocalBitcoinsPublicScraper:
         # Load countries using the available function
         countries = load_profiles()
 
-        print("🌍 LOCALBITCOINS P2P DATA COLLECTION")
-        print("=" * 50)
+        logger.info("🌍 LOCALBITCOINS P2P DATA COLLECTION")
+        logger.info("=" * 50)
 
         results = {
             "platform": "localbitcoins",
@@ -255,29 +352,52 @@ class LocalBitcoinsPublicScraper:
             "errors": [],
         }
 
-        for country in countries:
-            try:
-                country_code = country["country_code"]
-                result = self.collect_country_data(country_code)
-                results["country_results"][country_code] = result
-                results["countries_processed"] += 1
-
-                if result["success"]:
-                    results["total_ads"] += result["ads_collected"]
-                    results["countries_successful"] += 1
-
-                # Rate limiting - be nice to the API
-                time.sleep(2)
-
-            except Exception as e:
-                error_msg = f"Error collecting {country.get('country_code', 'unknown')}: {e}"
-                print(f"❌ {error_msg}")
-                results["errors"].append(error_msg)
-
-        print("\n🎉 LOCALBITCOINS COLLECTION COMPLETE!")
-        print(f"📊 Total ads: {results['total_ads']}")
-        print(
-            f"🌍 Countries successful: {results['countries_successful']}/{results['countries_processed']}"
+        # Ads from every country, written in one batch once collection is done
+        all_ads = []
+        country_ads = {}
+
+        # Countries run concurrently; the token bucket keeps the request rate polite
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._collect_country, country["country_code"]): country
+                for country in countries
+            }
+
+            for future in as_completed(futures):
+                country = futures[future]
+                try:
+                    country_code = country["country_code"]
+                    ads, result = future.result()
+                    results["country_results"][country_code] = result
+                    results["countries_processed"] += 1
+
+                    if result["success"]:
+                        results["total_ads"] += result["ads_collected"]
+                        results["countries_successful"] += 1
+                        all_ads.extend(ads)
+                        country_ads[country_code] = ads
+
+                except Exception as e:
+                    error_msg = f"Error collecting {country.get('country_code', 'unknown')}: {e}"
+                    logger.error("❌ %s", error_msg)
+                    results["errors"].append(error_msg)
+
+        if all_ads:
+            collection_id = self.csv_manager.generate_collection_id()
+            results["files"] = self.csv_manager.save_raw_ads_batch(
+                all_ads, "localbitcoins", collection_id
+            )
+
+            for country_code, ads in country_ads.items():
+                result = results["country_results"][country_code]
+                self._log_run(country_code, ads, result, collection_id)
+
+        logger.info("🎉 LOCALBITCOINS COLLECTION COMPLETE!")
+        logger.info("📊 Total ads: %s", results["total_ads"])
+        logger.info(
+            "🌍 Countries successful: %s/%s",
+            results["countries_successful"],
+            results["countries_processed"],
         )
 
         return results
@@ -305,4 +425,5 @@ def test_localbitcoins_scraper():
 
 
 if __name__ == "__main__":
-    test_localbitcoins_scraper()
+    with queued_logging():
+        test_localbitcoins_scraper()
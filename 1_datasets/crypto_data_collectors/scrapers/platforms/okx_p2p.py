@@ -15,24 +15,29 @@ Features:
 - Rate limiting and error handling
 - Integration with crisis timeline analysis
 
+Usage (from the crypto_data_collectors directory):
+    python -m scrapers.platforms.okx_p2p
+
 Author: Clement MUGISHA
 License: MIT
 """
 
 import json
-import os
-import sys
-import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List
 
+import orjson
 import requests
 
-# Add project root to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from utils.country_profiles import get_profile_by_country_code
 from utils.csv_data_manager import CSVDataManager
+from utils.http_session import create_session
+from utils.logging_utils import queued_logging
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
 
 
 class OKXPPScraper:
@@ -40,7 +45,16 @@ class OKXPPScraper:
     Scraper for OKX P2P market data using their public API.
     """
 
-    def __init__(self):
+    def __init__(self, rate_limiter: TokenBucket = None):
+        """
+        Initialize the scraper.
+
+        Parameters:
+        -----------
+        rate_limiter : TokenBucket, optional
+            Request budget for www.okx.com; defaults to one request per
+            second with bursts of 3
+        """
         # Updated OKX P2P endpoint - trying different potential URLs
         self.base_urls = [
             "https://www.okx.com/api/v5/mktdata/exchange-rate",  # Official API
@@ -48,7 +62,11 @@ class OKXPPScraper:
             "https://www.okx.com/v3/c2c/tradingOrders/getOrders",  # Original attempt
             "https://www.okx.com/api/v5/market/exchange-rate",  # Alternative
         ]
-        self.session = requests.Session()
+        # First endpoint that answered with data; later calls go straight to it
+        self._working_url = None
+        # Pooled keep-alive session with compression and retries; it is private
+        # to this scraper, so the headers below are set on it directly
+        self.session = create_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -60,6 +78,11 @@ class OKXPPScraper:
         )
         self.csv_manager = CSVDataManager()
 
+        # Pages fetched per trade type (20 ads each); page requests run concurrently and the
+        # bucket keeps them to the old one-per-second pace without sleeping
+        self.max_pages = 3
+        self._bucket = rate_limiter or TokenBucket(rate=1, capacity=3)
+
     def get_ads(
         self,
         crypto_currency: str = "USDT",
@@ -101,33 +124,50 @@ class OKXPPScraper:
             "sortType": "1",  # Sort by price
         }
 
-        # Try different endpoints to find working OKX API
-        for i, base_url in enumerate(self.base_urls):
+        # Try the endpoint that last worked first; probe the others only if it fails
+        pinned = self._working_url
+        urls = [pinned] + [u for u in self.base_urls if u != pinned] if pinned else self.base_urls
+
+        for base_url in urls:
+            i = self.base_urls.index(base_url)
             try:
-                print(f"    🔍 Trying OKX endpoint {i + 1}/4: {base_url.split('/')[-1]}...")
+                logger.info(
+                    "    🔍 Trying OKX endpoint %s/4: %s...", i + 1, base_url.split("/")[-1]
+                )
+                self._bucket.acquire()
                 response = self.session.get(base_url, params=params, timeout=15)
 
                 if response.status_code == 200:
-                    data = response.json()
-                    print(
-                        f"    📋 Response structure: {list(data.keys()) if isinstance(data, dict) else type(data)}"
+                    data = orjson.loads(response.content)
+                    logger.info(
+                        "    📋 Response structure: %s",
+                        list(data.keys()) if isinstance(data, dict) else type(data),
                     )
                     if data and ("data" in data or "orders" in data or len(data) > 0):
-                        print(f"    ✅ Success with endpoint {i + 1}")
+                        logger.info("    ✅ Success with endpoint %s", i + 1)
+                        self._working_url = base_url
                         return data
-                    else:
-                        print(f"    ⚠️  Empty response from endpoint {i + 1}")
+                    logger.warning("    ⚠️  Empty response from endpoint %s", i + 1)
+                    if base_url == pinned:
+                        # The endpoint works; there is just nothing for these parameters
+                        return {}
                 else:
-                    print(f"    ❌ Status {response.status_code}")
-
-            except requests.exceptions.RequestException as e:
-                print(f"    ❌ Error: {e}")
+                    logger.error("    ❌ Status %s", response.status_code)
+                    if base_url == pinned:
+                        self._working_url = None
+
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                logger.error("    ❌ Error: %s", e)
+                if base_url == pinned:
+                    self._working_url = None
                 continue
 
-        print("    ⚠️  All OKX endpoints failed")
+        logger.warning("    ⚠️  All OKX endpoints failed")
         return {}
 
-    def standardize_ad(self, ad_data: Dict, country_code: str, trade_type: str) -> Dict[str, Any]:
+    def standardize_ad(
+        self, ad_data: Dict, country_code: str, trade_type: str, timestamp: str = None
+    ) -> Dict[str, Any]:
         """
         Convert OKX API response to standardized format.
 
@@ -139,6 +179,8 @@ class OKXPPScraper:
             ISO country code for location tagging
         trade_type : str
             buy or sell
+        timestamp : str, optional
+            Collection timestamp shared by the whole batch. Defaults to now (UTC).
 
         Returns:
         --------
@@ -149,9 +191,12 @@ class OKXPPScraper:
         # Map OKX trade types to our standard
         standard_trade_type = "BUY" if trade_type.lower() == "buy" else "SELL"
 
+        if timestamp is None:
+            timestamp = datetime.utcnow().isoformat() + "Z"
+
         return {
             "platform": "okx",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": timestamp,
             "asset": ad_data.get("cryptoCurrency", ""),
             "fiat": ad_data.get("fiatCurrency", ""),
             "price": float(ad_data.get("price", 0)),
@@ -200,20 +245,39 @@ class OKXPPScraper:
             # Generate collection ID for this run
             collection_id = self.csv_manager.generate_collection_id()
 
-            # Collect both buy and sell advertisements
-            for trade_type in ["buy", "sell"]:
-                print(
-                    f"Collecting {trade_type.upper()} ads from OKX for {profile['name']} ({fiat})..."
+            # Request every page of both trade types at once (the bucket keeps
+            # the pace), then read each type's pages in order
+            page_keys = [
+                (trade_type, page)
+                for trade_type in ["buy", "sell"]
+                for page in range(1, self.max_pages + 1)
+            ]
+
+            def fetch(req):
+                return self.get_ads(
+                    crypto_currency=asset, fiat_currency=fiat, side=req[0], page=req[1]
                 )
 
-                page = 1
-                while page <= 3:  # Limit to first 3 pages (60 ads max per type)
-                    response = self.get_ads(
-                        crypto_currency=asset,
-                        fiat_currency=fiat,
-                        side=trade_type,
-                        page=page,
-                    )
+            logger.info("Collecting BUY/SELL ads from OKX for %s (%s)...", profile["name"], fiat)
+            pages = {}
+            if self._working_url is None:
+                # Find the working endpoint with one request first, so the page
+                # threads don't each probe every fallback endpoint at once
+                pages[page_keys[0]] = fetch(page_keys[0])
+
+            if self._working_url is None:
+                logger.warning("    ⚠️  No OKX endpoint answered; skipping remaining pages")
+            else:
+                remaining = [key for key in page_keys if key not in pages]
+                with ThreadPoolExecutor(max_workers=len(remaining)) as executor:
+                    pages.update(zip(remaining, executor.map(fetch, remaining)))
+
+            # One collection time for every ad of this run
+            timestamp = datetime.utcnow().isoformat() + "Z"
+
+            for trade_type in ["buy", "sell"]:
+                for page in range(1, self.max_pages + 1):
+                    response = pages.get((trade_type, page))
 
                     if not response or not response.get("data"):
                         break
@@ -224,7 +288,7 @@ class OKXPPScraper:
 
                     # Standardize each advertisement
                     for ad in ads:
-                        standardized = self.standardize_ad(ad, country_code, trade_type)
+                        standardized = self.standardize_ad(ad, country_code, trade_type, timestamp)
                         all_ads.append(standardized)
 
                         if trade_type == "buy":
@@ -232,9 +296,6 @@ class OKXPPScraper:
                         else:
                             sell_count += 1
 
-                    page += 1
-                    time.sleep(1.0)  # Be respectful to the API
-
             # Save to CSV if requested
             if save_to_csv and all_ads:
                 self.csv_manager.save_raw_ads(all_ads, "okx", country_code, collection_id)
@@ -252,13 +313,17 @@ class OKXPPScraper:
                     collection_id=collection_id,
                 )
 
-            print(
-                f"✅ OKX: Collected {len(all_ads)} ads for {profile['name']} (Buy: {buy_count}, Sell: {sell_count})"
+            logger.info(
+                "✅ OKX: Collected %s ads for %s (Buy: %s, Sell: %s)",
+                len(all_ads),
+                profile["name"],
+                buy_count,
+                sell_count,
             )
             return all_ads
 
         except ValueError as e:
-            print(f"❌ OKX Error: {e}")
+            logger.error("❌ OKX Error: %s", e)
             return []
 
     def collect_historical_data(
@@ -286,8 +351,13 @@ class OKXPPScraper:
         if not end_date:
             end_date = datetime.now().strftime("%Y-%m-%d")
 
-        print(f"🕐 Attempting historical collection for {country_code}: {start_date} to {end_date}")
-        print("⚠️  Note: OKX historical data may be limited via public API")
+        logger.info(
+            "🕐 Attempting historical collection for %s: %s to %s",
+            country_code,
+            start_date,
+            end_date,
+        )
+        logger.warning("⚠️  Note: OKX historical data may be limited via public API")
 
         # For now, collect current data as baseline
         # TODO: Implement web scraping for historical data if needed
@@ -352,4 +422,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with queued_logging():
+        main()
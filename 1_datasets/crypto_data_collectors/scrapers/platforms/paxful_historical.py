@@ -17,25 +17,60 @@ Since Paxful is closed, this focuses on:
 2. Cached API responses
 3. Third-party data aggregators
 
+Usage (from the crypto_data_collectors directory):
+    python -m scrapers.platforms.paxful_historical
+
 Author: Clement MUGISHA
 License: MIT
 """
 
 import json
-import os
-import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List
 
-import requests
-from bs4 import BeautifulSoup
-
-# Add project root to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import orjson
+from lxml import etree
 
 from utils.country_profiles import get_profile_by_country_code
 from utils.csv_data_manager import CSVDataManager
+from utils.http_session import create_session
+from utils.rate_limiter import TokenBucket
+from utils.response_cache import ResponseCache
+
+# How long a Wayback CDX snapshot listing is reused (seconds); the archive
+# gains captures slowly, while each snapshot itself is immutable
+CDX_TTL = 7 * 24 * 3600
+
+# Bytes handed to the HTML parser per read while an archived page downloads
+PAGE_CHUNK_SIZE = 64 * 1024
+
+# Offer blocks in archived pages: <div> or <tr> elements carrying one of these
+# classes. Compiled once; the XPath objects are called directly on each page.
+OFFER_CLASSES = ("offer", "advertisement", "trade-offer")
+OFFER_XPATH = etree.XPath(
+    " | ".join(
+        f'//{tag}[contains(concat(" ", normalize-space(@class), " "), " {cls} ")]'
+        for tag in ("div", "tr")
+        for cls in OFFER_CLASSES
+    )
+)
+JSON_SCRIPT_XPATH = etree.XPath('//script[@type="application/json"]/text()')
+
+# Standard field <- (Paxful keys tried in order, default, converter). Paxful
+# renamed fields over the years; the first key present in an offer wins.
+OFFER_FIELDS = (
+    ("asset", ("cryptocurrency", "crypto"), "BTC", None),
+    ("fiat", ("fiat_currency", "currency"), "", None),
+    ("price", ("price", "rate"), 0, float),
+    ("min_amount", ("min_amount", "minimum"), 0, float),
+    ("max_amount", ("max_amount", "maximum"), 0, float),
+    ("available_amount", ("available",), 0, float),
+    ("advertiser_name", ("username", "trader"), "", None),
+    ("completion_rate", ("completion_rate",), 0, float),
+    ("order_count", ("trades", "feedback_score"), 0, int),
+    ("ad_id", ("id", "offer_id"), "", None),
+)
 
 
 class PaxfulHistoricalScraper:
@@ -43,23 +78,40 @@ class PaxfulHistoricalScraper:
     Scraper for historical Paxful P2P market data.
     """
 
-    def __init__(self):
+    def __init__(self, rate_limiter: TokenBucket = None):
+        """
+        Initialize the scraper.
+
+        Parameters:
+        -----------
+        rate_limiter : TokenBucket, optional
+            Request budget for web.archive.org; defaults to one request per
+            second with bursts of 4
+        """
         # Wayback Machine API for archived data
         self.wayback_url = "https://web.archive.org/cdx/search/cdx"
         self.paxful_api_base = "https://paxful.com/rest"  # Historical API endpoints
 
-        self.session = requests.Session()
+        # Pooled keep-alive session with compression and retries; it is private
+        # to this scraper, so the headers below are set on it directly
+        self.session = create_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
             }
         )
         self.csv_manager = CSVDataManager()
 
+        # Snapshot lookups and page fetches overlap across a few workers; the
+        # bucket keeps the combined rate polite instead of sleeping per page
+        self._bucket = rate_limiter or TokenBucket(rate=1, capacity=4)
+        self.max_workers = 4
+
+        # Persisted CDX listings and per-snapshot offers (see CDX_TTL)
+        self.cache = ResponseCache(self.csv_manager.base_dir / "cache" / "http", "wayback")
+
     def get_wayback_snapshots(self, url: str, start_date: str, end_date: str) -> List[str]:
         """
         Get available Wayback Machine snapshots for a URL in date range.
@@ -85,20 +137,29 @@ class PaxfulHistoricalScraper:
             "from": start_date,
             "to": end_date,
             "limit": 50,
+            # Skip consecutive captures whose content did not change
+            "collapse": "digest",
+            # Only the two columns used to build snapshot URLs
+            "fl": "timestamp,original",
         }
 
         try:
-            response = self.session.get(self.wayback_url, params=params, timeout=10)
-            response.raise_for_status()
+            key = ResponseCache.make_key(self.wayback_url, params)
+            data = self.cache.get(key, ttl=CDX_TTL)
+            if data is None:
+                self._bucket.acquire()
+                response = self.session.get(self.wayback_url, params=params, timeout=10)
+                response.raise_for_status()
+
+                data = orjson.loads(response.content)
+                self.cache.put(key, data)
 
-            data = response.json()
             if len(data) > 1:  # First row is headers
-                snapshots = []
-                for row in data[1:]:  # Skip header row
-                    timestamp, original_url = row[1], row[2]
-                    snapshot_url = f"https://web.archive.org/web/{timestamp}/{original_url}"
-                    snapshots.append(snapshot_url)
-                return snapshots
+                # Skip header row; repeated (timestamp, url) rows map to one snapshot
+                snapshots = dict.fromkeys(
+                    f"https://web.archive.org/web/{row[0]}/{row[1]}" for row in data[1:]
+                )
+                return list(snapshots)
 
         except Exception as e:
             print(f"Error fetching Wayback snapshots: {e}")
@@ -122,46 +183,72 @@ class PaxfulHistoricalScraper:
             Extracted offer data
         """
 
+        # Archived snapshots never change, so offers extracted from one are kept
+        # on disk for good and re-runs skip both the download and the parse
+        key = ResponseCache.make_key(snapshot_url, {"country_code": country_code})
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"💾 Using cached offers for {snapshot_url}")
+            return cached
+
         try:
             print(f"🕐 Scraping archived Paxful data: {snapshot_url}")
-            response = self.session.get(snapshot_url, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            offers = []
-
-            # Look for offer data in various possible formats
-            # Paxful used different HTML structures over time
-
-            # Method 1: JSON data in script tags
-            script_tags = soup.find_all("script", type="application/json")
-            for script in script_tags:
-                try:
-                    data = json.loads(script.string)
-                    if "offers" in data or "advertisements" in data:
-                        offers.extend(self._extract_offers_from_json(data, country_code))
-                except Exception:
-                    continue
-
-            # Method 2: HTML table/div parsing
-            offer_containers = soup.find_all(
-                ["div", "tr"], class_=["offer", "advertisement", "trade-offer"]
-            )
-            for container in offer_containers:
-                try:
-                    offer = self._extract_offer_from_html(container, country_code)
-                    if offer:
-                        offers.append(offer)
-                except Exception:
-                    continue
+            self._bucket.acquire()
+            with self.session.get(snapshot_url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+
+                if "json" in response.headers.get("Content-Type", "") or "/rest/" in snapshot_url:
+                    # Archived REST responses are plain JSON: decode them directly
+                    # instead of parsing HTML and hunting through script tags
+                    data = orjson.loads(response.content)
+                    offers = (
+                        self._extract_offers_from_json(data, country_code)
+                        if isinstance(data, dict)
+                        else []
+                    )
+                else:
+                    # Feed lxml's C parser as the body arrives, so a multi-MB page is
+                    # never held whole in memory; raw bytes let it detect the encoding
+                    parser = etree.HTMLParser()
+                    for chunk in response.iter_content(chunk_size=PAGE_CHUNK_SIZE):
+                        parser.feed(chunk)
+                    offers = self._extract_offers_from_page(parser.close(), country_code)
 
             print(f"✅ Extracted {len(offers)} offers from archive")
+            self.cache.put(key, offers)
             return offers
 
         except Exception as e:
             print(f"❌ Error scraping archived data: {e}")
             return []
 
+    def _extract_offers_from_page(self, tree, country_code: str) -> List[Dict[str, Any]]:
+        """Extract offer data from a parsed archived HTML page (an lxml tree)."""
+        offers = []
+
+        # Look for offer data in various possible formats
+        # Paxful used different HTML structures over time
+
+        # Method 1: JSON data in script tags
+        for script_text in JSON_SCRIPT_XPATH(tree):
+            try:
+                data = orjson.loads(script_text)
+                if "offers" in data or "advertisements" in data:
+                    offers.extend(self._extract_offers_from_json(data, country_code))
+            except Exception:
+                continue
+
+        # Method 2: HTML table/div parsing
+        for container in OFFER_XPATH(tree):
+            try:
+                offer = self._extract_offer_from_html(container, country_code)
+                if offer:
+                    offers.append(offer)
+            except Exception:
+                continue
+
+        return offers
+
     def _extract_offers_from_json(self, data: Dict, country_code: str) -> List[Dict[str, Any]]:
         """Extract offer data from JSON structures."""
         offers = []
@@ -175,6 +262,9 @@ class PaxfulHistoricalScraper:
         if "data" in data and isinstance(data["data"], list):
             offer_lists.append(data["data"])
 
+        # One collection time for every offer in this payload
+        timestamp = datetime.utcnow().isoformat() + "Z"
+
         for offer_list in offer_lists:
             if not isinstance(offer_list, list):
                 continue
@@ -185,28 +275,21 @@ class PaxfulHistoricalScraper:
 
                 standardized = {
                     "platform": "paxful",
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "asset": offer.get("cryptocurrency", offer.get("crypto", "BTC")),
-                    "fiat": offer.get("fiat_currency", offer.get("currency", "")),
-                    "price": float(offer.get("price", offer.get("rate", 0))),
-                    "min_amount": float(offer.get("min_amount", offer.get("minimum", 0))),
-                    "max_amount": float(offer.get("max_amount", offer.get("maximum", 0))),
-                    "available_amount": float(offer.get("available", 0)),
+                    "timestamp": timestamp,
                     "trade_type": "BUY" if offer.get("type") == "buy" else "SELL",
                     "country_code": country_code,
                     "payment_methods": [offer.get("payment_method", "")],
-                    "advertiser_name": offer.get("username", offer.get("trader", "")),
-                    "completion_rate": float(offer.get("completion_rate", 0)),
-                    "order_count": int(offer.get("trades", offer.get("feedback_score", 0))),
-                    "ad_id": offer.get("id", offer.get("offer_id", "")),
                     "premium_pct": None,
                 }
+                for field, keys, default, convert in OFFER_FIELDS:
+                    value = next((offer[key] for key in keys if key in offer), default)
+                    standardized[field] = convert(value) if convert else value
                 offers.append(standardized)
 
         return offers
 
     def _extract_offer_from_html(self, container, country_code: str) -> Dict[str, Any]:
-        """Extract offer data from HTML elements."""
+        """Extract offer data from an HTML element (an lxml element)."""
         # This would need to be customized based on actual Paxful HTML structure
         # Placeholder implementation
         return None
@@ -253,22 +336,33 @@ class PaxfulHistoricalScraper:
 
             all_offers = []
 
-            for url in search_urls:
-                print(f"🕐 Searching Wayback Machine for: {url}")
-                snapshots = self.get_wayback_snapshots(url, start_wayback, end_wayback)
-
-                if snapshots:
-                    print(f"📸 Found {len(snapshots)} snapshots")
-
-                    # Sample a few snapshots to avoid overloading
-                    sample_snapshots = snapshots[:: max(1, len(snapshots) // 5)]  # Take every 5th
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Snapshot searches for every URL at once
+                snapshot_lists = executor.map(
+                    lambda url: self.get_wayback_snapshots(url, start_wayback, end_wayback),
+                    search_urls,
+                )
 
-                    for snapshot in sample_snapshots:
-                        offers = self.scrape_archived_offers(snapshot, country_code)
-                        all_offers.extend(offers)
-                        time.sleep(2)  # Be respectful to Wayback Machine
-                else:
-                    print("📭 No snapshots found")
+                # Snapshot URL -> None; a dict keeps first-seen order and drops
+                # snapshots already queued from another search URL
+                sample_snapshots = {}
+                for url, snapshots in zip(search_urls, snapshot_lists):
+                    print(f"🕐 Searching Wayback Machine for: {url}")
+                    if snapshots:
+                        print(f"📸 Found {len(snapshots)} snapshots")
+                        # Sample a few snapshots to avoid overloading
+                        sample_snapshots.update(
+                            dict.fromkeys(snapshots[:: max(1, len(snapshots) // 5)])
+                        )
+                    else:
+                        print("📭 No snapshots found")
+
+                # Then every sampled page; the bucket paces the requests
+                for offers in executor.map(
+                    lambda snapshot: self.scrape_archived_offers(snapshot, country_code),
+                    sample_snapshots,
+                ):
+                    all_offers.extend(offers)
 
             if all_offers:
                 # Save historical data
@@ -0,0 +1,88 @@
+"""
+Tests for coingecko_free.py
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+import requests
+
+from scrapers.platforms.coingecko_free import CoinGeckoScraper, history_to_frame
+from utils.rate_limiter import TokenBucket
+
+HISTORY = {
+    "crypto_id": "tether",
+    "prices": [[1753747200000, 1.0002], [1753833600000, 0.9998]],
+    "market_caps": [[1753747200000, 163.1e9], [1753833600000, 163.4e9]],
+    "total_volumes": [[1753747200000, 61.2e9], [1753833600000, 58.7e9]],
+}
+
+
+class TestHistoryToFrame(unittest.TestCase):
+    def test_one_row_per_price_point(self):
+        df = history_to_frame(HISTORY)
+
+        self.assertEqual(list(df.columns), ["timestamp", "price", "market_cap", "total_volume"])
+        self.assertEqual(
+            df["timestamp"].tolist(), [pd.Timestamp("2025-07-29"), pd.Timestamp("2025-07-30")]
+        )
+        self.assertEqual(df["price"].tolist(), [1.0002, 0.9998])
+        self.assertEqual(df["total_volume"].tolist(), [61.2e9, 58.7e9])
+
+    def test_empty_history_gives_empty_frame(self):
+        for history in ({}, {"prices": [], "market_caps": [], "total_volumes": []}):
+            df = history_to_frame(history)
+
+            self.assertTrue(df.empty)
+            self.assertEqual(list(df.columns), ["timestamp", "price", "market_cap", "total_volume"])
+
+    def test_missing_series_become_nan(self):
+        history = {"prices": HISTORY["prices"], "market_caps": []}
+
+        df = history_to_frame(history)
+
+        self.assertEqual(len(df), 2)
+        self.assertTrue(np.isnan(df["market_cap"]).all())
+        self.assertTrue(np.isnan(df["total_volume"]).all())
+
+    def test_series_of_another_length_is_not_misaligned(self):
+        history = dict(HISTORY, market_caps=HISTORY["market_caps"][:1])
+
+        df = history_to_frame(history)
+
+        self.assertTrue(np.isnan(df["market_cap"]).all())
+        self.assertEqual(df["total_volume"].tolist(), [61.2e9, 58.7e9])
+
+
+class TestSaveHistoryToCsv(unittest.TestCase):
+    def setUp(self):
+        # The scraper creates its output folders relative to the working directory
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+
+        self.scraper = CoinGeckoScraper(
+            session=requests.Session(), rate_limiter=TokenBucket(1000, 100)
+        )
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_history_is_saved_one_row_per_point(self):
+        self.scraper._save_history_to_csv(HISTORY, "history.csv")
+
+        saved = pd.read_csv(os.path.join(self.scraper.analysis_dir, "history.csv"))
+        self.assertEqual(saved["price"].tolist(), [1.0002, 0.9998])
+
+    def test_empty_history_writes_nothing(self):
+        self.scraper._save_history_to_csv({}, "history.csv")
+
+        self.assertEqual(os.listdir(self.scraper.analysis_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
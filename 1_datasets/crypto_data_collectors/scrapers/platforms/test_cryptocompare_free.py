@@ -0,0 +1,71 @@
+"""
+Tests for cryptocompare_free.py
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+import orjson
+import requests
+
+from scrapers.platforms.cryptocompare_free import DAY_SECONDS, CryptoCompareScraper
+from utils.rate_limiter import TokenBucket
+from utils.response_cache import ResponseCache
+
+
+class HistodaySession:
+    """Session stand-in answering /histoday with `limit + 1` daily bars ending today."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append(params)
+        today = int(datetime.now(timezone.utc).timestamp()) // DAY_SECONDS * DAY_SECONDS
+        bars = [
+            {"time": today - i * DAY_SECONDS, "close": 100.0 + i}
+            for i in range(params["limit"], -1, -1)
+        ]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = orjson.dumps({"Response": "Success", "Data": bars})
+        return response
+
+
+class TestHistoricalDaily(unittest.TestCase):
+    def setUp(self):
+        # The scraper creates its output folders relative to the working directory
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+
+        self.session = HistodaySession()
+        self.scraper = CryptoCompareScraper(
+            session=self.session, rate_limiter=TokenBucket(1000, 100)
+        )
+        self.scraper.cache = ResponseCache(self._tmp.name, "cryptocompare")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_no_days_requested_short_circuits(self):
+        self.assertEqual(self.scraper.get_historical_daily("BTC", "USD", days=0), {})
+        self.assertEqual(self.scraper.get_historical_daily("BTC", "USD", days=-3), {})
+        self.assertEqual(self.session.calls, [])
+
+    def test_cached_range_only_refetches_recent_bars(self):
+        first = self.scraper.get_historical_daily("BTC", "USD", days=10)
+        self.assertEqual(first["data_points"], 10)
+        self.assertEqual(self.session.calls[-1]["limit"], 9)
+
+        again = self.scraper.get_historical_daily("BTC", "USD", days=10)
+        self.assertEqual(again["data_points"], 10)
+        # Closed bars come from the cache; only the open bar is fetched again
+        self.assertEqual(self.session.calls[-1]["limit"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests for localbitcoins_public.py
+"""
+
+import tempfile
+import unittest
+from unittest import mock
+
+import orjson
+import pandas as pd
+import requests
+
+from scrapers.platforms.localbitcoins_public import (
+    RESPONSE_TTL,
+    STALE_MAX_AGE,
+    LocalBitcoinsPublicScraper,
+)
+from utils.csv_data_manager import CSVDataManager
+from utils.rate_limiter import TokenBucket
+from utils.response_cache import ResponseCache
+
+AD_LIST = {
+    "data": {
+        "ad_list": [
+            {
+                "data": {
+                    "ad_id": 1402,
+                    "currency": "VES",
+                    "temp_price": "2410000.00",
+                    "min_amount": "50000",
+                    "max_amount": "900000",
+                    "online_provider": "NATIONAL_BANK",
+                    "msg": "Banesco only",
+                    "location_string": "",
+                    "profile": {
+                        "username": "caracas_btc",
+                        "trade_count": "3000+",
+                        "feedback_score": 98,
+                    },
+                }
+            },
+            {
+                "data": {
+                    "ad_id": 1403,
+                    "currency": "VES",
+                    "temp_price": "2395000.00",
+                    "online_provider": "",
+                    "profile": {"username": "maracaibo", "trade_count": 41, "feedback_score": 100},
+                }
+            },
+        ]
+    }
+}
+
+
+class AdListSession:
+    """Session stand-in answering every ad list request with the same body."""
+
+    def __init__(self, body):
+        self.body = body
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        response = requests.Response()
+        response.status_code = 200 if self.body is not None else 503
+        response._content = orjson.dumps(self.body)
+        return response
+
+
+class TestLocalBitcoinsPublicScraper(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.scraper = LocalBitcoinsPublicScraper(rate_limiter=TokenBucket(1000, 100))
+        self.scraper.session = AdListSession(AD_LIST)
+        self.scraper.csv_manager = CSVDataManager(self._tmp.name)
+        self.scraper.cache = ResponseCache(self._tmp.name, "localbitcoins")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_ads_use_the_shared_schema(self):
+        first, second = self.scraper._get_ads_by_type("VE", "buy")
+
+        self.assertEqual(first["payment_methods"], ["NATIONAL_BANK"])
+        self.assertEqual(first["advertiser_name"], "caracas_btc")
+        self.assertEqual(first["order_count"], 0)  # "3000+" is not a count
+        self.assertEqual(first["completion_rate"], 0.98)
+        self.assertEqual(second["payment_methods"], [])
+        self.assertEqual(second["order_count"], 41)
+
+    def test_advertiser_columns_survive_the_csv_write(self):
+        ads = self.scraper._get_ads_by_type("VE", "sell")
+
+        (path,) = self.scraper.csv_manager.save_raw_ads_batch(ads, "localbitcoins", "c1")
+        written = pd.read_csv(path, keep_default_na=False)
+
+        self.assertEqual(written["advertiser_name"].tolist(), ["caracas_btc", "maracaibo"])
+        self.assertEqual(written["order_count"].tolist(), [0, 41])
+        self.assertEqual(written["completion_rate"].tolist(), [0.98, 1.0])
+        self.assertEqual(written["payment_methods"].tolist(), ['["NATIONAL_BANK"]', "[]"])
+
+    def test_recent_cached_ads_are_served_when_the_request_fails(self):
+        with mock.patch("utils.response_cache.time.time", return_value=1000.0):
+            self.scraper._get_ads_by_type("VE", "buy")
+
+        self.scraper.session.body = None  # the site is now down
+        with mock.patch("utils.response_cache.time.time", return_value=1000.0 + RESPONSE_TTL + 1):
+            ads = self.scraper._get_ads_by_type("VE", "buy")
+
+        self.assertEqual(len(ads), 2)
+        self.assertEqual(len(self.scraper.session.urls), 2)
+
+    def test_old_cached_ads_are_not_passed_off_as_current(self):
+        with mock.patch("utils.response_cache.time.time", return_value=1000.0):
+            self.scraper._get_ads_by_type("VE", "buy")
+
+        self.scraper.session.body = None
+        with mock.patch("utils.response_cache.time.time", return_value=1000.0 + STALE_MAX_AGE + 1):
+            self.assertEqual(self.scraper._get_ads_by_type("VE", "buy"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
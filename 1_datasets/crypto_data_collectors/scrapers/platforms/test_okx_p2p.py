@@ -0,0 +1,61 @@
+"""
+Tests for okx_p2p.py
+"""
+
+import threading
+import unittest
+
+import orjson
+import requests
+
+from scrapers.platforms.okx_p2p import OKXPPScraper
+from utils.rate_limiter import TokenBucket
+
+
+class EndpointSession:
+    """Session stand-in where only `working_url` answers; the rest return HTTP 500."""
+
+    def __init__(self, working_url=None):
+        self.working_url = working_url
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        with self._lock:
+            self.requested.append(url)
+        response = requests.Response()
+        if url == self.working_url:
+            response.status_code = 200
+            response._content = orjson.dumps({"data": {"orders": []}})
+        else:
+            response.status_code = 500
+        return response
+
+
+class TestEndpointPinning(unittest.TestCase):
+    def _scraper(self, working_index=None):
+        scraper = OKXPPScraper(rate_limiter=TokenBucket(1000, 100))
+        working_url = None if working_index is None else scraper.base_urls[working_index]
+        scraper.session = EndpointSession(working_url)
+        return scraper
+
+    def test_endpoint_is_probed_once_before_pages_fan_out(self):
+        scraper = self._scraper(working_index=2)
+        scraper.collect_country_data("NG", save_to_csv=False)
+
+        working_url = scraper.base_urls[2]
+        probes = [url for url in scraper.session.requested if url != working_url]
+        # One pass over the failing endpoints, then every page on the pinned one
+        self.assertEqual(len(probes), 2)
+        self.assertEqual(scraper.session.requested.count(working_url), 2 * scraper.max_pages)
+        self.assertEqual(scraper._working_url, working_url)
+
+    def test_no_fan_out_when_every_endpoint_fails(self):
+        scraper = self._scraper()
+        scraper.collect_country_data("NG", save_to_csv=False)
+
+        self.assertEqual(len(scraper.session.requested), len(scraper.base_urls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+Tests for binance_p2p.py
+"""
+
+import tempfile
+import threading
+import unittest
+
+import orjson
+import pandas as pd
+import requests
+
+from scrapers.binance_p2p import THROTTLE_RETRIES, BinanceP2PScraper, BinanceThrottledError
+from utils.csv_data_manager import CSVDataManager
+from utils.rate_limiter import TokenBucket
+
+
+def make_response(status_code, body=None, retry_after="0"):
+    """A requests.Response as the session would return it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Retry-After"] = retry_after
+    response._content = orjson.dumps(body or {})
+    return response
+
+
+class ScriptedSession:
+    """Session stand-in that answers POSTs from a fixed list of responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = 0
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.posts += 1
+        return self.responses.pop(0)
+
+
+class PagedSession:
+    """Session stand-in serving `full_pages` full pages per trade type, then a short one."""
+
+    def __init__(self, full_pages, rows=20, hold=None):
+        self.full_pages = full_pages
+        self.rows = rows
+        # (trade_type, page) -> Event the request waits on before answering
+        self.hold = hold or {}
+        self.requested = []
+        self.answered = []
+        self._lock = threading.Lock()
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        payload = orjson.loads(data)
+        key = (payload["tradeType"], payload["page"])
+        with self._lock:
+            self.requested.append(key)
+        if key in self.hold:
+            self.hold[key].wait(timeout=5)
+        with self._lock:
+            self.answered.append(key)
+
+        count = self.rows if key[1] <= self.full_pages[key[0]] else self.rows // 2
+        ads = [{"adv": {"advNo": f"{key[0]}-{key[1]}-{i}"}} for i in range(count)]
+        return make_response(200, {"data": ads})
+
+
+class TestIterCountryData(unittest.TestCase):
+    def _scraper(self, session):
+        return BinanceP2PScraper(session=session, rate_limiter=TokenBucket(1000, 100))
+
+    def test_stops_paging_after_a_short_page(self):
+        session = PagedSession({"BUY": 2, "SELL": 0})
+        ads = list(self._scraper(session).iter_country_data("NG"))
+
+        # BUY: pages 1-2 full, page 3 short; SELL: page 1 short
+        self.assertEqual(
+            sorted(session.requested), [("BUY", 1), ("BUY", 2), ("BUY", 3), ("SELL", 1)]
+        )
+        self.assertEqual(len(ads), 20 + 20 + 10 + 10)
+
+    def test_stops_at_max_pages(self):
+        session = PagedSession({"BUY": 99, "SELL": 99})
+        scraper = self._scraper(session)
+        ads = list(scraper.iter_country_data("NG"))
+
+        self.assertEqual(len(session.requested), 2 * scraper.max_pages)
+        self.assertEqual(len(ads), 2 * scraper.max_pages * 20)
+
+    def test_yields_before_later_pages_arrive(self):
+        release = threading.Event()
+        session = PagedSession({"BUY": 1, "SELL": 0}, hold={("BUY", 2): release})
+        ads = self._scraper(session).iter_country_data("NG")
+
+        try:
+            first = next(ads)
+            # Page 1 is yielded while BUY page 2 is still outstanding
+            self.assertEqual(first["ad_id"].split("-")[1], "1")
+            self.assertNotIn(("BUY", 2), session.answered)
+        finally:
+            release.set()
+        self.assertEqual(len(list(ads)), 20 + 10 + 10 - 1)
+
+
+class TestStreamCountriesBatch(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_each_country_is_reported_as_it_is_saved(self):
+        # VE is throttled on every attempt; NG pages succeed
+        ng_page = make_response(200, {"data": [{"adv": {"advNo": "1"}}]})
+
+        class Session:
+            def post(self, url, data=None, headers=None, timeout=None):
+                return ng_page if orjson.loads(data)["fiat"] == "NGN" else make_response(429)
+
+        manager = CSVDataManager(self._tmp.name)
+        scraper = BinanceP2PScraper(session=Session(), rate_limiter=TokenBucket(1000, 100))
+        scraper.csv_manager = manager
+        saved = []
+
+        counts = scraper.stream_countries_batch(
+            ["VE", "NG"], date_str="2025-07-29", on_saved=lambda *args: saved.append(args)
+        )
+
+        # VE failing did not stop NG, and each was reported straight away
+        self.assertEqual(saved, [("VE", 0), ("NG", 2)])
+        self.assertEqual(counts, {"VE": 0, "NG": 2})
+        self.assertFalse(manager._raw_ads_path("binance", "VE", "2025-07-29").exists())
+        self.assertTrue(manager._raw_ads_path("binance", "NG", "2025-07-29").exists())
+
+        log = pd.read_csv(manager.metadata_dir / "collection_log.csv")
+        self.assertEqual(
+            dict(zip(log["country_code"], log["status"])), {"VE": "error", "NG": "success"}
+        )
+
+    def test_raw_format_selects_the_ndjson_writer(self):
+        scraper = BinanceP2PScraper(
+            session=ScriptedSession([make_response(200, {"data": [{"adv": {"advNo": "1"}}]})] * 2),
+            rate_limiter=TokenBucket(1000, 100),
+        )
+        manager = CSVDataManager(self._tmp.name)
+        scraper.csv_manager = manager
+        scraper.raw_format = "ndjson"
+
+        self.assertEqual(scraper.stream_country_data("NG", date_str="2025-07-29"), 2)
+        self.assertTrue(manager._raw_ads_path("binance", "NG", "2025-07-29", ".ndjson").exists())
+        self.assertFalse(manager._raw_ads_path("binance", "NG", "2025-07-29").exists())
+
+
+class TestGetAdsThrottling(unittest.TestCase):
+    def _scraper(self, responses):
+        session = ScriptedSession(responses)
+        scraper = BinanceP2PScraper(session=session, rate_limiter=TokenBucket(1000, 100))
+        return scraper, session
+
+    def test_throttled_page_is_retried(self):
+        page = {"data": [{"adv": {"advNo": "1"}}]}
+        scraper, session = self._scraper([make_response(429), make_response(200, page)])
+
+        self.assertEqual(scraper.get_ads(fiat="NGN"), page)
+        self.assertEqual(session.posts, 2)
+
+    def test_ip_ban_status_is_retried(self):
+        scraper, session = self._scraper([make_response(418), make_response(200, {"data": []})])
+
+        self.assertEqual(scraper.get_ads(fiat="NGN"), {"data": []})
+        self.assertEqual(session.posts, 2)
+
+    def test_persistent_throttling_raises(self):
+        scraper, session = self._scraper([make_response(429)] * (THROTTLE_RETRIES + 1))
+
+        with self.assertRaises(BinanceThrottledError):
+            scraper.get_ads(fiat="NGN")
+        self.assertEqual(session.posts, THROTTLE_RETRIES + 1)
+
+    def test_throttling_fails_the_country_collection(self):
+        scraper, _ = self._scraper([make_response(429)] * 100)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper.csv_manager = CSVDataManager(tmp)
+
+            # A RequestException, so the orchestrator records the country as failed
+            with self.assertRaises(requests.RequestException):
+                scraper.stream_country_data("NG")
+
+            self.assertFalse(scraper.csv_manager._raw_ads_path("binance", "NG").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,13 +39,17 @@ from functools import lru_cache
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @lru_cache(maxsize=1)
 def load_profiles(filepath="config/countries.yml"):
     """
     Load all country profiles from a YAML configuration file.
 
-    The result is cached to avoid repeated file I/O.
+    The result is cached to avoid repeated file I/O, and parsed with
+    libyaml's C loader when it is available.
 
     Parameters:
     -----------
@@ -77,7 +81,7 @@ def load_profiles(filepath="config/countries.yml"):
     """
     try:
         with open(filepath, "r", encoding="utf-8") as file:
-            return yaml.safe_load(file)
+            return yaml.load(file, Loader=YAML_LOADER)
     except FileNotFoundError:
         print(f"Error: The configuration file was not found at {filepath}")
         return []
@@ -86,11 +90,25 @@ def load_profiles(filepath="config/countries.yml"):
         return []
 
 
+@lru_cache(maxsize=8)
+def _profiles_by_code(filepath):
+    """Index of the loaded profiles by upper-cased country code, built once per file."""
+    return {profile["country_code"].upper(): profile for profile in load_profiles(filepath)}
+
+
+@lru_cache(maxsize=8)
+def _profiles_by_name(filepath):
+    """Index of the loaded profiles by lower-cased country name, built once per file."""
+    return {profile["name"].lower(): profile for profile in load_profiles(filepath)}
+
+
 def get_profile_by_country_code(country_code, filepath="config/countries.yml"):
     """
     Retrieve a country profile by ISO 3166-1 alpha-2 country code.
 
     The search is case-insensitive and ignores leading/trailing whitespace.
+    Lookups go through a code-indexed dict built once per configuration
+    file, since scrapers look up the same codes on every collection pass.
 
     Parameters:
     -----------
@@ -117,12 +135,10 @@ def get_profile_by_country_code(country_code, filepath="config/countries.yml"):
     >>> # print(profile['name'])
     >>> # Sudan
     """
-    profiles = load_profiles(filepath)
-    search_code = country_code.strip().upper()
-    for profile in profiles:
-        if profile["country_code"].upper() == search_code:
-            return profile
-    raise ValueError(f"No profile found for country code: {country_code}")
+    try:
+        return _profiles_by_code(filepath)[country_code.strip().upper()]
+    except KeyError:
+        raise ValueError(f"No profile found for country code: {country_code}") from None
 
 
 def get_profile_by_country_name(name, filepath="config/countries.yml"):
@@ -156,12 +172,10 @@ def get_profile_by_country_name(name, filepath="config/countries.yml"):
     >>> # print(profile['fiat'])
     >>> # VES
     """
-    profiles = load_profiles(filepath)
-    search_name = name.strip().lower()
-    for profile in profiles:
-        if profile["name"].lower() == search_name:
-            return profile
-    raise ValueError(f"No profile found for country name: {name}")
+    try:
+        return _profiles_by_name(filepath)[name.strip().lower()]
+    except KeyError:
+        raise ValueError(f"No profile found for country name: {name}") from None
 
 
 def list_supported_countries(filepath="config/countries.yml"):
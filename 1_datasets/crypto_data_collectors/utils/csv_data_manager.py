@@ -31,24 +31,38 @@ data/
 └── metadata/              # Collection logs and tracking
     └── collection_log.csv
 
+Usage (from the crypto_data_collectors directory):
+    python -m utils.csv_data_manager
+
 Author: Clement MUGISHA
 License: MIT
 """
 
 import csv
-import json
+import os
+import threading
 from datetime import date, datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
+import orjson
 import pandas as pd
 
+# File formats the raw-ads writers can produce
+RAW_AD_FORMATS = ("csv", "ndjson")
+
 
 class CSVDataManager:
     """
     Manages all CSV data storage operations for the P2P crypto market data project.
     """
 
+    # Serializes appends to shared files (collection log, daily rates). Shared by
+    # every instance, since each scraper owns its own manager but several of
+    # them may append to the same file from concurrent threads.
+    _append_lock = threading.Lock()
+
     def __init__(self, base_data_dir: str = None):
         """
         Initialize the CSV data manager.
@@ -143,6 +157,7 @@ class CSVDataManager:
         platform: str,
         country_code: str,
         collection_id: str = None,
+        fmt: str = "csv",
     ) -> str:
         """
         Save raw P2P advertisement data to CSV.
@@ -157,37 +172,248 @@ class CSVDataManager:
             ISO country code (e.g., 'SD', 'VE')
         collection_id : str, optional
             Unique collection identifier
+        fmt : str
+            'csv', or 'ndjson' to write through save_raw_ads_ndjson instead
 
         Returns:
         --------
         str
-            Path to the saved CSV file
+            Path to the saved file
         """
         if not collection_id:
             collection_id = self.generate_collection_id()
 
-        # Create date-based subdirectory
-        today = date.today().strftime("%Y-%m-%d")
-        date_dir = self.raw_dir / today
-        date_dir.mkdir(exist_ok=True)
-
-        # Generate filename
-        filename = f"{platform}_p2p_{country_code}_{today}.csv"
-        filepath = date_dir / filename
+        if self._is_ndjson(fmt):
+            self.save_raw_ads_ndjson(ads, platform, country_code, collection_id)
+            return str(self._raw_ads_path(platform, country_code, suffix=".ndjson"))
 
-        # Add collection_id to each ad
-        for ad in ads:
-            ad["collection_id"] = collection_id
-            # Convert payment_methods list to JSON string for CSV storage
-            if isinstance(ad.get("payment_methods"), list):
-                ad["payment_methods"] = json.dumps(ad["payment_methods"])
+        filepath = self._raw_ads_path(platform, country_code)
 
         # Write to CSV
-        self._write_csv(filepath, ads, self.ad_headers)
+        df = self._ads_frame(ads, collection_id)
+        df.to_csv(filepath, index=False, encoding="utf-8")
 
         print(f"✅ Saved {len(ads)} ads to {filepath}")
         return str(filepath)
 
+    def save_raw_ads_batch(
+        self,
+        ads: List[Dict[str, Any]],
+        platform: str,
+        collection_id: str = None,
+    ) -> List[str]:
+        """
+        Save advertisements for several countries in a single pass.
+
+        The whole batch is converted to one DataFrame and then split by the
+        `country_code` column, so each country still lands in its usual
+        `{platform}_p2p_{country_code}_{date}.csv` file.
+
+        Parameters:
+        -----------
+        ads : list
+            Standardized advertisement dictionaries from any number of countries
+        platform : str
+            Platform name (e.g., 'binance', 'okx')
+        collection_id : str, optional
+            Unique collection identifier shared by the batch
+
+        Returns:
+        --------
+        list
+            Paths to the saved CSV files
+        """
+        if not collection_id:
+            collection_id = self.generate_collection_id()
+
+        df = self._ads_frame(ads, collection_id)
+        saved_files = []
+
+        for country_code, country_df in df.groupby("country_code", sort=False):
+            filepath = self._raw_ads_path(platform, country_code)
+            country_df.to_csv(filepath, index=False, encoding="utf-8")
+            saved_files.append(str(filepath))
+
+        print(f"✅ Saved {len(ads)} ads across {len(saved_files)} files")
+        return saved_files
+
+    def save_raw_ads_stream(
+        self,
+        ads: Iterable[Dict[str, Any]],
+        platform: str,
+        country_code: str,
+        collection_id: str = None,
+        chunk_size: int = 1000,
+        date_str: str = None,
+        fmt: str = "csv",
+    ) -> int:
+        """
+        Write advertisements to CSV as they arrive from an iterator.
+
+        Rows are written in chunks through a single open file, so memory stays
+        bounded by `chunk_size` however many ads the scraper yields. The file
+        is only created once the first ad arrives, and rows go to a temporary
+        file that replaces the target only when the iterator is exhausted, so
+        an error raised mid-stream leaves no truncated CSV behind.
+
+        Parameters:
+        -----------
+        ads : iterable
+            Standardized advertisement dictionaries (e.g. a scraper generator)
+        platform : str
+            Platform name (e.g., 'binance', 'okx')
+        country_code : str
+            ISO country code (e.g., 'SD', 'VE')
+        collection_id : str, optional
+            Unique collection identifier
+        chunk_size : int
+            Number of rows buffered per write
+        date_str : str, optional
+            Collection date (YYYY-MM-DD) naming the output folder. Defaults to today.
+        fmt : str
+            'csv', or 'ndjson' to write through save_raw_ads_ndjson instead
+
+        Returns:
+        --------
+        int
+            Number of ads written
+        """
+        if not collection_id:
+            collection_id = self.generate_collection_id()
+
+        if self._is_ndjson(fmt):
+            return self.save_raw_ads_ndjson(ads, platform, country_code, collection_id, date_str)
+
+        ads = iter(ads)
+        chunk = list(islice(ads, chunk_size))
+        if not chunk:
+            return 0
+
+        filepath = self._raw_ads_path(platform, country_code, date_str)
+        tmp_path = filepath.with_suffix(f".{threading.get_ident()}.tmp")
+        written = 0
+
+        try:
+            with open(tmp_path, "w", newline="", encoding="utf-8") as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=self.ad_headers, extrasaction="ignore")
+                writer.writeheader()
+
+                while chunk:
+                    for ad in chunk:
+                        ad["collection_id"] = collection_id
+                        # Convert payment_methods lists to JSON strings for CSV storage
+                        if isinstance(ad.get("payment_methods"), list):
+                            ad["payment_methods"] = orjson.dumps(ad["payment_methods"]).decode()
+                    writer.writerows(chunk)
+                    written += len(chunk)
+                    chunk = list(islice(ads, chunk_size))
+        except BaseException:
+            # A source failing mid-stream must not leave a truncated file behind
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, filepath)
+
+        print(f"✅ Saved {written} ads to {filepath}")
+        return written
+
+    def save_raw_ads_ndjson(
+        self,
+        ads: Iterable[Dict[str, Any]],
+        platform: str,
+        country_code: str,
+        collection_id: str = None,
+        date_str: str = None,
+    ) -> int:
+        """
+        Write advertisements as newline-delimited JSON (one object per line).
+
+        An alternative to the CSV writers for consumers that want native types
+        back: payment_methods is written as a list (even when a scraper
+        pre-encoded it as a JSON string) and numbers stay numbers, with no
+        per-cell quoting. Lines go through a 1 MiB write buffer, so the file is
+        written in large sequential blocks. The file sits next to the CSV as
+        `{platform}_p2p_{country_code}_{date}.ndjson` and, like the streaming
+        CSV, is only created once the first ad arrives and only replaced once
+        the iterator is exhausted.
+
+        Parameters:
+        -----------
+        ads : iterable
+            Standardized advertisement dictionaries (e.g. a scraper generator)
+        platform : str
+            Platform name (e.g., 'binance', 'okx')
+        country_code : str
+            ISO country code (e.g., 'SD', 'VE')
+        collection_id : str, optional
+            Unique collection identifier
+        date_str : str, optional
+            Collection date (YYYY-MM-DD) naming the output folder. Defaults to today.
+
+        Returns:
+        --------
+        int
+            Number of ads written
+        """
+        if not collection_id:
+            collection_id = self.generate_collection_id()
+
+        ads = iter(ads)
+        first = next(ads, None)
+        if first is None:
+            return 0
+
+        filepath = self._raw_ads_path(platform, country_code, date_str, suffix=".ndjson")
+        tmp_path = filepath.with_suffix(f".{threading.get_ident()}.tmp")
+        written = 0
+
+        try:
+            with open(tmp_path, "wb", buffering=1 << 20) as ndjson_file:
+                for ad in chain((first,), ads):
+                    record = {**ad, "collection_id": collection_id}
+                    # Some scrapers (Binance) pre-encode payment_methods as the CSV's JSON
+                    # string; decode it so the line holds a list, not JSON inside JSON
+                    if isinstance(record.get("payment_methods"), str):
+                        record["payment_methods"] = orjson.loads(record["payment_methods"])
+                    ndjson_file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+                    written += 1
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, filepath)
+
+        print(f"✅ Saved {written} ads to {filepath}")
+        return written
+
+    @staticmethod
+    def _is_ndjson(fmt: str) -> bool:
+        """Whether a raw-ads format selects NDJSON; unknown formats are rejected."""
+        if fmt not in RAW_AD_FORMATS:
+            raise ValueError(
+                f"Unsupported raw ads format: {fmt} (expected one of {RAW_AD_FORMATS})"
+            )
+        return fmt == "ndjson"
+
+    def _raw_ads_path(
+        self, platform: str, country_code: str, date_str: str = None, suffix: str = ".csv"
+    ) -> Path:
+        """Path of the raw ads file for a platform/country/date, creating the date folder."""
+        if not date_str:
+            date_str = date.today().strftime("%Y-%m-%d")
+        date_dir = self.raw_dir / date_str
+        date_dir.mkdir(exist_ok=True)
+        return date_dir / f"{platform}_p2p_{country_code}_{date_str}{suffix}"
+
+    def _ads_frame(self, ads: List[Dict[str, Any]], collection_id: str) -> pd.DataFrame:
+        """Build the standard ad-schema DataFrame for a batch of standardized ads."""
+        # Build the batch column-wise in one pass instead of patching each ad dict
+        df = pd.DataFrame.from_records(ads, columns=self.ad_headers)
+        df["collection_id"] = collection_id
+        # Convert payment_methods lists to JSON strings for CSV storage
+        df["payment_methods"] = df["payment_methods"].map(
+            lambda methods: orjson.dumps(methods).decode() if isinstance(methods, list) else methods
+        )
+        return df
+
     def log_collection_run(
         self,
         platform: str,
@@ -324,7 +550,7 @@ class CSVDataManager:
                     # Convert payment_methods back from JSON string
                     if "payment_methods" in df.columns:
                         df["payment_methods"] = df["payment_methods"].apply(
-                            lambda x: json.loads(x) if pd.notna(x) else []
+                            lambda x: orjson.loads(x) if pd.notna(x) else []
                         )
                     all_data.append(df)
                 except Exception as e:
@@ -338,6 +564,63 @@ class CSVDataManager:
             print("❌ No data found matching criteria")
             return pd.DataFrame()
 
+    def load_exchange_rates(self, date_str: str = None) -> Dict[str, float]:
+        """
+        Load the official USD rates saved for a date.
+
+        Parameters:
+        -----------
+        date_str : str, optional
+            Date of the rates file (YYYY-MM-DD). Defaults to today.
+
+        Returns:
+        --------
+        dict
+            Fiat currency -> USD rate (latest record per currency dated `date_str`)
+        """
+        if not date_str:
+            date_str = date.today().strftime("%Y-%m-%d")
+
+        rates_file = self.exchange_rates_dir / f"rates_{date_str}.csv"
+        if not rates_file.exists():
+            return {}
+
+        rates_df = pd.read_csv(rates_file, usecols=["timestamp", "fiat_currency", "usd_rate"])
+        # Crisis-period collections append rates for past dates to the same daily
+        # file, so keep only rows dated `date_str`, then the latest one per currency
+        rates_df = rates_df[rates_df["timestamp"].astype(str).str.startswith(date_str)]
+        latest = rates_df.sort_values("timestamp", kind="stable").drop_duplicates(
+            "fiat_currency", keep="last"
+        )
+        return dict(zip(latest["fiat_currency"], latest["usd_rate"]))
+
+    def add_premiums(self, df: pd.DataFrame, rates: Dict[str, float]) -> pd.DataFrame:
+        """
+        Fill `premium_pct` for every ad from official exchange rates.
+
+        The official rate is joined on the `fiat` column and the premium is
+        computed for the whole frame at once (USDT assumed worth 1 USD), using
+        the same formula as `ExchangeRateCollector.calculate_premium`. Ads whose
+        currency has no usable rate (missing, non-numeric, zero or negative) are
+        left as NaN rather than getting an infinite or meaningless premium.
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Advertisements with `fiat` and `price` columns
+        rates : dict
+            Fiat currency -> USD rate
+
+        Returns:
+        --------
+        pd.DataFrame
+            The same frame with `premium_pct` populated
+        """
+        official_rate = pd.to_numeric(df["fiat"].map(rates), errors="coerce")
+        official_rate = official_rate.where(official_rate > 0)
+        df["premium_pct"] = ((df["price"] / official_rate - 1.0) * 100).round(2)
+        return df
+
     def get_collection_log(self) -> pd.DataFrame:
         """
         Load the collection log CSV.
@@ -362,13 +645,14 @@ class CSVDataManager:
 
     def _append_csv(self, filepath: Path, data: List[Dict], headers: List[str]):
         """Append data to CSV file, creating with headers if necessary."""
-        file_exists = filepath.exists()
+        with self._append_lock:
+            file_exists = filepath.exists()
 
-        with open(filepath, "a", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerows(data)
+            with open(filepath, "a", newline="", encoding="utf-8") as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=headers)
+                if not file_exists:
+                    writer.writeheader()
+                writer.writerows(data)
 
     def create_daily_summary(self, date_str: str = None) -> str:
         """
@@ -394,6 +678,11 @@ class CSVDataManager:
             print(f"❌ No data available for {date_str}")
             return ""
 
+        # Premiums are only known once official rates are available for the day
+        rates = self.load_exchange_rates(date_str)
+        if rates:
+            df = self.add_premiums(df, rates)
+
         # Calculate summary metrics
         summary_data = []
 
@@ -5,18 +5,13 @@ Data Viewer Utility
 Simple utility to view and analyze collected P2P crypto data from CSV files.
 This script helps you explore the data that has been collected.
 
-Usage:
-    python utils/data_viewer.py
+Usage (from the crypto_data_collectors directory):
+    python -m utils.data_viewer
 
 Author: Clement MUGISHA
 License: MIT
 """
 
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import json
 
 from utils.csv_data_manager import CSVDataManager
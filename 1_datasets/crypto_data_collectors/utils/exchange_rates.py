@@ -17,23 +17,24 @@ Sources:
 - fixer.io (EU-based rates)
 - Country-specific sources (dolarhoy.com for Argentina, etc.)
 
+Usage (from the crypto_data_collectors directory):
+    python -m utils.exchange_rates
+
 Author: Clement MUGISHA
 License: MIT
 """
 
-import os
-import sys
-import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
+import orjson
 import requests
 
-# Add project root to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.country_profiles import get_profile_by_country_code, list_supported_countries
 from utils.csv_data_manager import CSVDataManager
+from utils.http_session import create_session
+from utils.rate_cache import ExchangeRateCache
+from utils.rate_limiter import TokenBucket
 
 
 class ExchangeRateCollector:
@@ -41,7 +42,7 @@ class ExchangeRateCollector:
     Collects official exchange rates for premium calculation.
     """
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: requests.Session = None):
         """
         Initialize the exchange rate collector.
 
@@ -49,6 +50,9 @@ class ExchangeRateCollector:
         -----------
         api_key : str, optional
             API key for premium services (openexchangerates.org)
+        session : requests.Session, optional
+            Shared pooled session (see utils.http_session); a new one is
+            created when omitted
         """
         self.api_key = api_key
         self.csv_manager = CSVDataManager()
@@ -58,21 +62,26 @@ class ExchangeRateCollector:
             "openexchangerates": {
                 "current": "https://openexchangerates.org/api/latest.json",
                 "historical": "https://openexchangerates.org/api/historical/{date}.json",
+                "timeseries": "https://openexchangerates.org/api/time-series.json",
             },
             "fixer": {
                 "current": "http://data.fixer.io/api/latest",
                 "historical": "http://data.fixer.io/api/{date}",
             },
             "exchangerate_api": {"current": "https://api.exchangerate-api.com/v4/latest/USD"},
+            # ECB reference rates, free and keyless (major currencies only)
+            "frankfurter": {"timeseries": "https://api.frankfurter.app/{start}..{end}"},
         }
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "CryptoAnalysis/1.0 (Research Project)",
-                "Accept": "application/json",
-            }
-        )
+        self.session = session or create_session()
+        # Sent per request so a shared session carries no API-specific headers
+        self.headers = {
+            "User-Agent": "CryptoAnalysis/1.0 (Research Project)",
+            "Accept": "application/json",
+        }
+
+        # Paces API calls (~2/s) so cached lookups never wait on a fixed sleep
+        self._bucket = TokenBucket(rate=2, capacity=2)
 
     def get_current_rates(self, base_currency: str = "USD") -> Dict[str, float]:
         """
@@ -143,9 +152,10 @@ class ExchangeRateCollector:
                 else:
                     continue
 
-                response = self.session.get(url, params=params, timeout=10)
+                self._bucket.acquire()
+                response = self.session.get(url, params=params, headers=self.headers, timeout=10)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 if data.get("rates"):
                     print(f"✅ Got historical rates from {source}")
@@ -158,32 +168,124 @@ class ExchangeRateCollector:
         print("⚠️  No historical rates available, using fallback method")
         return {}
 
+    def get_rates_timeseries(
+        self, start_date: str, end_date: str, symbols: List[str], base_currency: str = "USD"
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Get daily exchange rates for a whole date range in a single request.
+
+        Days without an official fixing (weekends, holidays) carry the previous
+        fixing forward, so every calendar day the source covers has a table.
+
+        Parameters:
+        -----------
+        start_date : str
+            First date (YYYY-MM-DD), inclusive
+        end_date : str
+            Last date (YYYY-MM-DD), inclusive
+        symbols : list
+            Currency codes to fetch (e.g., ['SDG'])
+        base_currency : str
+            Base currency
+
+        Returns:
+        --------
+        dict
+            Date (YYYY-MM-DD) -> {currency code -> exchange rate}; empty if no
+            source covers the range
+        """
+
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        # Look back a week so a range opening on a weekend has a fixing to carry
+        lookback = (start_dt - timedelta(days=7)).strftime("%Y-%m-%d")
+        symbol_list = ",".join(symbols)
+
+        for source in ["openexchangerates", "frankfurter"]:
+            try:
+                if source == "openexchangerates":
+                    if not self.api_key:
+                        continue
+                    url = self.endpoints[source]["timeseries"]
+                    params = {
+                        "app_id": self.api_key,
+                        "start": lookback,
+                        "end": end_date,
+                        "base": base_currency,
+                        "symbols": symbol_list,
+                    }
+                else:
+                    url = self.endpoints[source]["timeseries"].format(start=lookback, end=end_date)
+                    params = {"from": base_currency, "to": symbol_list}
+
+                print(f"📈 Fetching {symbol_list} rates for {start_date} to {end_date} ({source})")
+                self._bucket.acquire()
+                response = self.session.get(url, params=params, headers=self.headers, timeout=30)
+                response.raise_for_status()
+                daily = orjson.loads(response.content).get("rates")
+
+                if daily:
+                    print(f"✅ Got {len(daily)} daily fixings from {source}")
+                    return self._fill_calendar(daily, start_dt, end_dt)
+
+            except Exception as e:
+                print(f"❌ Error fetching rate series from {source}: {e}")
+                continue
+
+        return {}
+
+    @staticmethod
+    def _fill_calendar(
+        daily: Dict[str, Dict[str, float]], start_dt: datetime, end_dt: datetime
+    ) -> Dict[str, Dict[str, float]]:
+        """Map each calendar day in [start, end] to the latest fixing on or before it."""
+        fixings = sorted(daily.items())
+        series = {}
+        latest = None
+        next_fixing = 0
+
+        day = start_dt
+        while day <= end_dt:
+            date_str = day.strftime("%Y-%m-%d")
+            # ISO dates sort lexically, so advance through fixings up to this day
+            while next_fixing < len(fixings) and fixings[next_fixing][0] <= date_str:
+                latest = fixings[next_fixing][1]
+                next_fixing += 1
+            if latest:
+                series[date_str] = latest
+            day += timedelta(days=1)
+
+        return series
+
     def _fetch_from_source(self, source: str, base_currency: str) -> Dict[str, float]:
         """Fetch rates from a specific source."""
 
+        if source == "openexchangerates" and not self.api_key:
+            return {}
+
+        self._bucket.acquire()
+
         if source == "exchangerate_api":
             url = self.endpoints[source]["current"]
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("rates", {})
 
         elif source == "openexchangerates":
-            if not self.api_key:
-                return {}
             url = self.endpoints[source]["current"]
             params = {"app_id": self.api_key}
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("rates", {})
 
         elif source == "fixer":
             url = self.endpoints[source]["current"]
             params = {"access_key": self.api_key} if self.api_key else {}
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("rates", {})
 
         return {}
@@ -222,6 +324,9 @@ class ExchangeRateCollector:
             rates_data = []
             current_dt = start_dt
 
+            # One range request instead of a historical lookup per sampled day
+            series = self.get_rates_timeseries(start_date, end_date, [fiat])
+
             while current_dt <= end_dt:
                 date_str = current_dt.strftime("%Y-%m-%d")
 
@@ -230,8 +335,8 @@ class ExchangeRateCollector:
                     # Use current rates for today
                     rates = self.get_current_rates()
                 else:
-                    # Get historical rates
-                    rates = self.get_historical_rates(date_str)
+                    # Per-day historical lookup only for days the range missed
+                    rates = series.get(date_str) or self.get_historical_rates(date_str)
 
                 if fiat in rates:
                     rate_record = {
@@ -250,8 +355,6 @@ class ExchangeRateCollector:
                 days_to_add = 7 if (end_dt - start_dt).days > 90 else 1
                 current_dt += timedelta(days=days_to_add)
 
-                time.sleep(0.5)  # Rate limiting
-
             # Save to CSV
             if rates_data:
                 self.csv_manager.save_exchange_rates(rates_data)
@@ -330,6 +433,107 @@ class ExchangeRateCollector:
         return rates_data
 
 
+class CachedExchangeRateCollector(ExchangeRateCollector):
+    """
+    Exchange rate collector that serves repeated lookups from a persistent cache.
+
+    Rate tables are cached per date in SQLite (see utils.rate_cache). Past
+    dates are reused indefinitely; today's rates are refetched once older
+    than `ttl_hours`. Range requests only cover the symbols asked for, so
+    their rows go to a separate per-symbol store and never stand in for a
+    date's complete table.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        session: requests.Session = None,
+        cache_path: str = None,
+        ttl_hours: int = 24,
+    ):
+        """
+        Initialize the collector and open the cache.
+
+        Parameters:
+        -----------
+        api_key : str, optional
+            API key for premium services (openexchangerates.org)
+        session : requests.Session, optional
+            Shared pooled session (see utils.http_session)
+        cache_path : str, optional
+            SQLite cache file. Defaults to 1_datasets/cache/exchange_rates.sqlite
+        ttl_hours : int
+            Maximum age of cached current rates
+        """
+        super().__init__(api_key, session=session)
+
+        if cache_path is None:
+            cache_path = self.csv_manager.base_dir / "cache" / "exchange_rates.sqlite"
+        self.cache = ExchangeRateCache(cache_path, ttl_seconds=ttl_hours * 3600)
+        self.series_cache = ExchangeRateCache(cache_path, table="series_rates")
+
+    def get_current_rates(self, base_currency: str = "USD") -> Dict[str, float]:
+        """Get current rates, reusing today's cached table while it is within the TTL."""
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        rates = self.cache.get(today, base_currency, max_age=self.cache.ttl_seconds)
+        if rates:
+            print(f"💾 Using cached current rates ({len(rates)} currencies)")
+            return rates
+
+        rates = super().get_current_rates(base_currency)
+        if rates:
+            self.cache.put(today, rates, base_currency)
+        return rates
+
+    def get_historical_rates(self, date: str, base_currency: str = "USD") -> Dict[str, float]:
+        """Get historical rates, fetching only dates missing from the cache."""
+        rates = self.cache.get(date, base_currency)
+        if rates:
+            return rates
+
+        rates = super().get_historical_rates(date, base_currency)
+        if rates:
+            self.cache.put(date, rates, base_currency)
+        return rates
+
+    def get_rates_timeseries(
+        self, start_date: str, end_date: str, symbols: List[str], base_currency: str = "USD"
+    ) -> Dict[str, Dict[str, float]]:
+        """Get a range of daily rates, skipping the request when the cache covers every past day."""
+        self.cache.preload(start_date, end_date, base_currency)
+        cached_days = self.series_cache.preload(start_date, end_date, base_currency)
+        if cached_days:
+            print(f"💾 {cached_days} days already cached for {start_date} to {end_date}")
+
+        # Today's fixing isn't final, so only past days are served from / written to the cache
+        today = datetime.now().strftime("%Y-%m-%d")
+        past_days = []
+        day = datetime.strptime(start_date, "%Y-%m-%d")
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        while day <= end_dt and day.strftime("%Y-%m-%d") < today:
+            past_days.append(day.strftime("%Y-%m-%d"))
+            day += timedelta(days=1)
+
+        cached = {}
+        for date in past_days:
+            # Complete tables win over range rows; either can cover the symbols
+            rates = {
+                **(self.series_cache.get(date, base_currency) or {}),
+                **(self.cache.get(date, base_currency) or {}),
+            }
+            if rates and all(symbol in rates for symbol in symbols):
+                cached[date] = rates
+        if past_days and len(cached) == len(past_days):
+            return cached
+
+        series = super().get_rates_timeseries(start_date, end_date, symbols, base_currency)
+        for date in past_days:
+            if date in series and date not in cached:
+                self.series_cache.put(date, series[date], base_currency)
+        return series
+
+
 def main():
     """
     Test the exchange rate collector.
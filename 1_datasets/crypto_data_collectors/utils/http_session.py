@@ -0,0 +1,120 @@
+"""
+Shared HTTP Session
+===================
+
+Builds the pooled `requests.Session` shared by the scrapers and collectors.
+
+One session keeps TCP/TLS connections alive across every request to the same
+host, so country loops and page fan-out don't pay a fresh handshake per call.
+Scrapers accept an optional `session` argument; the orchestrator creates one
+session and hands it to all of them. Scraper-specific headers are sent per
+request so sharing the session never leaks headers between APIs.
+
+Example:
+--------
+>>> session = create_session()
+>>> scraper = BinanceP2PScraper(session=session)
+>>> warm_up(session, [scraper.base_url])
+
+License: MIT
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+
+def create_session(pool_connections: int = 32, pool_maxsize: int = 64) -> requests.Session:
+    """
+    Create a keep-alive session with connection pooling and retries.
+
+    Transient errors (429 and 5xx) are retried up to five times with
+    exponential backoff (honouring `Retry-After`) for GET and POST; every
+    endpoint we call is read-only, so both are safe to repeat. The final
+    throttled response is returned rather than raised so callers can honour
+    `Retry-After` before calling `raise_for_status()`.
+
+    Parameters:
+    -----------
+    pool_connections : int
+        Number of per-host connection pools to cache
+    pool_maxsize : int
+        Maximum connections kept alive per host (should cover the
+        number of worker threads sharing the session)
+
+    Returns:
+    --------
+    requests.Session
+        Configured session
+    """
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    # Advertise gzip/deflate plus brotli when a decoder is installed, so we
+    # never ask for an encoding urllib3 can't transparently decompress
+    session.headers.update(make_headers(accept_encoding=True))
+
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def retry_after(response: requests.Response, default: float = 1.0) -> float:
+    """Seconds to wait from a throttling response's Retry-After header."""
+    try:
+        return float(response.headers.get("Retry-After", default))
+    except ValueError:
+        return default
+
+
+def warm_up(session: requests.Session, urls: Iterable[str], timeout: float = 5) -> int:
+    """
+    Pre-connect to each URL's host so the first real request reuses a warm socket.
+
+    Sends one `HEAD /` per distinct host in parallel, paying DNS and TLS set-up
+    up front. This is best effort: failures are ignored and any status code
+    counts, since only the pooled connection matters.
+
+    Parameters:
+    -----------
+    session : requests.Session
+        Session whose connection pools should be warmed
+    urls : iterable
+        URLs (or base URLs) of the APIs about to be called
+    timeout : float
+        Per-request timeout in seconds
+
+    Returns:
+    --------
+    int
+        Number of hosts that answered
+    """
+    origins = sorted({f"{p.scheme}://{p.netloc}/" for p in map(urlsplit, urls) if p.netloc})
+    if not origins:
+        return 0
+
+    def _head(origin: str) -> bool:
+        try:
+            session.head(origin, timeout=timeout, allow_redirects=False)
+            return True
+        except requests.RequestException:
+            return False
+
+    with ThreadPoolExecutor(max_workers=len(origins)) as executor:
+        return sum(executor.map(_head, origins))
@@ -0,0 +1,80 @@
+"""
+Queued Logging Setup
+====================
+
+Routes collector log output through a queue so worker threads never block on
+console or file I/O.
+
+Modules log with `logging.getLogger(__name__)`; entry points wrap their run in
+`queued_logging()`, which installs a `QueueHandler` on the root logger and a
+background `QueueListener` that writes records to the console and to a
+rotating log file.
+
+Example:
+--------
+>>> with queued_logging():
+...     DataCollectionOrchestrator().run_comprehensive_collection()
+
+License: MIT
+"""
+
+import logging
+import queue
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+LOG_DIR = Path(__file__).parent.parent / "logs"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+@contextmanager
+def queued_logging(log_file: str = None, level: int = logging.INFO, console: bool = True):
+    """
+    Send all logging through a queue drained by a background thread.
+
+    Parameters:
+    -----------
+    log_file : str, optional
+        Log file path. Defaults to logs/collection.log next to the collectors
+    level : int
+        Minimum level recorded
+    console : bool
+        Whether to also echo messages to the console
+
+    Yields:
+    -------
+    QueueListener
+        The running listener (stopped and flushed on exit)
+    """
+    log_path = Path(log_file) if log_file else LOG_DIR / "collection.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        log_path, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handlers = [file_handler]
+
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(console_handler)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    root = logging.getLogger()
+    previous_level = root.level
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        yield listener
+    finally:
+        root.removeHandler(queue_handler)
+        root.setLevel(previous_level)
+        # Drains any queued records before returning
+        listener.stop()
+        file_handler.close()
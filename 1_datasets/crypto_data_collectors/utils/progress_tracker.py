@@ -0,0 +1,100 @@
+"""
+Collection Progress Tracker
+===========================
+
+Records which (platform, country, date) collections finished successfully so
+an interrupted run can resume without redoing completed work.
+
+Progress lives in a small SQLite database (WAL mode, so concurrent workers can
+read while another thread writes):
+
+progress(platform TEXT, country TEXT, date TEXT, status TEXT, n_ads INTEGER,
+         PRIMARY KEY(platform, country, date))
+
+License: MIT
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List
+
+
+class CollectionProgress:
+    """
+    Persistent record of completed per-country collections.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the progress database.
+
+        Parameters:
+        -----------
+        db_path : str
+            Path of the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Autocommit: every mark is durable as soon as it is written
+        self._conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS progress ("
+            "platform TEXT, country TEXT, date TEXT, status TEXT, n_ads INTEGER, "
+            "PRIMARY KEY(platform, country, date))"
+        )
+
+    def completed(self, platform: str, countries: Iterable[str], date: str) -> List[str]:
+        """
+        Return the countries already collected successfully for a platform and date.
+
+        Parameters:
+        -----------
+        platform : str
+            Platform name (e.g., 'binance')
+        countries : iterable
+            Country codes to check
+        date : str
+            Collection date (YYYY-MM-DD)
+
+        Returns:
+        --------
+        list
+            Country codes with a 'success' record, in the order given
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT country FROM progress WHERE platform = ? AND date = ? AND status = ?",
+                (platform, date, "success"),
+            ).fetchall()
+
+        done = {country for (country,) in rows}
+        return [country for country in countries if country in done]
+
+    def mark(self, platform: str, country: str, date: str, n_ads: int, status: str = "success"):
+        """
+        Record the outcome of one country's collection.
+
+        Parameters:
+        -----------
+        platform : str
+            Platform name
+        country : str
+            ISO country code
+        date : str
+            Collection date (YYYY-MM-DD)
+        n_ads : int
+            Number of ads collected
+        status : str
+            'success', 'no_data' or 'error'; only 'success' is skipped on resume
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO progress VALUES (?, ?, ?, ?, ?)",
+                (platform, country, date, status, n_ads),
+            )
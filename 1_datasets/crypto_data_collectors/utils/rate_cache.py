@@ -0,0 +1,169 @@
+"""
+Exchange Rate Cache
+===================
+
+SQLite-backed cache of daily exchange rate tables with an in-memory layer.
+
+Official forex rates change at most daily, so re-running a collection should
+not refetch rates we already have. Each API response (all currencies for one
+date) is stored as one row per currency; past dates never expire, while
+today's rates are reused only until they are older than the TTL.
+
+Schema (one table per store; `rates` holds complete per-date tables, while
+partial stores such as range requests for a few symbols use their own table):
+-------
+rates(base TEXT, currency TEXT, date TEXT, rate REAL, fetched_at INTEGER,
+      PRIMARY KEY(base, currency, date))
+
+License: MIT
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class ExchangeRateCache:
+    """
+    Persistent per-date exchange rate cache shared across runs and threads.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: int = 24 * 3600, table: str = "rates"):
+        """
+        Open (or create) the cache database.
+
+        Parameters:
+        -----------
+        db_path : str
+            Path of the SQLite file
+        ttl_seconds : int
+            Maximum age of cached current-day rates
+        table : str
+            Table holding this store's rows, so stores with different
+            completeness guarantees can share one database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.table = table
+
+        # One connection guarded by a lock so worker threads can share the cache
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "base TEXT, currency TEXT, date TEXT, rate REAL, fetched_at INTEGER, "
+            "PRIMARY KEY(base, currency, date))"
+        )
+        self._conn.commit()
+
+        # (base, date) -> (rates, fetched_at) for lookups already made this run
+        self._memo: Dict[Tuple[str, str], Tuple[Dict[str, float], int]] = {}
+
+    def get(
+        self, date: str, base_currency: str = "USD", max_age: Optional[int] = None
+    ) -> Optional[Dict[str, float]]:
+        """
+        Return the cached rate table for a date, if present and fresh enough.
+
+        Parameters:
+        -----------
+        date : str
+            Date in YYYY-MM-DD format
+        base_currency : str
+            Base currency of the rates
+        max_age : int, optional
+            Maximum age in seconds; None accepts any age
+
+        Returns:
+        --------
+        dict or None
+            Currency code -> exchange rate mapping, or None on a miss
+        """
+        key = (base_currency, date)
+
+        with self._lock:
+            entry = self._memo.get(key)
+            if entry is None:
+                rows = self._conn.execute(
+                    f"SELECT currency, rate, fetched_at FROM {self.table} "
+                    "WHERE base = ? AND date = ?",
+                    key,
+                ).fetchall()
+                if not rows:
+                    return None
+                entry = ({currency: rate for currency, rate, _ in rows}, min(r[2] for r in rows))
+                self._memo[key] = entry
+
+        rates, fetched_at = entry
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        return rates
+
+    def preload(self, start_date: str, end_date: str, base_currency: str = "USD") -> int:
+        """
+        Load every cached date in a range with a single query.
+
+        Parameters:
+        -----------
+        start_date : str
+            First date (YYYY-MM-DD), inclusive
+        end_date : str
+            Last date (YYYY-MM-DD), inclusive
+        base_currency : str
+            Base currency of the rates
+
+        Returns:
+        --------
+        int
+            Number of dates found in the cache
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT date, currency, rate, fetched_at FROM {self.table} "
+                "WHERE base = ? AND date BETWEEN ? AND ?",
+                (base_currency, start_date, end_date),
+            ).fetchall()
+
+            tables: Dict[str, Tuple[Dict[str, float], int]] = {}
+            for date, currency, rate, fetched_at in rows:
+                rates, oldest = tables.setdefault(date, ({}, fetched_at))
+                rates[currency] = rate
+                tables[date] = (rates, min(oldest, fetched_at))
+
+            for date, entry in tables.items():
+                self._memo[(base_currency, date)] = entry
+
+        return len(tables)
+
+    def put(self, date: str, rates: Dict[str, float], base_currency: str = "USD"):
+        """
+        Store rates for a date, replacing any cached values for those currencies.
+
+        Parameters:
+        -----------
+        date : str
+            Date in YYYY-MM-DD format
+        rates : dict
+            Currency code -> exchange rate mapping
+        base_currency : str
+            Base currency of the rates
+        """
+        fetched_at = int(time.time())
+        rows = [
+            (base_currency, currency, date, float(rate), fetched_at)
+            for currency, rate in rates.items()
+            if isinstance(rate, (int, float))
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+            # Rows merge with any other currencies cached for the date (e.g. a single
+            # currency from a range request), so reload the table on next access
+            self._memo.pop((base_currency, date), None)
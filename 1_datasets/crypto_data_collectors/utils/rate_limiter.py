@@ -0,0 +1,89 @@
+"""
+Request Rate Limiter
+====================
+
+Thread-safe token bucket used by the scrapers to pace outbound API calls.
+
+Instead of sleeping a fixed amount after every request, each call takes a
+token from the bucket. Tokens refill continuously at `rate` per second up to
+`capacity`, so short bursts run at full speed and callers only block once the
+budget is spent. When an API signals throttling (HTTP 429/418 with a
+`Retry-After` header), `pause()` drains the bucket so every thread sharing it
+backs off together.
+
+Example:
+--------
+>>> bucket = TokenBucket(rate=10, capacity=20)
+>>> bucket.acquire()  # returns immediately while tokens are available
+
+License: MIT
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by all threads of a scraper.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize a full bucket.
+
+        Parameters:
+        -----------
+        rate : float
+            Tokens added per second (sustained requests per second)
+        capacity : int
+            Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add tokens for the time elapsed since the last refill (lock must be held)."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def acquire(self, tokens: int = 1):
+        """
+        Take tokens from the bucket, blocking until they are available.
+
+        Tokens are reserved immediately (the balance may go negative) and the
+        caller sleeps off the deficit outside the lock, so waiting threads are
+        served in arrival order without holding up the others.
+
+        Parameters:
+        -----------
+        tokens : int
+            Number of tokens the request costs
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        Stop handing out tokens for the given number of seconds.
+
+        Used when the server returns a throttling response with `Retry-After`.
+
+        Parameters:
+        -----------
+        seconds : float
+            How long every caller should back off
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
@@ -0,0 +1,122 @@
+"""
+API Response Cache
+==================
+
+On-disk JSON cache of API responses with per-lookup TTLs, plus an in-memory
+layer for repeated lookups within a run.
+
+Market-context endpoints are queried on every collection even though much of
+what they return has not changed: current prices move on a minute scale, and
+closed historical days never change. Each cached response is one JSON file:
+
+<cache_dir>/<namespace>/<md5(url + sorted params)>.json  ->  {"ts": epoch, "data": ...}
+
+Callers choose the TTL when reading, so one file can serve both a short-lived
+lookup and a long-lived one. `None` accepts any age.
+
+Example:
+--------
+>>> cache = ResponseCache(base_dir / "cache" / "http", "coingecko")
+>>> key = ResponseCache.make_key(url, params)
+>>> data = cache.get(key, ttl=60)
+
+License: MIT
+"""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import orjson
+
+
+class ResponseCache:
+    """
+    Persistent JSON response cache shared by all threads of a scraper.
+    """
+
+    def __init__(self, cache_dir: str, namespace: str):
+        """
+        Open (or create) a cache directory.
+
+        Parameters:
+        -----------
+        cache_dir : str
+            Root directory of the response cache
+        namespace : str
+            Subdirectory for one API (e.g., 'coingecko')
+        """
+        self.cache_dir = Path(cache_dir) / namespace
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # key -> (fetched_at, data) for entries already read or written this run
+        self._lock = threading.Lock()
+        self._memo: Dict[str, Tuple[float, Any]] = {}
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any] = None) -> str:
+        """Stable cache key for a request, independent of parameter order."""
+        raw = url + "?" + urlencode(sorted((params or {}).items()))
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Any:
+        """
+        Return cached data for a key, if present and fresh enough.
+
+        Parameters:
+        -----------
+        key : str
+            Cache key (see make_key)
+        ttl : float, optional
+            Maximum age in seconds; None accepts any age
+
+        Returns:
+        --------
+        Any or None
+            Decoded response data, or None on a miss
+        """
+        with self._lock:
+            entry = self._memo.get(key)
+
+        if entry is None:
+            try:
+                stored = orjson.loads(self._path(key).read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                return None
+            entry = (stored["ts"], stored["data"])
+            with self._lock:
+                self._memo[key] = entry
+
+        fetched_at, data = entry
+        if ttl is not None and time.time() - fetched_at > ttl:
+            return None
+        return data
+
+    def put(self, key: str, data: Any):
+        """
+        Store (or replace) the data for a key.
+
+        Parameters:
+        -----------
+        key : str
+            Cache key (see make_key)
+        data : Any
+            JSON-serializable response data
+        """
+        fetched_at = time.time()
+        path = self._path(key)
+        # Per-thread temp file and an atomic swap, so readers never see half a file
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps({"ts": fetched_at, "data": data}))
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._memo[key] = (fetched_at, data)
+
+    def _path(self, key: str) -> Path:
+        """File holding a key's cached response."""
+        return self.cache_dir / f"{key}.json"
@@ -0,0 +1,209 @@
+"""
+Tests for csv_data_manager.py
+"""
+
+import math
+import tempfile
+import unittest
+
+import orjson
+import pandas as pd
+import requests
+
+from scrapers.binance_p2p import BinanceP2PScraper
+from utils.csv_data_manager import CSVDataManager
+from utils.exchange_rates import ExchangeRateCollector
+
+BINANCE_AD = {
+    "adv": {
+        "advNo": "11559",
+        "asset": "USDT",
+        "fiatUnit": "NGN",
+        "price": "1530.50",
+        "minSingleTransAmount": "5000",
+        "dynamicMaxSingleTransAmount": "800000",
+        "surplusAmount": "912.3",
+        "tradeMethods": [{"tradeMethodName": "Opay"}, {"tradeMethodName": "Bank Transfer"}],
+    },
+    "advertiser": {"nickName": "naira_desk", "monthFinishRate": "0.98", "monthOrderCount": 412},
+}
+
+
+class TestSaveRawAdsNdjson(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manager = CSVDataManager(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _read_lines(self, platform, country_code):
+        path = self.manager._raw_ads_path(platform, country_code, "2025-07-29", ".ndjson")
+        return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+    def test_binance_payment_methods_written_as_list(self):
+        scraper = BinanceP2PScraper(session=requests.Session())
+        ad = scraper.standardize_ad(BINANCE_AD, "NG", "BUY", "2025-07-29T12:00:00Z")
+        # Binance pre-encodes the list for the CSV schema
+        self.assertIsInstance(ad["payment_methods"], str)
+
+        written = self.manager.save_raw_ads_ndjson([ad], "binance", "NG", "c1", "2025-07-29")
+
+        self.assertEqual(written, 1)
+        (record,) = self._read_lines("binance", "NG")
+        self.assertEqual(record["payment_methods"], ["Opay", "Bank Transfer"])
+        self.assertEqual(record["price"], 1530.5)
+        self.assertEqual(record["collection_id"], "c1")
+        # The caller's ad is left untouched
+        self.assertIsInstance(ad["payment_methods"], str)
+
+    def test_save_paths_can_write_ndjson(self):
+        ads = [{"platform": "okx", "country_code": "VE", "payment_methods": ["Zelle"]}]
+
+        written = self.manager.save_raw_ads_stream(
+            iter(ads), "okx", "VE", "c3", date_str="2025-07-29", fmt="ndjson"
+        )
+
+        self.assertEqual(written, 1)
+        (record,) = self._read_lines("okx", "VE")
+        self.assertEqual(record["collection_id"], "c3")
+        self.assertFalse(self.manager._raw_ads_path("okx", "VE", "2025-07-29").exists())
+
+        path = self.manager.save_raw_ads(ads, "okx", "NG", "c4", fmt="ndjson")
+        self.assertEqual(path, str(self.manager._raw_ads_path("okx", "NG", suffix=".ndjson")))
+        with open(path, "rb") as ndjson_file:
+            self.assertEqual(orjson.loads(ndjson_file.readline())["collection_id"], "c4")
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.manager.save_raw_ads_stream([{"platform": "okx"}], "okx", "VE", fmt="parquet")
+
+    def test_no_ads_writes_no_file(self):
+        self.assertEqual(self.manager.save_raw_ads_ndjson([], "okx", "VE", "c5", "2025-07-29"), 0)
+        self.assertFalse(self.manager._raw_ads_path("okx", "VE", "2025-07-29", ".ndjson").exists())
+
+    def test_list_payment_methods_pass_through(self):
+        ad = {"platform": "okx", "country_code": "VE", "payment_methods": ["Zelle"]}
+
+        self.manager.save_raw_ads_ndjson([ad], "okx", "VE", "c2", "2025-07-29")
+
+        (record,) = self._read_lines("okx", "VE")
+        self.assertEqual(record["payment_methods"], ["Zelle"])
+
+
+class TestSaveRawAdsStream(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manager = CSVDataManager(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_failure_mid_stream_leaves_no_file(self):
+        def ads():
+            yield {"platform": "binance", "country_code": "VE", "price": 36.4}
+            yield {"platform": "binance", "country_code": "VE", "price": 36.5}
+            raise requests.HTTPError("429 throttled")
+
+        with self.assertRaises(requests.HTTPError):
+            self.manager.save_raw_ads_stream(ads(), "binance", "VE", "c1", 1, "2025-07-29")
+
+        path = self.manager._raw_ads_path("binance", "VE", "2025-07-29")
+        self.assertEqual(list(path.parent.iterdir()), [])
+
+    def test_completed_stream_replaces_previous_file(self):
+        path = self.manager._raw_ads_path("binance", "VE", "2025-07-29")
+        path.write_text("stale\n")
+        ads = [{"platform": "binance", "country_code": "VE", "price": p} for p in (36.4, 36.5)]
+
+        written = self.manager.save_raw_ads_stream(ads, "binance", "VE", "c1", 1, "2025-07-29")
+
+        self.assertEqual(written, 2)
+        self.assertEqual(pd.read_csv(path)["price"].tolist(), [36.4, 36.5])
+        self.assertEqual(list(path.parent.iterdir()), [path])
+
+
+class TestLoadExchangeRates(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manager = CSVDataManager(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write_rates(self, rows):
+        headers = ["timestamp", "fiat_currency", "usd_rate", "source", "collection_id"]
+        path = self.manager.exchange_rates_dir / "rates_2025-07-29.csv"
+        pd.DataFrame(rows, columns=headers).to_csv(path, index=False)
+
+    def test_crisis_rows_for_past_dates_are_ignored(self):
+        self._write_rates(
+            [
+                ["2025-07-29T08:15:00.123456Z", "SDG", 600.0, "api_current", "c1"],
+                # Appended later by a crisis-period collection for 2021
+                ["2021-10-25T12:00:00Z", "SDG", 440.0, "api_composite", "c2"],
+                ["2021-10-25T12:00:00Z", "NGN", 410.0, "api_composite", "c2"],
+            ]
+        )
+
+        self.assertEqual(self.manager.load_exchange_rates("2025-07-29"), {"SDG": 600.0})
+
+    def test_latest_rate_of_the_day_wins(self):
+        self._write_rates(
+            [
+                ["2025-07-29T15:00:00Z", "SDG", 605.0, "api_current", "c3"],
+                ["2025-07-29T08:00:00Z", "SDG", 600.0, "api_current", "c1"],
+                ["2025-07-29T08:00:00Z", "NGN", 1530.0, "api_current", "c1"],
+            ]
+        )
+
+        rates = self.manager.load_exchange_rates("2025-07-29")
+        self.assertEqual(rates, {"SDG": 605.0, "NGN": 1530.0})
+
+    def test_missing_file_gives_no_rates(self):
+        self.assertEqual(self.manager.load_exchange_rates("2025-07-30"), {})
+
+
+class TestAddPremiums(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manager = CSVDataManager(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_matches_per_row_calculate_premium(self):
+        rates = {"SDG": 601.5, "NGN": 1530.25, "VES": 36.42, "ARS": 1185.0}
+        ads = pd.DataFrame(
+            {
+                "fiat": ["SDG", "SDG", "NGN", "NGN", "VES", "ARS", "ARS"],
+                "price": [2900.0, 601.5, 1620.75, 1498.1, 41.07, 1302.33, 1185.0],
+            }
+        )
+        collector = ExchangeRateCollector(session=requests.Session())
+
+        result = self.manager.add_premiums(ads.copy(), rates)
+
+        expected = [
+            collector.calculate_premium(price, rates[fiat], 1.0)
+            for fiat, price in zip(ads["fiat"], ads["price"])
+        ]
+        self.assertEqual(result["premium_pct"].tolist(), expected)
+
+    def test_missing_zero_and_negative_rates_give_nan(self):
+        rates = {"SDG": 0, "NGN": -1530.0, "VES": None, "ARS": "n/a"}
+        ads = pd.DataFrame(
+            {
+                "fiat": ["SDG", "NGN", "VES", "ARS", "AFN"],
+                "price": [2900.0, 1620.0, 41.0, 1302.0, 70.0],
+            }
+        )
+
+        result = self.manager.add_premiums(ads, rates)
+
+        for premium in result["premium_pct"]:
+            self.assertTrue(math.isnan(premium))
+
+
+if __name__ == "__main__":
+    unittest.main()
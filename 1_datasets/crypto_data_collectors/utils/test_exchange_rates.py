@@ -0,0 +1,183 @@
+"""
+Tests for exchange_rates.py
+"""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import orjson
+import requests
+
+from utils.exchange_rates import CachedExchangeRateCollector, ExchangeRateCollector
+
+# Fixings on Fri 25, Mon 28 and Wed 30 July 2025: a weekend and a holiday (Tue 29) missing
+FIXINGS = {
+    "2025-07-30": {"SDG": 603.0},
+    "2025-07-25": {"SDG": 600.0},
+    "2025-07-28": {"SDG": 601.0},
+}
+
+
+def day(date_str):
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+class RatesSession:
+    """Session stand-in answering every rates request with the same table."""
+
+    def __init__(self, rates):
+        self.rates = rates
+        self.urls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = orjson.dumps({"rates": self.rates})
+        return response
+
+
+class TestCachedExchangeRateCollector(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.session = RatesSession({"SDG": 601.0, "NGN": 1530.0})
+        self.collector = CachedExchangeRateCollector(
+            session=self.session, cache_path=Path(self._tmp.name) / "rates.sqlite", ttl_hours=1
+        )
+        self.collector._bucket.rate = 1000  # no pacing between scripted requests
+
+    def tearDown(self):
+        self.collector.cache._conn.close()
+        self.collector.series_cache._conn.close()
+        self._tmp.cleanup()
+
+    def test_historical_rates_are_fetched_once(self):
+        first = self.collector.get_historical_rates("2025-07-29")
+        second = self.collector.get_historical_rates("2025-07-29")
+
+        self.assertEqual(first, {"SDG": 601.0, "NGN": 1530.0})
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.session.urls), 1)
+
+    def test_historical_miss_for_another_date_fetches(self):
+        self.collector.get_historical_rates("2025-07-29")
+        self.collector.get_historical_rates("2025-07-30")
+
+        self.assertEqual(len(self.session.urls), 2)
+
+    def test_empty_response_is_not_cached(self):
+        self.session.rates = {}
+        self.assertEqual(self.collector.get_historical_rates("2025-07-29"), {})
+
+        self.session.rates = {"SDG": 601.0}
+        self.assertEqual(self.collector.get_historical_rates("2025-07-29"), {"SDG": 601.0})
+
+    def test_current_rates_reused_within_ttl_and_refetched_when_stale(self):
+        with mock.patch("utils.rate_cache.time.time", return_value=10_000.0):
+            self.collector.get_current_rates()
+            self.collector.get_current_rates()
+        self.assertEqual(len(self.session.urls), 1)
+
+        self.session.rates = {"SDG": 650.0}
+        with mock.patch("utils.rate_cache.time.time", return_value=10_000.0 + 3601):
+            self.assertEqual(self.collector.get_current_rates(), {"SDG": 650.0})
+        self.assertEqual(len(self.session.urls), 2)
+
+    def test_series_rows_do_not_stand_in_for_a_full_table(self):
+        self.session.rates = FIXINGS
+        self.collector.get_rates_timeseries("2025-07-25", "2025-07-28", ["SDG"])
+        self.assertEqual(len(self.session.urls), 1)
+
+        # The date's SDG-only range row must not be served as its complete table
+        self.session.rates = {"SDG": 600.0, "VES": 36.4, "NGN": 1530.0}
+        rates = self.collector.get_historical_rates("2025-07-25")
+
+        self.assertEqual(rates, {"SDG": 600.0, "VES": 36.4, "NGN": 1530.0})
+        self.assertEqual(len(self.session.urls), 2)
+
+    def test_cached_series_is_served_without_a_request(self):
+        self.session.rates = FIXINGS
+        first = self.collector.get_rates_timeseries("2025-07-25", "2025-07-28", ["SDG"])
+        again = self.collector.get_rates_timeseries("2025-07-25", "2025-07-28", ["SDG"])
+
+        self.assertEqual(again, first)
+        self.assertEqual(len(self.session.urls), 1)
+
+    def test_full_tables_cover_series_requests(self):
+        self.collector.get_historical_rates("2025-07-25")  # full table: SDG and NGN
+        self.session.urls.clear()
+
+        series = self.collector.get_rates_timeseries("2025-07-25", "2025-07-25", ["NGN"])
+
+        self.assertEqual(series["2025-07-25"]["NGN"], 1530.0)
+        self.assertEqual(self.session.urls, [])
+
+
+class TestFillCalendar(unittest.TestCase):
+    def test_weekend_and_holiday_carry_the_previous_fixing(self):
+        series = ExchangeRateCollector._fill_calendar(FIXINGS, day("2025-07-25"), day("2025-07-30"))
+
+        self.assertEqual(
+            {date: rates["SDG"] for date, rates in series.items()},
+            {
+                "2025-07-25": 600.0,
+                "2025-07-26": 600.0,  # Saturday
+                "2025-07-27": 600.0,  # Sunday
+                "2025-07-28": 601.0,
+                "2025-07-29": 601.0,  # holiday
+                "2025-07-30": 603.0,
+            },
+        )
+
+    def test_range_opening_on_a_weekend_uses_the_lookback_fixing(self):
+        series = ExchangeRateCollector._fill_calendar(FIXINGS, day("2025-07-26"), day("2025-07-27"))
+
+        self.assertEqual(list(series), ["2025-07-26", "2025-07-27"])
+        self.assertEqual(series["2025-07-26"], {"SDG": 600.0})
+
+    def test_days_before_the_first_fixing_are_omitted(self):
+        series = ExchangeRateCollector._fill_calendar(FIXINGS, day("2025-07-22"), day("2025-07-25"))
+
+        self.assertEqual(list(series), ["2025-07-25"])
+
+    def test_range_past_the_last_fixing_carries_it_forward(self):
+        series = ExchangeRateCollector._fill_calendar(FIXINGS, day("2025-07-30"), day("2025-08-02"))
+
+        self.assertEqual(len(series), 4)
+        self.assertTrue(all(rates == {"SDG": 603.0} for rates in series.values()))
+
+    def test_no_fixings_gives_empty_series(self):
+        self.assertEqual(
+            ExchangeRateCollector._fill_calendar({}, day("2025-07-25"), day("2025-07-30")), {}
+        )
+
+
+class TestRatesTimeseries(unittest.TestCase):
+    def setUp(self):
+        self.session = RatesSession(FIXINGS)
+        self.collector = ExchangeRateCollector(session=self.session)
+        self.collector._bucket.rate = 1000
+
+    def test_range_request_is_filled_to_every_calendar_day(self):
+        series = self.collector.get_rates_timeseries("2025-07-26", "2025-07-30", ["SDG"])
+
+        self.assertEqual(
+            list(series), ["2025-07-26", "2025-07-27", "2025-07-28", "2025-07-29", "2025-07-30"]
+        )
+        self.assertEqual(series["2025-07-29"], {"SDG": 601.0})
+        # Keyless: only the free source is asked, reaching back a week for a fixing to carry
+        self.assertEqual(self.session.urls, ["https://api.frankfurter.app/2025-07-19..2025-07-30"])
+
+    def test_no_source_data_gives_empty_series(self):
+        self.session.rates = {}
+
+        self.assertEqual(
+            self.collector.get_rates_timeseries("2025-07-26", "2025-07-30", ["SDG"]), {}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for progress_tracker.py
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.progress_tracker import CollectionProgress
+
+
+class TestCollectionProgress(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "state" / "progress.sqlite"
+        self.progress = CollectionProgress(self.db_path)
+
+    def tearDown(self):
+        self.progress._conn.close()
+        self._tmp.cleanup()
+
+    def test_resume_skips_only_successful_countries(self):
+        self.progress.mark("binance", "NG", "2025-07-29", 120)
+        self.progress.mark("binance", "SD", "2025-07-29", 0, "no_data")
+        self.progress.mark("binance", "VE", "2025-07-29", 0, "error")
+
+        done = self.progress.completed("binance", ["VE", "SD", "NG", "AR"], "2025-07-29")
+        self.assertEqual(done, ["NG"])
+
+    def test_completed_keeps_the_requested_order(self):
+        for country in ["AR", "NG", "VE"]:
+            self.progress.mark("binance", country, "2025-07-29", 10)
+
+        done = self.progress.completed("binance", ["VE", "AR", "NG"], "2025-07-29")
+        self.assertEqual(done, ["VE", "AR", "NG"])
+
+    def test_platforms_are_tracked_separately(self):
+        self.progress.mark("binance", "NG", "2025-07-29", 120)
+
+        self.assertEqual(self.progress.completed("okx", ["NG"], "2025-07-29"), [])
+
+    def test_remark_replaces_earlier_outcome(self):
+        self.progress.mark("binance", "NG", "2025-07-29", 0, "error")
+        self.progress.mark("binance", "NG", "2025-07-29", 80)
+
+        self.assertEqual(self.progress.completed("binance", ["NG"], "2025-07-29"), ["NG"])
+        rows = self.progress._conn.execute("SELECT status, n_ads FROM progress").fetchall()
+        self.assertEqual(rows, [("success", 80)])
+
+    def test_day_rollover_starts_a_fresh_day(self):
+        self.progress.mark("binance", "NG", "2025-07-29", 120)
+
+        self.assertEqual(self.progress.completed("binance", ["NG"], "2025-07-30"), [])
+        self.assertEqual(self.progress.completed("binance", ["NG"], "2025-07-29"), ["NG"])
+
+    def test_reopen_sees_marks_from_previous_run(self):
+        self.progress.mark("binance", "NG", "2025-07-29", 120)
+        self.progress._conn.close()
+
+        self.progress = CollectionProgress(self.db_path)
+        self.assertEqual(self.progress.completed("binance", ["NG"], "2025-07-29"), ["NG"])
+
+    def test_database_uses_wal_and_is_readable_while_open(self):
+        (mode,) = self.progress._conn.execute("PRAGMA journal_mode").fetchone()
+        self.assertEqual(mode, "wal")
+
+        self.progress.mark("binance", "NG", "2025-07-29", 120)
+        # Autocommitted marks are visible to another connection straight away
+        reader = sqlite3.connect(str(self.db_path))
+        try:
+            rows = reader.execute("SELECT platform, country, n_ads FROM progress").fetchall()
+        finally:
+            reader.close()
+        self.assertEqual(rows, [("binance", "NG", 120)])
+
+
+if __name__ == "__main__":
+    unittest.main()
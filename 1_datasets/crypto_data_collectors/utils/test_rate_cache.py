@@ -0,0 +1,111 @@
+"""
+Tests for rate_cache.py
+"""
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.rate_cache import ExchangeRateCache
+
+
+class TestExchangeRateCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "cache" / "exchange_rates.sqlite"
+        self.cache = ExchangeRateCache(self.db_path, ttl_seconds=3600)
+
+    def tearDown(self):
+        self.cache._conn.close()
+        self._tmp.cleanup()
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(self.cache.get("2025-07-29"))
+
+    def test_put_then_get(self):
+        self.cache.put("2025-07-29", {"SDG": 601.5, "NGN": 1530.0})
+
+        self.assertEqual(self.cache.get("2025-07-29"), {"SDG": 601.5, "NGN": 1530.0})
+        self.assertIsNone(self.cache.get("2025-07-28"))
+        self.assertIsNone(self.cache.get("2025-07-29", base_currency="EUR"))
+
+    def test_non_numeric_rates_are_skipped(self):
+        self.cache.put("2025-07-29", {"SDG": 601, "note": "n/a", "VES": None})
+
+        self.assertEqual(self.cache.get("2025-07-29"), {"SDG": 601.0})
+
+    def test_stale_entries_miss_only_when_max_age_is_given(self):
+        with mock.patch("utils.rate_cache.time.time", return_value=1000.0):
+            self.cache.put("2025-07-29", {"SDG": 601.0})
+
+        with mock.patch("utils.rate_cache.time.time", return_value=1000.0 + 3599):
+            self.assertEqual(self.cache.get("2025-07-29", max_age=3600), {"SDG": 601.0})
+        with mock.patch("utils.rate_cache.time.time", return_value=1000.0 + 3601):
+            self.assertIsNone(self.cache.get("2025-07-29", max_age=3600))
+            # Past dates are read without a max age and never expire
+            self.assertEqual(self.cache.get("2025-07-29"), {"SDG": 601.0})
+
+    def test_put_merges_currencies_and_refreshes_memo(self):
+        self.cache.put("2025-07-29", {"SDG": 601.0})
+        self.assertEqual(self.cache.get("2025-07-29"), {"SDG": 601.0})  # now memoized
+
+        self.cache.put("2025-07-29", {"NGN": 1530.0, "SDG": 602.0})
+
+        self.assertEqual(self.cache.get("2025-07-29"), {"SDG": 602.0, "NGN": 1530.0})
+
+    def test_preload_loads_a_range_in_one_query(self):
+        for day, rate in [("2025-07-27", 600.0), ("2025-07-28", 601.0), ("2025-07-31", 603.0)]:
+            self.cache.put(day, {"SDG": rate})
+
+        self.assertEqual(self.cache.preload("2025-07-28", "2025-07-30"), 1)
+        self.assertIn(("USD", "2025-07-28"), self.cache._memo)
+        self.assertNotIn(("USD", "2025-07-27"), self.cache._memo)
+
+    def test_entries_persist_across_instances(self):
+        self.cache.put("2025-07-29", {"SDG": 601.0})
+
+        reopened = ExchangeRateCache(self.db_path)
+        try:
+            self.assertEqual(reopened.get("2025-07-29"), {"SDG": 601.0})
+        finally:
+            reopened._conn.close()
+
+    def test_tables_in_one_file_are_separate_stores(self):
+        series = ExchangeRateCache(self.db_path, table="series_rates")
+        try:
+            series.put("2025-07-29", {"SDG": 601.0})
+
+            self.assertIsNone(self.cache.get("2025-07-29"))
+            self.assertEqual(series.get("2025-07-29"), {"SDG": 601.0})
+        finally:
+            series._conn.close()
+
+    def test_concurrent_threads_share_one_connection(self):
+        errors = []
+
+        def worker(i):
+            try:
+                day = f"2025-07-{i + 1:02d}"
+                for _ in range(20):
+                    self.cache.put(day, {"SDG": 600.0 + i})
+                    self.assertEqual(self.cache.get(day), {"SDG": 600.0 + i})
+            except Exception as e:  # surfaced in the main thread below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with sqlite3.connect(str(self.db_path)) as reader:
+            (count,) = reader.execute("SELECT COUNT(*) FROM rates").fetchone()
+        self.assertEqual(count, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
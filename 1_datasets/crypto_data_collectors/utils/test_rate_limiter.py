@@ -0,0 +1,78 @@
+"""
+Tests for rate_limiter.py
+"""
+
+import threading
+import time
+import unittest
+
+from utils.rate_limiter import TokenBucket
+
+# Scheduling slack allowed on top of the expected wait
+TOLERANCE = 0.05
+
+
+def timed(func, *args):
+    """Seconds taken by one call."""
+    start = time.monotonic()
+    func(*args)
+    return time.monotonic() - start
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_up_to_capacity_does_not_block(self):
+        bucket = TokenBucket(rate=1, capacity=5)
+        elapsed = sum(timed(bucket.acquire) for _ in range(5))
+        self.assertLess(elapsed, TOLERANCE)
+
+    def test_acquire_blocks_once_budget_is_spent(self):
+        bucket = TokenBucket(rate=10, capacity=1)
+        bucket.acquire()
+        # The next token arrives after 1 / rate seconds
+        elapsed = timed(bucket.acquire)
+        self.assertGreaterEqual(elapsed, 0.1 - 0.01)
+        self.assertLess(elapsed, 0.1 + TOLERANCE)
+
+    def test_acquire_costs_several_tokens(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+        bucket.acquire(2)
+        elapsed = timed(bucket.acquire, 3)
+        self.assertGreaterEqual(elapsed, 0.15 - 0.01)
+        self.assertLess(elapsed, 0.15 + TOLERANCE)
+
+    def test_refill_is_capped_at_capacity(self):
+        bucket = TokenBucket(rate=100, capacity=2)
+        time.sleep(0.05)  # would refill 5 tokens without the cap
+        bucket.acquire(2)
+        elapsed = timed(bucket.acquire)
+        self.assertGreaterEqual(elapsed, 0.01 - 0.005)
+
+    def test_pause_holds_back_a_full_bucket(self):
+        bucket = TokenBucket(rate=10, capacity=5)
+        bucket.pause(0.2)
+        # The pause drains the burst: the next token is due after the pause
+        # plus one refill interval
+        elapsed = timed(bucket.acquire)
+        self.assertGreaterEqual(elapsed, 0.3 - 0.01)
+        self.assertLess(elapsed, 0.3 + TOLERANCE)
+
+    def test_pause_applies_to_every_thread(self):
+        bucket = TokenBucket(rate=100, capacity=10)
+        bucket.pause(0.2)
+        waits = []
+
+        def worker():
+            waits.append(timed(bucket.acquire))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(waits), 4)
+        self.assertGreaterEqual(min(waits), 0.2 - 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for response_cache.py
+"""
+
+import hashlib
+import tempfile
+import unittest
+from unittest import mock
+
+from utils.response_cache import ResponseCache
+
+
+class TestMakeKey(unittest.TestCase):
+    def test_key_is_md5_of_url_and_sorted_params(self):
+        key = ResponseCache.make_key("https://api.example.com/price", {"b": 2, "a": "x"})
+        expected = hashlib.md5(b"https://api.example.com/price?a=x&b=2").hexdigest()
+        self.assertEqual(key, expected)
+
+    def test_parameter_order_does_not_matter(self):
+        url = "https://api.example.com/price"
+        self.assertEqual(
+            ResponseCache.make_key(url, {"fsyms": "BTC", "tsyms": "USD"}),
+            ResponseCache.make_key(url, {"tsyms": "USD", "fsyms": "BTC"}),
+        )
+
+    def test_different_params_give_different_keys(self):
+        url = "https://api.example.com/price"
+        self.assertNotEqual(
+            ResponseCache.make_key(url, {"fsyms": "BTC"}),
+            ResponseCache.make_key(url, {"fsyms": "ETH"}),
+        )
+        self.assertEqual(ResponseCache.make_key(url), ResponseCache.make_key(url, {}))
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self._tmp.name, "coingecko")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(self.cache.get("absent"))
+
+    def test_put_then_get(self):
+        self.cache.put("k", {"bitcoin": {"usd": 64000.5}})
+        self.assertEqual(self.cache.get("k"), {"bitcoin": {"usd": 64000.5}})
+
+    def test_entries_persist_across_instances(self):
+        self.cache.put("k", [1, 2, 3])
+
+        reopened = ResponseCache(self._tmp.name, "coingecko")
+        self.assertEqual(reopened.get("k"), [1, 2, 3])
+        # Namespaces do not share entries
+        self.assertIsNone(ResponseCache(self._tmp.name, "cryptocompare").get("k"))
+
+    def test_ttl_expiry(self):
+        with mock.patch("utils.response_cache.time.time", return_value=1000.0):
+            self.cache.put("k", "v")
+
+        with mock.patch("utils.response_cache.time.time", return_value=1059.0):
+            self.assertEqual(self.cache.get("k", ttl=60), "v")
+        with mock.patch("utils.response_cache.time.time", return_value=1061.0):
+            self.assertIsNone(self.cache.get("k", ttl=60))
+            # No TTL accepts any age
+            self.assertEqual(self.cache.get("k"), "v")
+
+    def test_ttl_uses_stored_time_after_reopen(self):
+        with mock.patch("utils.response_cache.time.time", return_value=1000.0):
+            self.cache.put("k", "v")
+
+        reopened = ResponseCache(self._tmp.name, "coingecko")
+        with mock.patch("utils.response_cache.time.time", return_value=2000.0):
+            self.assertIsNone(reopened.get("k", ttl=60))
+
+    def test_memo_serves_repeat_lookups_without_disk(self):
+        self.cache.put("k", "v")
+        self.cache._path("k").unlink()
+
+        self.assertEqual(self.cache.get("k"), "v")
+
+    def test_put_replaces_entry(self):
+        self.cache.put("k", "old")
+        self.cache.put("k", "new")
+
+        self.assertEqual(self.cache.get("k"), "new")
+        self.assertEqual(ResponseCache(self._tmp.name, "coingecko").get("k"), "new")
+
+    def test_corrupt_file_is_a_miss(self):
+        self.cache._path("k").write_bytes(b"{not json")
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_no_temp_files_left_behind(self):
+        self.cache.put("k", "v")
+        self.assertEqual([path.name for path in self.cache.cache_dir.iterdir()], ["k.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
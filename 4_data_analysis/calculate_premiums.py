@@ -8,6 +8,7 @@ to demonstrate the immediate impact we can measure.
 Author: Clement MUGISHA
 """
 
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -20,6 +21,11 @@ ExchangeRateCollector = None
 try:
     # Import data management utilities directly from files
     project_root = Path(__file__).parent.parent
+    collectors_root = project_root / "1_datasets" / "crypto_data_collectors"
+    # Collector modules import each other as `utils.*`, so their root must be importable
+    if str(collectors_root) not in sys.path:
+        sys.path.insert(0, str(collectors_root))
+
     csv_manager_path = (
         project_root / "1_datasets" / "crypto_data_collectors" / "utils" / "csv_data_manager.py"
     )
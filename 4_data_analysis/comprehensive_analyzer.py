@@ -19,6 +19,7 @@ Author: Clement MUGISHA
 """
 
 import json
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -44,6 +45,11 @@ ExchangeRateCollector = None
 try:
     # Import CSV data manager from the actual file location
     project_root = Path(__file__).parent.parent
+    collectors_root = project_root / "1_datasets" / "crypto_data_collectors"
+    # Collector modules import each other as `utils.*`, so their root must be importable
+    if str(collectors_root) not in sys.path:
+        sys.path.insert(0, str(collectors_root))
+
     csv_manager_path = (
         project_root / "1_datasets" / "crypto_data_collectors" / "utils" / "csv_data_manager.py"
     )
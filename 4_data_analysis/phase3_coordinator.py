@@ -10,6 +10,7 @@ has a clear purpose in answering our research questions.
 """
 
 import os
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -317,6 +318,11 @@ class Phase3DataCoordinator:
             # Import our proven collectors using absolute paths
             import importlib.util
 
+            # Collector modules import each other as `utils.*`, so their root must be importable
+            collectors_root = str(self.data_dir / "crypto_data_collectors")
+            if collectors_root not in sys.path:
+                sys.path.insert(0, collectors_root)
+
             # Load BinanceP2PScraper
             scraper_path = os.path.join(
                 os.path.dirname(os.path.dirname(__file__)),